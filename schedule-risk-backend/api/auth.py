@@ -84,7 +84,7 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
         user = create_user(db, user_data.email, user_data.password, user_data.full_name)
         
         # Create access token
-        access_token = create_access_token(data={"sub": user.id})
+        access_token = create_access_token(data={"sub": str(user.id)})
         
         return {
             "access_token": access_token,
@@ -164,16 +164,15 @@ def test_token(
     logger = logging.getLogger(__name__)
     
     logger.info("=== TOKEN DEBUG ===")
-    logger.info(f"Credentials object: {credentials}")
-    logger.info(f"Credentials type: {type(credentials)}")
     
     if credentials is None:
         return {"error": "No credentials provided", "credentials": None}
     
     token = credentials.credentials
-    logger.info(f"Token extracted: {token[:50]}...")
+    from core.auth import decode_access_token, token_preview
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Token extracted: %s", token_preview(token))
     
-    from core.auth import decode_access_token
     payload = decode_access_token(token)
     
     if payload is None:
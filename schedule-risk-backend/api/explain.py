@@ -59,11 +59,11 @@ async def explain_activity_risk(
     # Check for anomalies
     anomalies = []
     try:
-        from core.anomalies import detect_zombie_tasks, detect_black_holes
-        from core.models import PROJECTS
-        PROJECTS[project_id] = activities
-        zombies = detect_zombie_tasks(project_id)
-        black_holes = detect_black_holes(project_id)
+        from core.anomalies import detect_anomalies
+        # Single pass shares parsed dates between zombie and black-hole detection
+        detected = detect_anomalies(project_id, activities=activities)
+        zombies = detected["zombie_tasks"]
+        black_holes = detected["black_holes"]
         if any(z["activity_id"] == activity_id for z in zombies):
             anomalies.append("zombie_task")
         # Check if activity's resource is in black holes
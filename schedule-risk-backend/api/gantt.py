@@ -11,9 +11,9 @@ from core.db_service import get_activities
 from core.project_auth import verify_project_ownership
 from core.auth_dependencies import get_current_user
 from core.risk_pipeline import compute_project_risks
+from core.anomalies import to_timestamp
 from api.auth import UserResponse
 from datetime import datetime
-import pandas as pd
 
 router = APIRouter()
 
@@ -25,7 +25,7 @@ def parse_date(date_str):
     try:
         if isinstance(date_str, str) and date_str.strip() == "":
             return None
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+        return to_timestamp(date_str)
     except:
         return None
 
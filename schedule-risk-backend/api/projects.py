@@ -6,7 +6,6 @@ from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query,
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
-import uuid
 import tempfile
 import os
 from core.csv_connector import load_activities_from_csv
@@ -14,6 +13,7 @@ from core.connectors import ConnectorRegistry, ConnectorConfig, get_connector
 from core.database import get_db
 from core.db_service import save_activities, get_activities, project_exists, log_event_db, get_audit_logs, get_all_projects, find_project_by_hash, delete_project, delete_projects
 from core.file_utils import compute_file_hash
+from core.ids import new_project_id
 from core.auth_dependencies import get_current_user
 from api.auth import UserResponse
 
@@ -82,7 +82,7 @@ async def upload_project(
             )
         else:
             # New file - create new project
-            project_id = str(uuid.uuid4())
+            project_id = new_project_id()
             is_duplicate = False
         
         # Load activities from CSV
@@ -226,9 +226,9 @@ def _compute_project_analytics_background(project_id: str, activity_count: int):
             if not activities:
                 return
             
-            # Compute data hash once for all cache saves
-            from core.logic_version import compute_data_hash
-            data_hash = compute_data_hash(activities) if activities else None
+            # Look up data hash once for all cache saves (same value the cache getters compare against)
+            from core.db_service import get_project_data_hash
+            data_hash = get_project_data_hash(db, project_id, activities)
             
             # 1. Compute and cache forecast
             try:
@@ -516,19 +516,21 @@ async def integrate_project(
                 detail=f"Invalid connector type: {str(e)}"
             )
         
-        # Test connection first
-        test_result = connector.test_connection()
-        if not test_result.get("success", False):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Connection test failed: {test_result.get('error', 'Unknown error')}"
-            )
-        
-        # Generate project ID
-        project_id = str(uuid.uuid4())
-        
-        # Load activities using connector
-        result = connector.load_activities(project_id)
+        # The connector is closed (releasing any HTTP client) once activities are loaded
+        with connector:
+            # Test connection first
+            test_result = connector.test_connection()
+            if not test_result.get("success", False):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Connection test failed: {test_result.get('error', 'Unknown error')}"
+                )
+            
+            # Generate project ID
+            project_id = new_project_id()
+            
+            # Load activities using connector
+            result = connector.load_activities(project_id)
         
         if not result.success and len(result.activities) == 0:
             raise HTTPException(
@@ -640,15 +642,15 @@ async def test_connector(
             max_activities=request.max_activities
         )
         
-        connector = get_connector(config)
-        test_result = connector.test_connection()
-        
-        return {
-            "success": test_result.get("success", False),
-            "connector_type": request.connector_type,
-            "test_result": test_result,
-            "connector_info": connector.get_connector_info()
-        }
+        with get_connector(config) as connector:
+            test_result = connector.test_connection()
+            
+            return {
+                "success": test_result.get("success", False),
+                "connector_type": request.connector_type,
+                "test_result": test_result,
+                "connector_info": connector.get_connector_info()
+            }
     except Exception as e:
         return {
             "success": False,
@@ -2,13 +2,15 @@
 Risk analysis API endpoints
 """
 
+import asyncio
 import time
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response
 from sqlalchemy.orm import Session
 from core.risk_pipeline import compute_project_risks
 from core.anomalies import detect_anomalies
 from core.database import get_db
-from core.db_service import log_event_db, get_activities
+from core.db_service import log_event_db, log_events_db_batch, get_activities
 from core.project_auth import verify_project_ownership
 from core.auth_dependencies import get_current_user
 from api.auth import UserResponse
@@ -17,8 +19,36 @@ from core.models import PROJECTS
 router = APIRouter()
 
 
+def _orjson_response(content) -> Response:
+    """
+    Serialize a large response payload straight to JSON bytes with orjson.
+    Returning a Response skips FastAPI's jsonable_encoder pass over the nested risk dicts.
+    """
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json"
+    )
+
+
+# Explanation fragments, in display order, keyed by their bit in the risk flag mask
+_EXPLANATION_PARTS = (
+    "{delay}-day delay (relative to baseline)",  # bit 0: delay
+    "critical path",                             # bit 1: on critical path
+    "low float",                                 # bit 2: float <= 2 days
+    "resource overload",                         # bit 3: resource overbooked
+    "{slip}% progress slip",                     # bit 4: progress slip > 20%
+)
+
+# All 2^5 joined explanation templates, built once at import
+_EXPLANATION_TEMPLATES = tuple(
+    " + ".join(part for bit, part in enumerate(_EXPLANATION_PARTS) if mask >> bit & 1)
+    or "moderate risk factors"
+    for mask in range(1 << len(_EXPLANATION_PARTS))
+)
+
+
 @router.get("/projects/{project_id}/risks/top")
-def get_risks(
+async def get_risks(
     project_id: str, 
     limit: int = 10,
     include_explanations: bool = True,
@@ -32,27 +62,28 @@ def get_risks(
     Returns format: "Activity A-142 at high risk (score 78): 9-day delay + critical path + low float."
     
     Uses cache if available to provide instant responses. Set force_recompute=true to bypass cache.
+    
+    Blocking DB and CPU work runs in worker threads via asyncio.to_thread so the
+    event loop stays free. Steps sharing the request's Session are awaited one at a
+    time, since a Session must not be used from two threads concurrently.
     """
     start_time = time.time()
     
-    verify_project_ownership(db, project_id, current_user)
+    await asyncio.to_thread(verify_project_ownership, db, project_id, current_user)
     auth_time = time.time()
     
-    # Get activities once and reuse (avoid multiple DB queries)
-    activities = get_activities(db, project_id)
-    activity_count = len(activities) if activities else 0
-    db_time = time.time()
-    
     # Always use today's date (date selection feature removed)
     reference_date = None
     
     # Check cache first (unless force_recompute is True)
     # Note: Cache key should include reference_date, but for backward compatibility,
     # we'll use existing cache if reference_date is None (today mode)
+    # The activity count is validated inside the cache lookup, so activities are
+    # only loaded here on a cache miss.
     cached_risks_data = None
     if not force_recompute and reference_date is None:
         from core.cache_service import get_risks_cache
-        cached_risks_data = get_risks_cache(db, project_id, activity_count)
+        cached_risks_data = await asyncio.to_thread(get_risks_cache, db, project_id)
     
     if cached_risks_data:
         # Use cached risks - they're already enhanced with explanations
@@ -67,41 +98,47 @@ def get_risks(
         total_time = cache_time - start_time
         print(f"[CACHE] Risks served from cache in {total_time:.3f}s")
         
-        return {
+        return _orjson_response({
             "total_risks": total_risks,
             "top_risks": enhanced_risks
-        }
+        })
     
-    # Cache miss or force recompute - compute risks with reference_date
-    risks = compute_project_risks(project_id, db=db, activities=activities, reference_date=reference_date)
+    # Cache miss or force recompute - get activities once and reuse (avoid multiple DB queries)
+    activities = await asyncio.to_thread(get_activities, db, project_id)
+    activity_count = len(activities) if activities else 0
+    db_time = time.time()
+    
+    risks = await asyncio.to_thread(
+        compute_project_risks, project_id, db=db, activities=activities, reference_date=reference_date
+    )
     risks_time = time.time()
     
     top_risks = risks[:limit]
     
     # Enhance risks with explanations
-    enhanced_risks = _enhance_risks_with_explanations(top_risks, activities, include_explanations)
+    enhanced_risks = await asyncio.to_thread(
+        _enhance_risks_with_explanations, top_risks, activities, include_explanations
+    )
     
     # Save to cache for future requests (save all risks, not just top)
     from core.cache_service import save_risks_cache
-    save_risks_cache(db, project_id, {
+    await asyncio.to_thread(save_risks_cache, db, project_id, {
         "total_risks": len(risks),
         "top_risks": enhanced_risks  # Save enhanced risks for faster retrieval
     }, activity_count)
     cache_save_time = time.time()
     
-    # Log the risk scan event to database
+    # Risk scan event plus one event per scheduled notification, flushed in a single INSERT below
     top_risk_score = enhanced_risks[0]["risk_score"] if enhanced_risks else None
-    log_event_db(
-        db,
-        project_id,
-        "risk_scan",
-        {
+    events = [{
+        "event": "risk_scan",
+        "details": {
             "risk_count": len(risks),
             "top_risk_score": top_risk_score,
             "top_risks_returned": len(enhanced_risks),
             "from_cache": False
         }
-    )
+    }]
     
     # Priority 1: Send email notifications for high-risk activities (non-blocking)
     # Use background tasks to avoid blocking the response
@@ -140,19 +177,30 @@ def get_risks(
                     project_id=project_id,
                     event_data=event_data
                 )
+                
+                events.append({
+                    "event": "notification_scheduled",
+                    "details": {
+                        "activity_id": risk["activity_id"],
+                        "risk_score": risk["risk_score"]
+                    }
+                })
     except Exception as e:
         print(f"[Notification] Failed to schedule notifications: {e}")
         # Don't fail the request if notification scheduling fails
     
+    # Log the risk scan and notification events to database
+    await asyncio.to_thread(log_events_db_batch, db, project_id, events)
+    
     total_time = time.time() - start_time
     # Log performance metrics (can be removed in production if not needed)
     if total_time > 1.0:  # Only log if slow
         print(f"[PERF] Risks endpoint timing - Total: {total_time:.2f}s, Auth: {auth_time-start_time:.2f}s, DB: {db_time-auth_time:.2f}s, Risks: {risks_time-db_time:.2f}s, Enhance: {cache_save_time-risks_time:.2f}s, Cache: {time.time()-cache_save_time:.2f}s")
     
-    return {
+    return _orjson_response({
         "total_risks": len(risks),
         "top_risks": enhanced_risks
-    }
+    })
 
 
 def _enhance_risks_with_explanations(top_risks, activities, include_explanations):
@@ -180,32 +228,29 @@ def _enhance_risks_with_explanations(top_risks, activities, include_explanations
         else:
             risk_level = "Low"
         
-        # Build explanation components
-        explanation_parts = []
-        
-        delay_days = features.get("delay_baseline_days", 0)
-        if delay_days > 0:
-            explanation_parts.append(f"{int(delay_days)}-day delay (relative to baseline)")
-        
-        if features.get("is_on_critical_path", False):
-            explanation_parts.append("critical path")
-        
-        float_days = features.get("float_days", 999)
-        if float_days <= 2:
-            explanation_parts.append("low float")
+        # Read each feature once with a locally bound getter (reused for key_metrics below)
+        get = features.get
+        delay_days = get("delay_baseline_days", 0)
+        on_critical_path = get("is_on_critical_path", False)
+        float_days = get("float_days", 999)
+        resource_overbooked = get("resource_overbooked", False)
+        progress_slip = get("progress_slip", 0)
         
-        if features.get("resource_overbooked", False):
-            explanation_parts.append("resource overload")
-        
-        if features.get("progress_slip", 0) > 0.2:
-            slip_pct = int(features["progress_slip"] * 100)
-            explanation_parts.append(f"{slip_pct}% progress slip")
+        # Select the precomputed explanation template for the risk flags that fired
+        flag_bits = (
+            (delay_days > 0)
+            | bool(on_critical_path) << 1
+            | (float_days <= 2) << 2
+            | bool(resource_overbooked) << 3
+            | (progress_slip > 0.2) << 4
+        )
+        reasons = _EXPLANATION_TEMPLATES[flag_bits].format(
+            delay=int(delay_days),
+            slip=int(progress_slip * 100)
+        )
         
         # Build the explanation string (matching problem statement format)
-        if explanation_parts:
-            explanation = f"Activity {activity_id} at {risk_level} risk (score {int(score)}): {' + '.join(explanation_parts)}."
-        else:
-            explanation = f"Activity {activity_id} at {risk_level} risk (score {int(score)}): moderate risk factors."
+        explanation = f"Activity {activity_id} at {risk_level} risk (score {int(score)}): {reasons}."
         
         # Get detailed explanation if requested
         detailed_explanation = None
@@ -255,14 +300,14 @@ def _enhance_risks_with_explanations(top_risks, activities, include_explanations
             "key_metrics": {
                 "delay_days": int(delay_days),
                 "float_days": round(float_days, 1),
-                "on_critical_path": features.get("is_on_critical_path", False),
-                "resource_overbooked": features.get("resource_overbooked", False),
-                "progress_slip_pct": round(features.get("progress_slip", 0) * 100, 1),
+                "on_critical_path": on_critical_path,
+                "resource_overbooked": resource_overbooked,
+                "progress_slip_pct": round(progress_slip * 100, 1),
                 "baseline_finish": activity.baseline_finish if hasattr(activity, 'baseline_finish') else None,
                 "planned_finish": activity.planned_finish if hasattr(activity, 'planned_finish') else None
             },
             "percent_complete": risk.get("percent_complete", 0),
-            "on_critical_path": features.get("is_on_critical_path", False)
+            "on_critical_path": on_critical_path
         }
         
         if detailed_explanation:
@@ -274,7 +319,7 @@ def _enhance_risks_with_explanations(top_risks, activities, include_explanations
 
 
 @router.get("/projects/{project_id}/anomalies")
-def get_anomalies(
+async def get_anomalies(
     project_id: str,
     db: Session = Depends(get_db),
     current_user: UserResponse = Depends(get_current_user),
@@ -284,14 +329,15 @@ def get_anomalies(
     Get anomalies (zombie tasks and resource black holes) for a project - requires authentication and ownership
     
     Uses cache if available to provide instant responses. Set force_recompute=true to bypass cache.
+    Blocking work runs off the event loop via asyncio.to_thread (see get_risks).
     """
     start_time = time.time()
     
-    verify_project_ownership(db, project_id, current_user)
+    await asyncio.to_thread(verify_project_ownership, db, project_id, current_user)
     auth_time = time.time()
     
     # Load activities from database
-    activities = get_activities(db, project_id)
+    activities = await asyncio.to_thread(get_activities, db, project_id)
     activity_count = len(activities) if activities else 0
     db_time = time.time()
     
@@ -306,7 +352,7 @@ def get_anomalies(
     # we'll use existing cache if reference_date is None (today mode)
     if not force_recompute and reference_date is None:
         from core.cache_service import get_anomalies_cache
-        cached_anomalies = get_anomalies_cache(db, project_id, activity_count)
+        cached_anomalies = await asyncio.to_thread(get_anomalies_cache, db, project_id, activity_count)
         if cached_anomalies:
             cache_time = time.time()
             total_time = cache_time - start_time
@@ -316,37 +362,22 @@ def get_anomalies(
     # Cache miss or force recompute - compute anomalies with reference_date
     try:
         # Pass activities directly to avoid PROJECTS dict dependency
-        anomalies = detect_anomalies(project_id, activities=activities, reference_date=reference_date)
+        anomalies = await asyncio.to_thread(
+            detect_anomalies, project_id, activities=activities, reference_date=reference_date
+        )
         detection_time = time.time()
         
         # Priority 5: Add contextual explanations to zombie tasks
-        try:
-            from core.anomaly_explanation_service import get_anomaly_explanation_service
-            explanation_service = get_anomaly_explanation_service()
-            
-            # Enhance zombie tasks with business context
-            enhanced_zombies = []
-            for zombie in anomalies.get("zombie_tasks", []):
-                enhanced = explanation_service.explain_zombie_task(
-                    zombie,
-                    activities,
-                    project_id
-                )
-                enhanced_zombies.append(enhanced)
-            
-            if enhanced_zombies:
-                anomalies["zombie_tasks"] = enhanced_zombies
-        except Exception as e:
-            print(f"[Anomaly] Failed to generate explanations: {e}")
-            # Don't fail the request if explanation fails
+        await asyncio.to_thread(_explain_zombie_tasks, anomalies, activities, project_id)
         
         # Save to cache for future requests
         from core.cache_service import save_anomalies_cache
-        save_anomalies_cache(db, project_id, anomalies, activity_count)
+        await asyncio.to_thread(save_anomalies_cache, db, project_id, anomalies, activity_count)
         cache_save_time = time.time()
         
         # Log the anomaly detection event
-        log_event_db(
+        await asyncio.to_thread(
+            log_event_db,
             db,
             project_id,
             "anomaly_detection",
@@ -368,3 +399,22 @@ def get_anomalies(
         # Clean up PROJECTS dict if needed (optional, for memory management)
         pass
 
+
+def _explain_zombie_tasks(anomalies, activities, project_id):
+    """Helper function to add contextual business explanations to zombie tasks (in place)"""
+    try:
+        from core.anomaly_explanation_service import get_anomaly_explanation_service
+        explanation_service = get_anomaly_explanation_service()
+        
+        # Enhance zombie tasks with business context
+        enhanced_zombies = explanation_service.explain_zombie_tasks(
+            anomalies.get("zombie_tasks", []),
+            activities,
+            project_id
+        )
+        
+        if enhanced_zombies:
+            anomalies["zombie_tasks"] = enhanced_zombies
+    except Exception as e:
+        print(f"[Anomaly] Failed to generate explanations: {e}")
+        # Don't fail the request if explanation fails
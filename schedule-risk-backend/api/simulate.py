@@ -12,9 +12,13 @@ from core.db_service import get_activities, log_event_db
 from core.project_auth import verify_project_ownership
 from core.auth_dependencies import get_current_user
 from api.auth import UserResponse
+from core.risk_model import RuleBasedRiskModel
 
 router = APIRouter()
 
+# Rule-based model is stateless - share one instance across requests
+_MODEL = RuleBasedRiskModel()
+
 
 class MitigationRequest(BaseModel):
     activity_id: str
@@ -70,9 +74,8 @@ def simulate_mitigation_action(
     )
     
     # Also calculate new risk score after mitigation
-    from core.risk_pipeline import compute_project_risks
-    from core.features import compute_features
-    from core.risk_model import RuleBasedRiskModel
+    from core.features import compute_features, lazy_float_map
+    from core.digital_twin import get_or_build_twin
     
     # Find the activity
     activity = None
@@ -85,10 +88,14 @@ def simulate_mitigation_action(
     new_risk_score = None
     
     if activity:
+        # Build the project context once - original and modified feature computations
+        # both score against the same (unmodified) project graph and float map
+        twin = get_or_build_twin(project_id, activities)
+        float_map = lazy_float_map(activities, twin.graph)
+        
         # Calculate original risk score
-        features = compute_features(activity, project_id, activities=activities)
-        model = RuleBasedRiskModel()
-        original_risk_score = model.predict(features)
+        features = compute_features(activity, project_id, activities=activities, twin=twin, float_map=float_map)
+        original_risk_score = _MODEL.predict(features)
         
         # Create modified activity for new risk score
         from core.models import Activity as ActivityModel
@@ -110,8 +117,8 @@ def simulate_mitigation_action(
         
         # Recalculate features and risk score
         modified_activity = ActivityModel(**activity_dict)
-        new_features = compute_features(modified_activity, project_id, activities=activities)
-        new_risk_score = model.predict(new_features)
+        new_features = compute_features(modified_activity, project_id, activities=activities, twin=twin, float_map=float_map)
+        new_risk_score = _MODEL.predict(new_features)
     
     # Enhance result with risk score changes
     result["risk_score_impact"] = {
@@ -4,6 +4,8 @@ SOLID compliant user preference management
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
@@ -11,9 +13,15 @@ from core.database import get_db
 from core.auth_dependencies import get_current_user
 from api.auth import UserResponse
 from infrastructure.database.models import UserPreferencesModel
+from core.config import USER_PREFERENCES_CACHE_TTL
+from core.ttl_cache import TTLCache
 
 router = APIRouter()
 
+# Read-through cache of preferences responses keyed by user_id
+# Preferences change rarely; updates through this API refresh the entry immediately
+_preferences_cache = TTLCache(maxsize=10_000, ttl=USER_PREFERENCES_CACHE_TTL)
+
 
 class UserPreferencesRequest(BaseModel):
     """Request model for updating user preferences"""
@@ -43,19 +51,26 @@ class UserPreferencesResponse(BaseModel):
     show_resource_summary: bool
 
 
+# Table columns backing UserPreferencesResponse - selected/returned instead of whole rows
+_RESPONSE_COLUMNS = tuple(
+    UserPreferencesModel.__table__.c[name] for name in UserPreferencesResponse.model_fields
+)
+
+
 @router.get("/user/preferences", response_model=UserPreferencesResponse)
 def get_user_preferences(
     db: Session = Depends(get_db),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """Get user preferences"""
-    prefs = db.query(UserPreferencesModel).filter(
-        UserPreferencesModel.user_id == current_user.id
-    ).first()
-    
-    if not prefs:
-        # Create default preferences
-        prefs = UserPreferencesModel(
+    cached = _preferences_cache.get(current_user.id)
+    if cached is not None:
+        return cached
+    
+    # Create default preferences if missing - a single statement covers both cases
+    # and concurrent first reads cannot race (user_id is unique)
+    prefs = db.execute(
+        pg_insert(UserPreferencesModel).values(
             user_id=current_user.id,
             risk_threshold_high=70.0,
             risk_threshold_medium=40.0,
@@ -67,12 +82,20 @@ def get_user_preferences(
             show_p80_first=True,
             show_anomalies_section=True,
             show_resource_summary=False
-        )
-        db.add(prefs)
+        ).on_conflict_do_nothing(
+            index_elements=[UserPreferencesModel.user_id]
+        ).returning(*_RESPONSE_COLUMNS)
+    ).first()
+    
+    if prefs is not None:
         db.commit()
-        db.refresh(prefs)
+    else:
+        # Row already existed - select only the columns the response needs
+        prefs = db.execute(
+            select(*_RESPONSE_COLUMNS).where(UserPreferencesModel.user_id == current_user.id)
+        ).one()
     
-    return UserPreferencesResponse(
+    response = UserPreferencesResponse(
         risk_threshold_high=prefs.risk_threshold_high,
         risk_threshold_medium=prefs.risk_threshold_medium,
         risk_threshold_low=prefs.risk_threshold_low,
@@ -84,6 +107,8 @@ def get_user_preferences(
         show_anomalies_section=prefs.show_anomalies_section,
         show_resource_summary=prefs.show_resource_summary
     )
+    _preferences_cache.set(current_user.id, response)
+    return response
 
 
 @router.put("/user/preferences", response_model=UserPreferencesResponse)
@@ -93,67 +118,56 @@ def update_user_preferences(
     current_user: UserResponse = Depends(get_current_user)
 ):
     """Update user preferences"""
-    prefs = db.query(UserPreferencesModel).filter(
+    # Only provided fields are updated
+    values = request.model_dump(exclude_none=True)
+    
+    for field in ("risk_threshold_high", "risk_threshold_medium", "risk_threshold_low"):
+        if field in values and (values[field] < 0 or values[field] > 100):
+            raise HTTPException(status_code=400, detail=f"{field} must be between 0 and 100")
+    
+    # Load only the current thresholds - needed to validate the merged ordering
+    current = db.query(
+        UserPreferencesModel.risk_threshold_high,
+        UserPreferencesModel.risk_threshold_medium,
+        UserPreferencesModel.risk_threshold_low
+    ).filter(
         UserPreferencesModel.user_id == current_user.id
     ).first()
     
-    if not prefs:
-        prefs = UserPreferencesModel(user_id=current_user.id)
-        db.add(prefs)
-    
-    # Update only provided fields
-    if request.risk_threshold_high is not None:
-        if request.risk_threshold_high < 0 or request.risk_threshold_high > 100:
-            raise HTTPException(status_code=400, detail="risk_threshold_high must be between 0 and 100")
-        prefs.risk_threshold_high = request.risk_threshold_high
-    
-    if request.risk_threshold_medium is not None:
-        if request.risk_threshold_medium < 0 or request.risk_threshold_medium > 100:
-            raise HTTPException(status_code=400, detail="risk_threshold_medium must be between 0 and 100")
-        prefs.risk_threshold_medium = request.risk_threshold_medium
-    
-    if request.risk_threshold_low is not None:
-        if request.risk_threshold_low < 0 or request.risk_threshold_low > 100:
-            raise HTTPException(status_code=400, detail="risk_threshold_low must be between 0 and 100")
-        prefs.risk_threshold_low = request.risk_threshold_low
+    high = values.get("risk_threshold_high", current.risk_threshold_high if current else 70.0)
+    medium = values.get("risk_threshold_medium", current.risk_threshold_medium if current else 40.0)
+    low = values.get("risk_threshold_low", current.risk_threshold_low if current else 0.0)
     
     # Validate thresholds are in order
-    if prefs.risk_threshold_low >= prefs.risk_threshold_medium:
+    if low >= medium:
         raise HTTPException(
             status_code=400,
             detail="risk_threshold_low must be less than risk_threshold_medium"
         )
-    if prefs.risk_threshold_medium >= prefs.risk_threshold_high:
+    if medium >= high:
         raise HTTPException(
             status_code=400,
             detail="risk_threshold_medium must be less than risk_threshold_high"
         )
     
-    if request.dashboard_layout is not None:
-        prefs.dashboard_layout = request.dashboard_layout
-    
-    if request.default_filters is not None:
-        prefs.default_filters = request.default_filters
-    
-    if request.default_views is not None:
-        prefs.default_views = request.default_views
-    
-    if request.show_p50_first is not None:
-        prefs.show_p50_first = request.show_p50_first
-    
-    if request.show_p80_first is not None:
-        prefs.show_p80_first = request.show_p80_first
-    
-    if request.show_anomalies_section is not None:
-        prefs.show_anomalies_section = request.show_anomalies_section
-    
-    if request.show_resource_summary is not None:
-        prefs.show_resource_summary = request.show_resource_summary
-    
+    # Single UPDATE (or INSERT for a new row) that also returns the stored row
+    columns = _RESPONSE_COLUMNS
+    if current is None:
+        statement = insert(UserPreferencesModel).values(
+            user_id=current_user.id, **values
+        ).returning(*columns)
+    elif values:
+        statement = update(UserPreferencesModel).where(
+            UserPreferencesModel.user_id == current_user.id
+        ).values(**values).returning(*columns)
+    else:
+        # Nothing to change - just read the row back
+        statement = select(*columns).where(UserPreferencesModel.user_id == current_user.id)
+    
+    prefs = db.execute(statement).one()
     db.commit()
-    db.refresh(prefs)
     
-    return UserPreferencesResponse(
+    response = UserPreferencesResponse(
         risk_threshold_high=prefs.risk_threshold_high,
         risk_threshold_medium=prefs.risk_threshold_medium,
         risk_threshold_low=prefs.risk_threshold_low,
@@ -165,4 +179,5 @@ def update_user_preferences(
         show_anomalies_section=prefs.show_anomalies_section,
         show_resource_summary=prefs.show_resource_summary
     )
-
+    _preferences_cache.set(current_user.id, response)
+    return response
@@ -3,18 +3,22 @@ Webhook API endpoints - Priority 4: Webhook Integration
 SOLID compliant webhook management
 """
 
+import asyncio
+import logging
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_serializer
 from typing import Optional, Dict, Any, List
 from core.database import get_db
 from core.auth_dependencies import get_current_user
 from core.webhook_service import get_webhook_service, WebhookType
 from api.auth import UserResponse
 from infrastructure.database.models import WebhookConfigurationModel, ProjectModel
-from sqlalchemy import and_
+from sqlalchemy import and_, or_, select
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class WebhookConfigurationRequest(BaseModel):
@@ -39,8 +43,21 @@ class WebhookConfigurationResponse(BaseModel):
     triggers: Dict[str, bool]
     risk_threshold: float
     enabled: bool
-    last_triggered: Optional[str]
+    last_triggered: Optional[datetime]
     failure_count: int
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    @field_serializer('last_triggered')
+    def serialize_last_triggered(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize last_triggered as an ISO 8601 string"""
+        return value.isoformat() if value else None
+
+
+# Table columns backing WebhookConfigurationResponse
+_RESPONSE_COLUMNS = tuple(
+    WebhookConfigurationModel.__table__.c[name] for name in WebhookConfigurationResponse.model_fields
+)
 
 
 @router.post("/webhooks", response_model=WebhookConfigurationResponse)
@@ -59,6 +76,9 @@ def create_webhook(
             detail=f"Invalid webhook_type. Must be one of: {[wt.value for wt in WebhookType]}"
         )
     
+    if request.risk_threshold < 0 or request.risk_threshold > 100:
+        raise HTTPException(status_code=400, detail="risk_threshold must be between 0 and 100")
+    
     # Validate project ownership if project_id provided
     if request.project_id:
         project = db.query(ProjectModel).filter(
@@ -88,18 +108,7 @@ def create_webhook(
     db.commit()
     db.refresh(webhook)
     
-    return WebhookConfigurationResponse(
-        id=webhook.id,
-        name=webhook.name,
-        webhook_url=webhook.webhook_url,
-        webhook_type=webhook.webhook_type,
-        project_id=webhook.project_id,
-        triggers=webhook.triggers,
-        risk_threshold=webhook.risk_threshold,
-        enabled=webhook.enabled,
-        last_triggered=webhook.last_triggered.isoformat() if webhook.last_triggered else None,
-        failure_count=webhook.failure_count
-    )
+    return WebhookConfigurationResponse.model_validate(webhook)
 
 
 @router.get("/webhooks", response_model=List[WebhookConfigurationResponse])
@@ -108,25 +117,12 @@ def list_webhooks(
     current_user: UserResponse = Depends(get_current_user)
 ):
     """List all webhook configurations for user"""
-    webhooks = db.query(WebhookConfigurationModel).filter(
-        WebhookConfigurationModel.user_id == current_user.id
+    # Select only the response columns - avoids hydrating full ORM instances
+    rows = db.execute(
+        select(*_RESPONSE_COLUMNS).where(WebhookConfigurationModel.user_id == current_user.id)
     ).all()
     
-    return [
-        WebhookConfigurationResponse(
-            id=w.id,
-            name=w.name,
-            webhook_url=w.webhook_url,
-            webhook_type=w.webhook_type,
-            project_id=w.project_id,
-            triggers=w.triggers,
-            risk_threshold=w.risk_threshold,
-            enabled=w.enabled,
-            last_triggered=w.last_triggered.isoformat() if w.last_triggered else None,
-            failure_count=w.failure_count
-        )
-        for w in webhooks
-    ]
+    return [WebhookConfigurationResponse.model_validate(row) for row in rows]
 
 
 @router.put("/webhooks/{webhook_id}", response_model=WebhookConfigurationResponse)
@@ -147,31 +143,21 @@ def update_webhook(
     if not webhook:
         raise HTTPException(status_code=404, detail="Webhook not found")
     
-    # Update fields
-    webhook.name = request.name
-    webhook.webhook_url = str(request.webhook_url)
-    webhook.webhook_type = request.webhook_type.lower()
-    webhook.triggers = request.triggers
-    webhook.risk_threshold = request.risk_threshold
-    webhook.payload_template = request.payload_template
+    if request.risk_threshold < 0 or request.risk_threshold > 100:
+        raise HTTPException(status_code=400, detail="risk_threshold must be between 0 and 100")
+    
+    # Update fields (project scope is fixed at creation; secret_key only if provided)
+    values = request.model_dump(mode="json", exclude={"project_id", "secret_key"})
+    values["webhook_type"] = request.webhook_type.lower()
     if request.secret_key:
-        webhook.secret_key = request.secret_key
+        values["secret_key"] = request.secret_key
+    for field, value in values.items():
+        setattr(webhook, field, value)
     
     db.commit()
     db.refresh(webhook)
     
-    return WebhookConfigurationResponse(
-        id=webhook.id,
-        name=webhook.name,
-        webhook_url=webhook.webhook_url,
-        webhook_type=webhook.webhook_type,
-        project_id=webhook.project_id,
-        triggers=webhook.triggers,
-        risk_threshold=webhook.risk_threshold,
-        enabled=webhook.enabled,
-        last_triggered=webhook.last_triggered.isoformat() if webhook.last_triggered else None,
-        failure_count=webhook.failure_count
-    )
+    return WebhookConfigurationResponse.model_validate(webhook)
 
 
 @router.delete("/webhooks/{webhook_id}")
@@ -252,6 +238,10 @@ async def test_webhook(
         raise HTTPException(status_code=500, detail=f"Webhook test failed: {str(e)}")
 
 
+# Upper bound on concurrent outbound webhook requests per risk alert
+WEBHOOK_DISPATCH_CONCURRENCY = 10
+
+
 async def trigger_webhooks_for_risk_alert(
     db: Session,
     user_id: int,
@@ -259,46 +249,53 @@ async def trigger_webhooks_for_risk_alert(
     event_data: Dict[str, Any]
 ):
     """Trigger webhooks for risk alert (called from risk pipeline)"""
-    # Get enabled webhooks for user
-    webhooks = db.query(WebhookConfigurationModel).filter(
+    risk_score = event_data.get("risk_score", 0)
+    
+    # Get enabled webhooks for user that apply to this project and risk threshold
+    targets = db.query(WebhookConfigurationModel).filter(
         and_(
             WebhookConfigurationModel.user_id == user_id,
             WebhookConfigurationModel.enabled == True,
-            WebhookConfigurationModel.triggers['risk_alert'].astext == 'true'
+            WebhookConfigurationModel.risk_alert_enabled.is_(True),
+            or_(
+                WebhookConfigurationModel.project_id.is_(None),
+                WebhookConfigurationModel.project_id == project_id
+            ),
+            WebhookConfigurationModel.risk_threshold <= risk_score
         )
     ).all()
+    if not targets:
+        return
     
     webhook_service = get_webhook_service()
     
-    for webhook in webhooks:
-        # Check if webhook applies to this project
-        if webhook.project_id and webhook.project_id != project_id:
-            continue
-        
-        # Check risk threshold
-        risk_score = event_data.get("risk_score", 0)
-        if risk_score < webhook.risk_threshold:
-            continue
-        
-        try:
-            webhook_type = WebhookType(webhook.webhook_type)
-            success = await webhook_service.send_webhook(
+    # OPTIMIZATION: Dispatch concurrently (bounded) - total latency is the slowest
+    # endpoint instead of the sum of all endpoints
+    semaphore = asyncio.Semaphore(WEBHOOK_DISPATCH_CONCURRENCY)
+    
+    async def _send_one(webhook: WebhookConfigurationModel) -> bool:
+        async with semaphore:
+            return await webhook_service.send_webhook(
                 webhook_url=webhook.webhook_url,
-                webhook_type=webhook_type,
+                webhook_type=WebhookType(webhook.webhook_type),
                 event_type="risk_alert",
                 data=event_data,
                 config=webhook.payload_template or {},
                 secret_key=webhook.secret_key
             )
-            
-            if success:
-                webhook.last_triggered = datetime.now()
-                webhook.failure_count = 0
-            else:
-                webhook.failure_count += 1
-        except Exception as e:
-            print(f"[Webhook] Failed to trigger webhook {webhook.id}: {e}")
+    
+    results = await asyncio.gather(*(_send_one(w) for w in targets), return_exceptions=True)
+    
+    # Session is only touched after all sends complete
+    now = datetime.now()
+    for webhook, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to trigger webhook %s", webhook.id, exc_info=result)
+            webhook.failure_count += 1
+        elif result:
+            webhook.last_triggered = now
+            webhook.failure_count = 0
+        else:
             webhook.failure_count += 1
     
     db.commit()
-
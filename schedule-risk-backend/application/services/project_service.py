@@ -4,11 +4,13 @@ Orchestrates project-related operations
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from domain.entities import Project, Activity
+from domain.entities import Project, Activity, AuditLog
 from domain.interfaces import IProjectRepository, IActivityRepository, IAuditLogRepository
 from infrastructure.repositories.project_repository import ProjectRepository
 from infrastructure.repositories.activity_repository import ActivityRepository
 from infrastructure.repositories.audit_log_repository import AuditLogRepository
+from infrastructure.database.connection import unit_of_work
+from core.ids import new_project_id
 
 
 class ProjectService:
@@ -21,8 +23,10 @@ class ProjectService:
         self,
         project_repo: IProjectRepository,
         activity_repo: IActivityRepository,
-        audit_repo: IAuditLogRepository
+        audit_repo: IAuditLogRepository,
+        db: Session
     ):
+        self.db = db
         self.project_repo = project_repo
         self.activity_repo = activity_repo
         self.audit_repo = audit_repo
@@ -34,8 +38,7 @@ class ProjectService:
         activities: Optional[List[Activity]] = None
     ) -> Project:
         """Create a new project with activities"""
-        import uuid
-        project_id = str(uuid.uuid4())
+        project_id = new_project_id()
         
         project = Project(
             project_id=project_id,
@@ -44,21 +47,19 @@ class ProjectService:
             activity_count=len(activities) if activities else 0
         )
         
-        project = self.project_repo.create(project)
-        
-        if activities:
-            self.activity_repo.save_all(project_id, activities)
-            # Update activity count
-            project.activity_count = len(activities)
-            project = self.project_repo.update(project)
-        
-        # Log creation
-        from domain.entities import AuditLog
-        self.audit_repo.create(AuditLog(
-            project_id=project_id,
-            event="project_created",
-            details={"filename": filename, "activity_count": len(activities) if activities else 0}
-        ))
+        # One transaction for project, activities and audit entry
+        with unit_of_work(self.db):
+            project = self.project_repo.create(project)
+            
+            if activities:
+                self.activity_repo.save_all(project_id, activities)
+            
+            # Log creation
+            self.audit_repo.create(AuditLog(
+                project_id=project_id,
+                event="project_created",
+                details={"filename": filename, "activity_count": project.activity_count}
+            ))
         
         return project
     
@@ -91,22 +92,22 @@ class ProjectService:
         if not project:
             raise ValueError(f"Project {project_id} not found")
         
-        # Save activities
-        self.activity_repo.save_all(project_id, activities)
-        
-        # Update project metadata
-        project.activity_count = len(activities)
-        if filename:
-            project.filename = filename
-        self.project_repo.update(project)
-        
-        # Log update
-        from domain.entities import AuditLog
-        self.audit_repo.create(AuditLog(
-            project_id=project_id,
-            event="activities_updated",
-            details={"activity_count": len(activities), "filename": filename}
-        ))
+        with unit_of_work(self.db):
+            # Save activities
+            self.activity_repo.save_all(project_id, activities)
+            
+            # Update project metadata
+            project.activity_count = len(activities)
+            if filename:
+                project.filename = filename
+            self.project_repo.update(project)
+            
+            # Log update
+            self.audit_repo.create(AuditLog(
+                project_id=project_id,
+                event="activities_updated",
+                details={"activity_count": len(activities), "filename": filename}
+            ))
 
 
 def create_project_service(db: Session) -> ProjectService:
@@ -114,5 +115,5 @@ def create_project_service(db: Session) -> ProjectService:
     project_repo = ProjectRepository(db)
     activity_repo = ActivityRepository(db)
     audit_repo = AuditLogRepository(db)
-    return ProjectService(project_repo, activity_repo, audit_repo)
+    return ProjectService(project_repo, activity_repo, audit_repo, db)
 
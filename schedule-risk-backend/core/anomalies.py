@@ -2,27 +2,147 @@
 Anomaly detection functionality
 """
 
+import math
+from collections import defaultdict
 from datetime import datetime, date
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, NamedTuple, Optional, Tuple
+import numpy as np
 from .models import Activity, PROJECTS
-from .digital_twin import get_or_build_twin
-import pandas as pd
 
 
-def parse_date(date_str):
+# Day-first formats used by schedule exports, tried after ISO 8601
+_DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y", "%d-%m-%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S")
+
+
+@lru_cache(maxsize=16384)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Parse a non-empty date string (memoized - schedules repeat the same dates many times)"""
+    date_str = date_str.strip()
+    # OPTIMIZATION: C-level ISO parser and strptime for known formats instead of
+    # pd.to_datetime, which carries heavy per-call format inference overhead
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    # Uncommon format - fall back to pandas inference (DD-MM-YYYY preferred)
+    import pandas as pd
+    try:
+        parsed = pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+    except:
+        return None
+    return None if pd.isna(parsed) else parsed.to_pydatetime()
+
+
+def parse_date(date_str) -> Optional[datetime]:
     """Parse date string to datetime or return None"""
     if not date_str:
         return None
-    try:
-        if isinstance(date_str, str) and date_str.strip() == "":
+    if isinstance(date_str, str):
+        if date_str.strip() == "":
             return None
-        # Try parsing with dayfirst=True to handle DD-MM-YYYY format, fallback to default
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
-    except:
+        return _parse_date_str(date_str)
+    if isinstance(date_str, datetime):
+        return date_str
+    if isinstance(date_str, date):
+        return datetime(date_str.year, date_str.month, date_str.day)
+    return _parse_date_str(str(date_str))
+
+
+@lru_cache(maxsize=16384)
+def _to_timestamp_str(date_str: str):
+    import pandas as pd
+    return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+
+
+def to_timestamp(value):
+    """
+    pd.to_datetime(value, dayfirst=True, errors='coerce') - a pandas Timestamp, or NaT.
+    
+    OPTIMIZATION: Memoized per date string. Forecasting, features, forensics and the
+    Gantt view each parse the same activity dates again on every run; this makes that
+    one pandas parse per distinct string per process (Timestamps are immutable).
+    """
+    if isinstance(value, str):
+        return _to_timestamp_str(value)
+    import pandas as pd
+    return pd.to_datetime(value, dayfirst=True, errors='coerce')
+
+
+def _format_date_dd_mm_yyyy(dt) -> Optional[str]:
+    """Format date as DD-MM-YYYY (f-string is cheaper than strftime's format parsing)"""
+    if dt is None:
         return None
+    return f"{dt.day:02d}-{dt.month:02d}-{dt.year:04d}"
+
+
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _moment_key(dt: datetime) -> int:
+    """
+    Integer sort key for a datetime: microseconds since 0001-01-01.
+    
+    Ordering and equality match datetime comparison (aware values are normalized
+    to UTC), but comparing and hashing plain ints is much cheaper.
+    """
+    offset = dt.utcoffset()
+    if offset is not None:
+        dt = dt - offset
+    return (
+        dt.toordinal() * _MICROSECONDS_PER_DAY
+        + (dt.hour * 3600 + dt.minute * 60 + dt.second) * 1_000_000
+        + dt.microsecond
+    )
+
+
+@lru_cache(maxsize=16384)
+def _split_predecessor_ids(pred_id: str) -> Tuple[str, ...]:
+    """Split a raw predecessor entry into activity IDs (handles "1FS", "1 2FS")"""
+    return tuple(pred_id.strip().replace("FS", "").split())
 
 
-def detect_zombie_tasks(project_id: str, activities: Optional[List] = None, reference_date: Optional[date] = None) -> List[Dict]:
+class ParsedDates(NamedTuple):
+    """Parsed schedule dates for one activity"""
+    planned_start: Optional[datetime]
+    planned_finish: Optional[datetime]
+    actual_start: Optional[datetime]
+    actual_finish: Optional[datetime]
+
+
+def parse_activity_dates(activities: List) -> List[ParsedDates]:
+    """
+    Parse the four schedule date fields of every activity in one pass.
+    
+    Args:
+        activities: List of activities
+    
+    Returns:
+        List of ParsedDates aligned with activities
+    """
+    return [
+        ParsedDates(
+            parse_date(a.planned_start),
+            parse_date(a.planned_finish),
+            parse_date(a.actual_start),
+            parse_date(a.actual_finish)
+        )
+        for a in activities
+    ]
+
+
+def detect_zombie_tasks(
+    project_id: str,
+    activities: Optional[List] = None,
+    reference_date: Optional[date] = None,
+    parsed_dates: Optional[List[ParsedDates]] = None
+) -> List[Dict]:
     """
     Detect tasks that should have started but didn't (Zombie tasks).
     Enhanced to check if predecessors are complete before flagging as zombie.
@@ -33,6 +153,7 @@ def detect_zombie_tasks(project_id: str, activities: Optional[List] = None, refe
         activities: List of activities (optional, will load from PROJECTS if not provided)
         reference_date: Reference date for comparison (defaults to today if None)
                        This allows using CSV date or custom date instead of current date.
+        parsed_dates: Pre-parsed dates aligned with activities (optional, parsed here if not provided)
     
     Returns:
         List of zombie task dictionaries
@@ -48,86 +169,89 @@ def detect_zombie_tasks(project_id: str, activities: Optional[List] = None, refe
         # Ensure reference_date is a date object
         if hasattr(reference_date, 'date'):
             reference_date = reference_date.date()
+    # Day ordinals turn the date-only comparisons below into int arithmetic
+    reference_ordinal = reference_date.toordinal()
     
-    # Build activity map for quick lookup
-    activity_map = {a.activity_id: a for a in activities}
+    # Parse all dates once up front - the loops below only read precomputed values
+    if parsed_dates is None:
+        parsed_dates = parse_activity_dates(activities)
+    
+    # Precompute predecessor completion once per project
+    # (last activity wins on duplicate IDs, matching a map lookup)
+    is_complete = {
+        a.activity_id: (
+            (a.percent_complete or 0.0) >= 100.0 or
+            (a.actual_finish is not None and dates.actual_finish is not None)
+        )
+        for a, dates in zip(activities, parsed_dates)
+    }
     
     def are_predecessors_complete(activity) -> bool:
-        """Check if all predecessors are complete"""
+        """Check if all predecessors are complete (missing predecessors count as incomplete)"""
         if not activity.predecessors:
             return True  # No predecessors, so they're "complete"
         
-        for pred_id in activity.predecessors:
-            if not pred_id or not pred_id.strip():
-                continue
-            # Handle FS suffix and multiple predecessors (e.g., "1FS", "1 2FS")
-            pred_id_clean = pred_id.strip().replace("FS", "").strip()
-            pred_ids = [p.strip() for p in pred_id_clean.split() if p.strip()]
-            
-            for pid in pred_ids:
-                pred_activity = activity_map.get(pid)
-                if not pred_activity:
-                    # Predecessor not found - assume incomplete to be safe
-                    return False
-                
-                # Check if predecessor is complete
-                pred_complete = (
-                    pred_activity.percent_complete >= 100.0 or
-                    (pred_activity.actual_finish is not None and parse_date(pred_activity.actual_finish) is not None)
-                )
-                if not pred_complete:
-                    return False
-        
-        return True
+        return all(
+            is_complete.get(pid, False)
+            for pred_id in activity.predecessors if pred_id
+            for pid in _split_predecessor_ids(pred_id)
+        )
     
-    for activity in activities:
-        planned_start = parse_date(activity.planned_start)
+    # OPTIMIZATION: Vectorized candidate filter - only overdue, unstarted tasks reach the
+    # per-activity predecessor check below. Ordinal 0 marks a missing planned start.
+    planned_ordinals = [
+        dates.planned_start.toordinal() if dates.planned_start else 0
+        for dates in parsed_dates
+    ]
+    count = len(planned_ordinals)
+    planned = np.array(planned_ordinals, dtype=np.int64)
+    percent = np.fromiter((a.percent_complete or 0.0 for a in activities), dtype=np.float64, count=count)
+    started = np.fromiter((bool(a.actual_start) for a in activities), dtype=bool, count=count)
+    # Use <= to catch tasks due on reference date that haven't started
+    # Per spec: zombie task if Planned_Start <= reference_date and Percent_Complete < 5%
+    candidates = np.flatnonzero(
+        (planned > 0) & (planned <= reference_ordinal) & (percent < 5.0) & ~started
+    )
+    
+    for i in candidates.tolist():
+        activity = activities[i]
+        days_overdue = reference_ordinal - planned_ordinals[i]
+        # Check if predecessors are complete (or no predecessors)
+        predecessors_ready = are_predecessors_complete(activity)
+        # Predecessors not complete - only flag tasks more than a week overdue
+        if not predecessors_ready and days_overdue <= 7:
+            continue
         
-        # Normalize planned_start to date-only for comparison
-        if planned_start:
-            planned_start_date = planned_start.date() if hasattr(planned_start, 'date') else planned_start
-            # Use <= to catch tasks due on reference date that haven't started
-            if planned_start_date <= reference_date:
-                # Task should have started
-                # Per spec: zombie task if Planned_Start <= reference_date and Percent_Complete < 5%
-                percent_complete = activity.percent_complete or 0.0
-                if not activity.actual_start and percent_complete < 5.0:
-                    # Check if predecessors are complete (or no predecessors)
-                    # Format date as DD-MM-YYYY for consistency
-                    def format_date_dd_mm_yyyy(dt):
-                        if dt is None:
-                            return None
-                        return dt.strftime("%d-%m-%Y")
-                    
-                    if are_predecessors_complete(activity):
-                        days_overdue = (reference_date - planned_start_date).days
-                        zombies.append({
-                            "activity_id": activity.activity_id,
-                            "name": activity.name,
-                            "planned_start": format_date_dd_mm_yyyy(planned_start),
-                            "days_overdue": days_overdue,
-                            "anomaly_type": "zombie",
-                            "predecessors_ready": True
-                        })
-                    else:
-                        # Predecessors not complete - but task is still overdue
-                        # Change message to be more accurate and actionable
-                        days_overdue = (reference_date - planned_start_date).days
-                        if days_overdue > 7:  # More than a week overdue
-                            zombies.append({
-                                "activity_id": activity.activity_id,
-                                "name": activity.name,
-                                "planned_start": format_date_dd_mm_yyyy(planned_start),
-                                "days_overdue": days_overdue,
-                                "anomaly_type": "zombie",
-                                "predecessors_ready": False,
-                                "note": "Planned start has passed but progress is 0%"
-                            })
+        zombie = {
+            "activity_id": activity.activity_id,
+            "name": activity.name,
+            "planned_start": _format_date_dd_mm_yyyy(parsed_dates[i].planned_start),
+            "days_overdue": days_overdue,
+            "anomaly_type": "zombie",
+            "predecessors_ready": predecessors_ready
+        }
+        if not predecessors_ready:
+            # Task is still overdue - keep the message accurate and actionable
+            zombie["note"] = "Planned start has passed but progress is 0%"
+        zombies.append(zombie)
     
     return zombies
 
 
-def detect_black_holes(project_id: str, activities: Optional[List] = None) -> List[Dict]:
+def _nonfinite_kind(fte: float) -> int:
+    """Classify an FTE for the black-hole sweep: 0 finite, 1 NaN, 2 +inf, 3 -inf"""
+    if math.isfinite(fte):
+        return 0
+    if math.isnan(fte):
+        return 1
+    return 2 if fte > 0 else 3
+
+
+def detect_black_holes(
+    project_id: str,
+    activities: Optional[List] = None,
+    parsed_dates: Optional[List[ParsedDates]] = None
+) -> List[Dict]:
     """
     Detect overloaded resources (Black Holes) with time-phased overlap analysis.
     Checks for resources where overlapping FTE_Allocation > Resource_Max_FTE,
@@ -135,32 +259,32 @@ def detect_black_holes(project_id: str, activities: Optional[List] = None) -> Li
     """
     if activities is None:
         activities = PROJECTS.get(project_id, [])
-    resource_loads = {}
+    if parsed_dates is None:
+        parsed_dates = parse_activity_dates(activities)
+    resource_loads = defaultdict(lambda: {
+        "max_fte": None,  # Taken from the first activity seen for the resource
+        "activities": [],
+        "time_windows": [],  # List of (start_key, finish_key, fte, act_info) tuples
+        "moments": {}  # Integer key -> original datetime, for formatting output
+    })
     
     # Group activities by resource and calculate time-phased utilization
-    for activity in activities:
+    for activity, dates in zip(activities, parsed_dates):
         if activity.resource_id:
-            if activity.resource_id not in resource_loads:
-                resource_loads[activity.resource_id] = {
-                    "max_fte": activity.resource_max_fte or 1.0,
-                    "activities": [],
-                    "time_windows": []  # List of (start, finish, fte) tuples
-                }
-            
-            # Parse activity dates
-            planned_start = parse_date(activity.planned_start)
-            planned_finish = parse_date(activity.planned_finish)
-            actual_start = parse_date(activity.actual_start)
-            actual_finish = parse_date(activity.actual_finish)
+            load = resource_loads[activity.resource_id]
+            load["max_fte"] = load["max_fte"] or activity.resource_max_fte or 1.0
             
             # Use actual dates if available, otherwise planned
-            start_date = actual_start or planned_start
-            finish_date = actual_finish or planned_finish
+            start_date = dates.actual_start or dates.planned_start
+            finish_date = dates.actual_finish or dates.planned_finish
             
             # Validate dates before using
             if start_date and finish_date:
+                # Sweep on integer keys rather than datetime objects
+                start_key = _moment_key(start_date)
+                finish_key = _moment_key(finish_date)
                 # Ensure finish is after start
-                if finish_date < start_date:
+                if finish_key < start_key:
                     # Invalid date range, skip this activity
                     continue
                 fte = activity.fte_allocation or 0.0
@@ -172,52 +296,89 @@ def detect_black_holes(project_id: str, activities: Optional[List] = None) -> Li
                     "fte": fte,
                     "on_critical_path": activity.on_critical_path
                 }
-                resource_loads[activity.resource_id]["activities"].append(act_info)
+                load["activities"].append(act_info)
                 # Store activity info with time window for O(1) lookup
-                resource_loads[activity.resource_id]["time_windows"].append(
-                    (start_date, finish_date, fte, act_info)  # Include act_info for direct access
+                load["time_windows"].append(
+                    (start_key, finish_key, fte, act_info)  # Include act_info for direct access
                 )
+                moments = load["moments"]
+                moments.setdefault(start_key, start_date)
+                moments.setdefault(finish_key, finish_date)
     
     # Find overloaded resources using time-phased analysis
     black_holes = []
     for resource_id, load_info in resource_loads.items():
         max_fte = load_info["max_fte"]
         time_windows = load_info["time_windows"]
+        moments = load_info["moments"]
         
         if not time_windows:
             continue
         
-        # Find all unique time points (start and finish dates)
-        time_points = set()
-        for time_window in time_windows:
-            start, finish, _, _ = time_window  # Unpack: start, finish, fte, act_info
-            time_points.add(start)
-            time_points.add(finish)
-        time_points = sorted(time_points)
+        # Find all unique time points (start and finish keys)
+        time_points = sorted({t for window in time_windows for t in window[:2]})
+        point_index = {t: i for i, t in enumerate(time_points)}
+        interval_count = len(time_points) - 1
+        
+        # OPTIMIZATION: Sweep-line instead of scanning every window per interval.
+        # A window [start, finish] overlaps interval i = [t_i, t_i+1] (inclusive bounds)
+        # exactly for i in [index(start) - 1, index(finish)], so each window becomes one
+        # enter and one leave event over the sorted intervals: O(K log K) per resource.
+        enters = [[] for _ in range(interval_count + 1)]
+        leaves = [[] for _ in range(interval_count + 1)]
+        for j, (start, finish, _, _) in enumerate(time_windows):
+            first = max(point_index[start] - 1, 0)
+            last = min(point_index[finish], interval_count - 1)
+            if first <= last:
+                enters[first].append(j)
+                leaves[last + 1].append(j)
         
         # Check utilization at each time interval
         max_overlap = 0.0
         max_overlap_period = None
         critical_overlaps = []  # Overlaps during critical periods
         
-        for i in range(len(time_points) - 1):
+        # Per-window columns for the sweep (struct-of-arrays). Each FTE float is an exact
+        # dyadic rational n/d, so scaling by the largest d gives integer units: running
+        # sums stay exact (no float drift across the capacity threshold) at int speed.
+        ftes = [float(window[2]) for window in time_windows]
+        ratios = [fte.as_integer_ratio() if math.isfinite(fte) else (0, 1) for fte in ftes]
+        scale = max(d for _, d in ratios)
+        fte_units = [n * (scale // d) for n, d in ratios]
+        is_critical = [bool(window[3]["on_critical_path"]) for window in time_windows]
+        # inf/NaN allocations (unvalidated DB or REST-mapped data) have no integer ratio:
+        # active ones are counted per kind instead, so they only affect the intervals
+        # they cover rather than leaving NaN in the running sum after they leave
+        nonfinite_kind = [_nonfinite_kind(fte) for fte in ftes]
+        nonfinite_active = [0] * 4  # Indexed by kind (0 = finite, unused)
+        
+        running_units = 0
+        active = set()
+        critical_count = 0
+        
+        for i in range(interval_count):
+            for j in leaves[i]:
+                active.discard(j)
+                running_units -= fte_units[j]
+                critical_count -= is_critical[j]
+                nonfinite_active[nonfinite_kind[j]] -= 1
+            for j in enters[i]:
+                active.add(j)
+                running_units += fte_units[j]
+                critical_count += is_critical[j]
+                nonfinite_active[nonfinite_kind[j]] += 1
+            
             interval_start = time_points[i]
             interval_end = time_points[i + 1]
-            
-            # Calculate total FTE in this interval
-            total_fte_in_interval = 0.0
-            overlapping_activities = []
-            has_critical = False
-            
-            # Optimized: use stored act_info from time_windows tuple (4th element)
-            for time_window in time_windows:
-                start, finish, fte, act_info = time_window
-                # Check if activity overlaps with this interval
-                if start <= interval_end and finish >= interval_start:
-                    total_fte_in_interval += fte
-                    overlapping_activities.append(act_info)
-                    if act_info["on_critical_path"]:
-                        has_critical = True
+            _, nan_count, pos_inf_count, neg_inf_count = nonfinite_active
+            if nan_count or (pos_inf_count and neg_inf_count):
+                total_fte_in_interval = math.nan
+            elif pos_inf_count:
+                total_fte_in_interval = math.inf
+            elif neg_inf_count:
+                total_fte_in_interval = -math.inf
+            else:
+                total_fte_in_interval = running_units / scale  # Correctly rounded int division
             
             # Track maximum overlap
             if total_fte_in_interval > max_overlap:
@@ -225,12 +386,12 @@ def detect_black_holes(project_id: str, activities: Optional[List] = None) -> Li
                 max_overlap_period = (interval_start, interval_end)
             
             # Track critical period overlaps
-            if total_fte_in_interval > max_fte and has_critical:
+            if total_fte_in_interval > max_fte and critical_count > 0:
                 critical_overlaps.append({
-                    "period": (interval_start, interval_end),  # Keep as datetime objects for now
+                    "period": (interval_start, interval_end),  # Integer keys until formatting
                     "total_fte": total_fte_in_interval,
                     "utilization": total_fte_in_interval / max_fte if max_fte > 0 else 0,
-                    "activities": [a["activity_id"] for a in overlapping_activities]
+                    "activities": [time_windows[j][3]["activity_id"] for j in sorted(active)]
                 })
         
         # Check if resource is overloaded
@@ -240,16 +401,11 @@ def detect_black_holes(project_id: str, activities: Optional[List] = None) -> Li
             overall_utilization = total_fte_sum / max_fte if max_fte > 0 else 0
             
             # Format dates as DD-MM-YYYY for consistency
-            def format_date_dd_mm_yyyy(dt):
-                if dt is None:
-                    return None
-                return dt.strftime("%d-%m-%Y")
-            
             formatted_max_overlap_period = None
             if max_overlap_period:
                 formatted_max_overlap_period = (
-                    format_date_dd_mm_yyyy(max_overlap_period[0]),
-                    format_date_dd_mm_yyyy(max_overlap_period[1])
+                    _format_date_dd_mm_yyyy(moments[max_overlap_period[0]]),
+                    _format_date_dd_mm_yyyy(moments[max_overlap_period[1]])
                 )
             
             # Format critical overlaps dates
@@ -258,8 +414,8 @@ def detect_black_holes(project_id: str, activities: Optional[List] = None) -> Li
                 formatted_overlap = overlap.copy()
                 if "period" in formatted_overlap and formatted_overlap["period"]:
                     formatted_overlap["period"] = (
-                        format_date_dd_mm_yyyy(formatted_overlap["period"][0]),
-                        format_date_dd_mm_yyyy(formatted_overlap["period"][1])
+                        _format_date_dd_mm_yyyy(moments[formatted_overlap["period"][0]]),
+                        _format_date_dd_mm_yyyy(moments[formatted_overlap["period"][1]])
                     )
                 formatted_critical_overlaps.append(formatted_overlap)
             
@@ -292,8 +448,12 @@ def detect_anomalies(project_id: str, activities: Optional[List] = None, referen
     Returns:
         Dictionary with zombie_tasks, black_holes, and total_anomalies
     """
-    zombies = detect_zombie_tasks(project_id, activities, reference_date=reference_date)
-    black_holes = detect_black_holes(project_id, activities)
+    if activities is None:
+        activities = PROJECTS.get(project_id, [])
+    # Parse dates once and share them between both detectors
+    parsed_dates = parse_activity_dates(activities)
+    zombies = detect_zombie_tasks(project_id, activities, reference_date=reference_date, parsed_dates=parsed_dates)
+    black_holes = detect_black_holes(project_id, activities, parsed_dates=parsed_dates)
     
     return {
         "zombie_tasks": zombies,
@@ -3,6 +3,7 @@ Anomaly Explanation Service - Priority 5: Contextual Zombie Task Explanations
 SOLID compliant service for generating business-context explanations of anomalies
 """
 
+from collections import deque
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -16,23 +17,55 @@ else:
 class AnomalyExplanationService:
     """Service for generating contextual explanations of anomalies"""
     
+    def explain_zombie_tasks(
+        self,
+        zombie_tasks: List[Dict[str, Any]],
+        activities: List[Any],  # Activity type
+        project_id: str,
+        activity_by_id: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate explanations for all zombie tasks, sharing lookups across them"""
+        if activity_by_id is None:
+            activity_by_id = self._index_activities(activities)
+        blocked_cache: Dict[str, int] = {}
+        return [
+            self.explain_zombie_task(
+                zombie,
+                activities,
+                project_id,
+                activity_by_id=activity_by_id,
+                blocked_cache=blocked_cache
+            )
+            for zombie in zombie_tasks
+        ]
+    
     def explain_zombie_task(
         self,
         zombie_task: Dict[str, Any],
         activities: List[Any],  # Activity type
-        project_id: str
+        project_id: str,
+        activity_by_id: Optional[Dict[str, Any]] = None,
+        blocked_cache: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """Generate business-context explanation for zombie task"""
         activity_id = zombie_task.get("activity_id")
         days_overdue = zombie_task.get("days_overdue", 0)
         
+        if activity_by_id is None:
+            activity_by_id = self._index_activities(activities)
+        
         # Find the activity
-        activity = next((a for a in activities if a.activity_id == activity_id), None)
+        activity = activity_by_id.get(activity_id)
         if not activity:
             return self._default_explanation(zombie_task)
         
         # Calculate cascade impact
-        blocked_tasks = self._count_blocked_successors(activity_id, activities)
+        if blocked_cache is not None and activity_id in blocked_cache:
+            blocked_tasks = blocked_cache[activity_id]
+        else:
+            blocked_tasks = self._count_blocked_successors(activity_id, activity_by_id)
+            if blocked_cache is not None:
+                blocked_cache[activity_id] = blocked_tasks
         
         # Calculate urgency
         urgency_days = self._calculate_urgency(zombie_task, activity, activities)
@@ -66,27 +99,35 @@ class AnomalyExplanationService:
             )
         }
     
-    def _count_blocked_successors(self, activity_id: str, activities: List[Any]) -> int:
-        """Count how many tasks are blocked by this zombie task"""
+    @staticmethod
+    def _index_activities(activities: List[Any]) -> Dict[str, Any]:
+        """Map activity_id -> activity (first occurrence wins, like a linear search)"""
+        activity_by_id: Dict[str, Any] = {}
+        for a in activities:
+            activity_by_id.setdefault(a.activity_id, a)
+        return activity_by_id
+    
+    def _count_blocked_successors(self, activity_id: str, activity_by_id: Dict[str, Any]) -> int:
+        """Count how many tasks are blocked by this zombie task (all transitive successors)"""
         blocked = set()
+        visited = {activity_id}
+        queue = deque([activity_id])
         
-        def traverse_successors(current_id: str, visited: set):
-            if current_id in visited:
-                return
-            visited.add(current_id)
-            
-            current_activity = next((a for a in activities if a.activity_id == current_id), None)
+        # Iterative BFS with O(1) activity lookups
+        while queue:
+            current_activity = activity_by_id.get(queue.popleft())
             if not current_activity:
-                return
+                continue
             
             # Get successors
-            if hasattr(current_activity, 'successors') and current_activity.successors:
-                for succ_id in current_activity.successors:
-                    if succ_id and succ_id.strip():
-                        blocked.add(succ_id.strip())
-                        traverse_successors(succ_id.strip(), visited)
+            for succ_id in getattr(current_activity, 'successors', None) or []:
+                if succ_id and succ_id.strip():
+                    succ_id = succ_id.strip()
+                    blocked.add(succ_id)
+                    if succ_id not in visited:
+                        visited.add(succ_id)
+                        queue.append(succ_id)
         
-        traverse_successors(activity_id, set())
         return len(blocked)
     
     def _calculate_urgency(
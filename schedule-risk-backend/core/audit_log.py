@@ -2,10 +2,16 @@
 Audit logging functionality
 """
 
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 from .models import AUDIT_LOG
 
+# Per-project index over AUDIT_LOG so project queries don't scan every event.
+# Entries leave it in step with AUDIT_LOG's eviction, so both hold the same events.
+_by_project: Dict[str, Deque[Dict]] = defaultdict(deque)
+
 
 def log_event(event_type: str, project_id: str, details: Optional[Dict] = None) -> Dict:
     """Log an audit event"""
@@ -15,7 +21,16 @@ def log_event(event_type: str, project_id: str, details: Optional[Dict] = None)
         "project_id": project_id,
         "details": details or {}
     }
+    if AUDIT_LOG.maxlen is not None and len(AUDIT_LOG) >= AUDIT_LOG.maxlen:
+        # The oldest entry is about to fall off AUDIT_LOG - it is also the oldest
+        # entry of its project, so drop it from the front of the project's index
+        evicted_project = AUDIT_LOG[0]["project_id"]
+        entries = _by_project[evicted_project]
+        entries.popleft()
+        if not entries:
+            del _by_project[evicted_project]
     AUDIT_LOG.append(log_entry)
+    _by_project[project_id].append(log_entry)
     return log_entry
 
 
@@ -82,13 +97,16 @@ def log_explanation(project_id: str, activity_id: str, use_llm: bool = False):
 
 def get_project_audit_log(project_id: str) -> List[Dict]:
     """Get audit log entries for a specific project"""
-    return [entry for entry in AUDIT_LOG if entry.get("project_id") == project_id]
+    entries = _by_project.get(project_id)
+    return list(entries) if entries else []
 
 
 def get_all_audit_logs(limit: Optional[int] = None) -> List[Dict]:
     """Get all audit log entries, optionally limited"""
-    logs = AUDIT_LOG.copy()
     if limit:
-        logs = logs[-limit:]  # Get most recent entries
-    return logs
+        # Walk back from the newest entry: O(limit) instead of skipping the whole log
+        tail = list(islice(reversed(AUDIT_LOG), max(limit, 0)))
+        tail.reverse()
+        return tail
+    return list(AUDIT_LOG)
 
@@ -2,16 +2,31 @@
 Authentication utilities - JWT tokens and password hashing
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 import bcrypt
+import hashlib
+import hmac
+import logging
 import os
+import secrets
+from .ttl_cache import TTLCache
 
 # Secret key for JWT - in production, use environment variable
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production-min-32-chars")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+_DEFAULT_EXPIRY = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+logger = logging.getLogger(__name__)
+
+
+# Results of bcrypt verification keyed by (HMAC of password, stored hash). The HMAC uses
+# a per-process random key, so neither the password nor a brute-forceable digest is kept.
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verify_cache = TTLCache(maxsize=1024, ttl=3600)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -22,8 +37,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         if len(password_bytes) > 72:
             password_bytes = password_bytes[:72]
         
-        # Verify the password
-        return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
+        # bcrypt is deterministic for a (password, hash) pair - skip the KDF on repeats
+        key = (hmac.new(_VERIFY_CACHE_KEY, password_bytes, hashlib.sha256).digest(), hashed_password)
+        verified = _verify_cache.get(key)
+        if verified is None:
+            # Verify the password
+            verified = bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
+            _verify_cache.set(key, verified)
+        return verified
     except Exception:
         return False
 
@@ -44,32 +65,30 @@ def get_password_hash(password: str) -> str:
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Timezone-aware UTC (datetime.utcnow() is deprecated since Python 3.12)
+    expire = datetime.now(timezone.utc) + (expires_delta or _DEFAULT_EXPIRY)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def token_preview(token: str) -> str:
+    """Short prefix of a token for debug logs (call only when DEBUG logging is enabled)"""
+    return token if len(token) <= 20 else token[:20] + "…"
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
-        logger.info(f"Attempting to decode token with SECRET_KEY length: {len(SECRET_KEY)}")
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        logger.info(f"Token decoded successfully. Payload keys: {list(payload.keys())}")
-        return payload
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError as e:
-        logger.error(f"JWT decode error: {str(e)}")
-        logger.error(f"Token (first 50 chars): {token[:50]}...")
-        logger.error(f"SECRET_KEY (first 20 chars): {SECRET_KEY[:20]}...")
+        # Only the failure path logs; %-style args are formatted lazily by logging
+        logger.error("JWT decode error: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rejected token: %s", token_preview(token))
         return None
     except Exception as e:
-        logger.error(f"Unexpected error decoding token: {str(e)}")
+        logger.error("Unexpected error decoding token: %s", e)
         return None
 
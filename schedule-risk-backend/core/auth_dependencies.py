@@ -8,18 +8,106 @@ from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional, List
+import hashlib
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from .database import get_db
 from .user_service import get_user_by_id
 from .auth import decode_access_token
+from .config import AUTH_TOKEN_CACHE_TTL, AUTH_USER_CACHE_TTL
+from .ttl_cache import TTLCache
 
-# Import UserResponse at runtime to avoid circular dependency
-def _get_user_response_class():
-    from api.auth import UserResponse
-    return UserResponse
+# UserResponse is resolved on first use to avoid a circular import with api.auth,
+# then kept here so requests don't go through the import machinery every time
+_UserResponse: Optional[type] = None
+
+
+def _user_response_cls() -> type:
+    global _UserResponse
+    if _UserResponse is None:
+        from api.auth import UserResponse
+        _UserResponse = UserResponse
+    return _UserResponse
+
+logger = logging.getLogger(__name__)
 
 # HTTP Bearer token scheme
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Decoded token claims keyed by a 16-byte BLAKE2 digest of the token - clients reuse the
+# same bearer token for bursts of requests, so most lookups skip signature verification
+_token_cache = TTLCache(maxsize=4096, ttl=AUTH_TOKEN_CACHE_TTL)
+
+# Active users' responses keyed by user_id - skips the users query on request bursts.
+# Entries are only dropped by the TTL: the API never updates or deactivates user rows,
+# so a user changed out of band (e.g. deactivated in the database) is still accepted
+# for up to AUTH_USER_CACHE_TTL seconds.
+_user_cache = TTLCache(maxsize=2048, ttl=AUTH_USER_CACHE_TTL)
+
+# Session opened on demand by get_optional_user, so anonymous requests never check
+# a connection out of the pool
+_lazy_session = contextmanager(get_db)
+
+
+@dataclass(slots=True)
+class TokenClaims:
+    """Validated claims of a bearer token"""
+    user_id: int
+    exp: Optional[int]
+    raw: dict
+
+
+def decode_token_cached(
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme)
+) -> Optional[TokenClaims]:
+    """
+    Decode and validate a bearer token into its claims.
+    This is the only caller of decode_access_token; successfully decoded tokens are
+    cached until they expire (at most AUTH_TOKEN_CACHE_TTL). Usable as a dependency.
+    
+    Args:
+        credentials: HTTP Bearer token credentials
+        
+    Returns:
+        Optional[TokenClaims]: Claims if the token is valid, None otherwise
+    """
+    if credentials is None:
+        return None
+    
+    key = hashlib.blake2b(credentials.credentials.encode(), digest_size=16).digest()
+    claims = _token_cache.get(key)
+    if claims is not None:
+        return claims
+    
+    payload = decode_access_token(credentials.credentials)
+    if payload is None:
+        logger.warning("Token decode failed")
+        return None
+    
+    # sub is stored as string, convert to int
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        logger.warning("Token missing 'sub' field")
+        return None
+    try:
+        user_id = int(user_id_str)
+    except (ValueError, TypeError):
+        logger.warning("Invalid user_id format in token: %s", user_id_str)
+        return None
+    
+    exp = payload.get("exp")
+    claims = TokenClaims(user_id=user_id, exp=exp if isinstance(exp, (int, float)) else None, raw=payload)
+    
+    # Never keep claims past the token's own expiry
+    ttl = AUTH_TOKEN_CACHE_TTL
+    if claims.exp is not None:
+        ttl = min(ttl, claims.exp - time.time())
+    if ttl > 0:
+        _token_cache.set(key, claims, ttl=ttl)
+    return claims
+
 
 class AuthenticationError(HTTPException):
     """Custom exception for authentication errors"""
@@ -31,7 +119,7 @@ class AuthenticationError(HTTPException):
         )
 
 
-async def get_current_user_from_token(
+def get_current_user_from_token(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme),
     db: Session = Depends(get_db)
 ):
@@ -39,6 +127,9 @@ async def get_current_user_from_token(
     Extract and validate JWT token, return authenticated user.
     This is the core authentication dependency used by all protected endpoints.
     
+    OPTIMIZATION: A plain def, so FastAPI runs the JWT verification and blocking user
+    query in its threadpool instead of on the event loop.
+    
     Args:
         credentials: HTTP Bearer token credentials
         db: Database session
@@ -49,52 +140,37 @@ async def get_current_user_from_token(
     Raises:
         AuthenticationError: If token is missing, invalid, or user not found
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    UserResponse = _get_user_response_class()
+    UserResponse = _user_response_cls()
     
     if credentials is None:
         logger.warning("Authentication failed: No credentials provided")
         raise AuthenticationError("Authentication required. Please provide a valid Bearer token.")
     
-    token = credentials.credentials
-    logger.info(f"Token received: {token[:20]}..." if len(token) > 20 else token)
-    
-    # Decode and validate token
-    payload = decode_access_token(token)
-    if payload is None:
-        logger.warning(f"Token decode failed for token: {token[:20]}...")
+    claims = decode_token_cached(credentials)
+    if claims is None:
         raise AuthenticationError("Invalid or expired token. Please login again.")
+    user_id = claims.user_id
     
-    logger.info(f"Token decoded successfully. Payload: {payload}")
-    
-    # Extract user ID from token - sub is stored as string, convert to int
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        logger.warning(f"Token missing 'sub' field. Payload: {payload}")
-        raise AuthenticationError("Invalid token format. User ID not found.")
-    
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError):
-        logger.warning(f"Invalid user_id format in token: {user_id_str}")
-        raise AuthenticationError("Invalid token format. User ID must be a number.")
+    logger.debug("Extracted user_id from token: %s", user_id)
     
-    logger.info(f"Extracted user_id from token: {user_id}")
+    cached_user = _user_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
     
     # Verify user exists and is active
     user = get_user_by_id(db, user_id)
     if user is None:
-        logger.warning(f"User not found for user_id: {user_id}")
+        logger.warning("User not found for user_id: %s", user_id)
         raise AuthenticationError("User not found. Token may be invalid.")
     
     if not user.is_active:
-        logger.warning(f"User account inactive for user_id: {user_id}")
+        logger.warning("User account inactive for user_id: %s", user_id)
         raise AuthenticationError("User account is inactive.")
     
-    logger.info(f"Authentication successful for user: {user.email} (id: {user.id})")
-    return UserResponse(id=user.id, email=user.email, full_name=user.full_name)
+    logger.info("Authentication successful for user id %s", user.id)
+    response = UserResponse(id=user.id, email=user.email, full_name=user.full_name)
+    _user_cache.set(user_id, response)
+    return response
 
 
 # Primary dependency for protected endpoints
@@ -102,47 +178,43 @@ async def get_current_user_from_token(
 get_current_user = get_current_user_from_token
 
 
-async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme),
-    db: Session = Depends(get_db)
+def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(bearer_scheme)
 ):
     """
     Optional authentication - returns user if token is valid, None otherwise.
     Use this for endpoints that work with or without authentication.
     
+    OPTIMIZATION: Does not depend on get_db - a session is only opened when a valid
+    token's user is not already cached. Sync like get_current_user_from_token, so
+    that work runs in the threadpool.
+    
     Args:
         credentials: HTTP Bearer token credentials
-        db: Database session
         
     Returns:
         Optional[UserResponse]: User if authenticated, None otherwise
     """
-    UserResponse = _get_user_response_class()
-    
-    if credentials is None:
-        return None
+    UserResponse = _user_response_cls()
     
     try:
-        token = credentials.credentials
-        payload = decode_access_token(token)
-        if payload is None:
-            return None
-        
-        # Extract user ID from token - sub is stored as string, convert to int
-        user_id_str = payload.get("sub")
-        if user_id_str is None:
+        claims = decode_token_cached(credentials)
+        if claims is None:
             return None
+        user_id = claims.user_id
         
-        try:
-            user_id = int(user_id_str)
-        except (ValueError, TypeError):
-            return None
-        
-        user = get_user_by_id(db, user_id)
-        if user is None or not user.is_active:
-            return None
+        cached_user = _user_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
         
-        return UserResponse(id=user.id, email=user.email, full_name=user.full_name)
+        with _lazy_session() as db:
+            user = get_user_by_id(db, user_id)
+            if user is None or not user.is_active:
+                return None
+            
+            response = UserResponse(id=user.id, email=user.email, full_name=user.full_name)
+        _user_cache.set(user_id, response)
+        return response
     except Exception:
         return None
 
@@ -195,7 +267,7 @@ async def get_current_user_multi_method(
     # Try JWT token first
     if credentials:
         try:
-            return await get_current_user_from_token(credentials, db)
+            return get_current_user_from_token(credentials, db)
         except AuthenticationError:
             pass
     
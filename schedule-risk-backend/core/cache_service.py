@@ -1,12 +1,146 @@
 """
 Cache service layer - handles caching of computed results (forecast, risks, anomalies)
 This dramatically improves response times by avoiding expensive recomputation.
+
+All three results live in a single analysis_cache row per project: reading any of them
+is one primary-key lookup (shared by the getters within a request) and invalidating a
+project is one DELETE.
 """
 
+import copy
+import logging
+import threading
 from sqlalchemy.orm import Session
-from typing import Optional, Dict, List, Any
-from infrastructure.database.models import ForecastCacheModel, RisksCacheModel, AnomaliesCacheModel
-from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Optional, Dict, List, Any, Callable, Tuple
+from infrastructure.database.models import AnalysisCacheModel
+from sqlalchemy import and_, case, delete, func, inspect, select
+from .config import settings
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SECTIONS = ("forecast", "risks", "anomalies")
+_ML_PREDICTION_METHODS = ("ml", "ensemble", "ml_fallback")
+
+# Columns read by the getters (everything except the key and timestamp)
+_ROW_COLUMNS = (
+    AnalysisCacheModel.activity_count,
+    AnalysisCacheModel.data_hash,
+    AnalysisCacheModel.forecast,
+    AnalysisCacheModel.risks,
+    AnalysisCacheModel.anomalies,
+    AnalysisCacheModel.prediction_method
+)
+
+# Session.info key holding rows already read in this session (project_id -> row or None)
+_SESSION_ROWS_KEY = "analysis_cache_rows"
+
+
+def _load_cache_row(db: Session, project_id: str):
+    """Fetch a project's cache row once per session, so the three getters share one query"""
+    rows = db.info.setdefault(_SESSION_ROWS_KEY, {})
+    if project_id not in rows:
+        rows[project_id] = db.execute(
+            select(*_ROW_COLUMNS).where(AnalysisCacheModel.project_id == project_id)
+        ).first()
+    return rows[project_id]
+
+
+def _forget_cache_row(db: Session, project_id: str):
+    """Drop the session's copy of a project's cache row after it was written"""
+    db.info.get(_SESSION_ROWS_KEY, {}).pop(project_id, None)
+
+
+def _delete_cache_row(db: Session, project_id: str):
+    """Delete a project's cache row (all sections)"""
+    db.execute(delete(AnalysisCacheModel).where(AnalysisCacheModel.project_id == project_id))
+    db.commit()
+    _forget_cache_row(db, project_id)
+
+
+def _save_cache_section(
+    db: Session,
+    project_id: str,
+    section: str,
+    value: Dict,
+    activity_count: int,
+    data_hash: Optional[str],
+    **extra_columns: Any
+):
+    """
+    Upsert one section (forecast, risks or anomalies) of a project's cache row.
+    
+    The other sections are kept only if they were computed from the same data (same
+    activity_count and data_hash); otherwise they are cleared in the same statement.
+    
+    Args:
+        db: Database session
+        project_id: Project ID
+        section: Column name of the section being saved
+        value: Section payload (stored as JSON)
+        activity_count: Number of activities when computed
+        data_hash: Hash of activity data when computed
+        **extra_columns: Additional columns written with this section
+    """
+    table = AnalysisCacheModel.__table__
+    statement = pg_insert(AnalysisCacheModel).values(
+        project_id=project_id,
+        activity_count=activity_count,
+        data_hash=data_hash,
+        **{section: value},
+        **extra_columns
+    )
+    excluded = statement.excluded
+    same_data = and_(
+        table.c.activity_count == excluded.activity_count,
+        table.c.data_hash.is_not_distinct_from(excluded.data_hash)
+    )
+    
+    set_ = {column: excluded[column] for column in (section, "activity_count", "data_hash", *extra_columns)}
+    for other in _CACHE_SECTIONS:
+        if other != section:
+            set_[other] = case((same_data, table.c[other]), else_=None)
+    if "prediction_method" not in set_:
+        set_["prediction_method"] = case((same_data, table.c.prediction_method), else_=None)
+    set_["updated_at"] = func.now()
+    
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[AnalysisCacheModel.project_id],
+        set_=set_
+    ))
+    db.commit()
+    _forget_cache_row(db, project_id)
+
+
+# Cache tables confirmed to exist - checked once per process instead of probed on every save
+_ready_tables = set()
+
+
+def cache_table_ready(db: Session, table_name: str) -> bool:
+    """
+    Check a cache table exists (older databases may not have run its migration).
+    
+    Only positive results are remembered, so running the migration later takes
+    effect without a restart.
+    
+    Args:
+        db: Database session
+        table_name: Table to check
+    
+    Returns:
+        True if the table exists
+    """
+    if table_name in _ready_tables:
+        return True
+    try:
+        exists = inspect(db.get_bind()).has_table(table_name)
+    except Exception as e:
+        logger.warning("Could not check for table %s: %s", table_name, e)
+        return False
+    if exists:
+        _ready_tables.add(table_name)
+    return exists
 
 
 def get_forecast_cache(db: Session, project_id: str, current_activity_count: int, current_data_hash: Optional[str] = None) -> Optional[Dict]:
@@ -24,11 +158,9 @@ def get_forecast_cache(db: Session, project_id: str, current_activity_count: int
         Forecast dict if cache exists and is valid, None otherwise
     """
     try:
-        cache = db.query(ForecastCacheModel).filter(
-            ForecastCacheModel.project_id == project_id
-        ).first()
+        cache = _load_cache_row(db, project_id)
         
-        if not cache:
+        if not cache or cache.forecast is None:
             return None
         
         # Check activity count
@@ -36,34 +168,30 @@ def get_forecast_cache(db: Session, project_id: str, current_activity_count: int
             return None
         
         # Check data hash (automatic invalidation on CSV data changes)
-        if current_data_hash is None:
-            from .db_service import get_activities
-            from .logic_version import compute_data_hash
-            activities = get_activities(db, project_id)
-            if activities:
-                current_data_hash = compute_data_hash(activities)
+        # Rows without a stored hash are validated by activity count alone
+        if current_data_hash is None and cache.data_hash:
+            from .db_service import get_project_data_hash
+            current_data_hash = get_project_data_hash(db, project_id)
         
+        # A stale row is left in place - the caller recomputes and its save overwrites it
         if current_data_hash and cache.data_hash and cache.data_hash != current_data_hash:
-            print(f"[CACHE] Invalidating forecast cache for {project_id}: Data hash changed (data content modified)")
-            db.query(ForecastCacheModel).filter(
-                ForecastCacheModel.project_id == project_id
-            ).delete()
-            db.commit()
+            logger.info("Cache for %s is stale: data hash changed (data content modified)", project_id)
             return None
         
         # Cache is valid
+        forecast = cache.forecast
         return {
-            "p50": cache.p50,
-            "p80": cache.p80,
-            "p90": cache.p90,
-            "p95": cache.p95,
-            "current": cache.current,
-            "criticality_indices": cache.criticality_indices or {}
+            "p50": forecast.get("p50"),
+            "p80": forecast.get("p80"),
+            "p90": forecast.get("p90"),
+            "p95": forecast.get("p95"),
+            "current": forecast.get("current"),
+            "criticality_indices": forecast.get("criticality_indices") or {}
         }
     except Exception as e:
         # If table doesn't exist yet or schema mismatch, rollback and return None (graceful degradation)
         db.rollback()
-        print(f"[CACHE] Forecast cache table may not exist yet or schema mismatch: {e}")
+        logger.warning("Analysis cache table may not exist yet or schema mismatch: %s", e)
     
     return None
 
@@ -79,58 +207,94 @@ def save_forecast_cache(db: Session, project_id: str, forecast: Dict, activity_c
         activity_count: Number of activities when computed (for invalidation)
         data_hash: Hash of activity data when computed (optional, computed if not provided)
     """
-    try:
-        # Check if table exists
-        db.execute(text("SELECT 1 FROM forecast_cache LIMIT 1"))
-    except Exception:
+    if not cache_table_ready(db, "analysis_cache"):
         # Table doesn't exist - skip caching (graceful degradation)
-        print("[CACHE] Forecast cache table doesn't exist - skipping cache save")
+        logger.warning("Analysis cache table doesn't exist - skipping forecast cache save")
         return
     
     # Get data hash if not provided
     if data_hash is None:
-        from .logic_version import compute_data_hash
-        from .db_service import get_activities
-        activities = get_activities(db, project_id)
-        if activities:
-            data_hash = compute_data_hash(activities)
+        from .db_service import get_project_data_hash
+        data_hash = get_project_data_hash(db, project_id)
     
     try:
-        # Use upsert pattern (update if exists, insert if not)
-        existing = db.query(ForecastCacheModel).filter(
-            ForecastCacheModel.project_id == project_id
-        ).first()
-        
-        if existing:
-            existing.p50 = forecast.get("p50")
-            existing.p80 = forecast.get("p80")
-            existing.p90 = forecast.get("p90")
-            existing.p95 = forecast.get("p95")
-            existing.current = forecast.get("current", 0)
-            existing.criticality_indices = forecast.get("criticality_indices", {})
-            existing.activity_count = activity_count
-            existing.data_hash = data_hash
-        else:
-            cache = ForecastCacheModel(
-                project_id=project_id,
-                p50=forecast.get("p50"),
-                p80=forecast.get("p80"),
-                p90=forecast.get("p90"),
-                p95=forecast.get("p95"),
-                current=forecast.get("current", 0),
-                criticality_indices=forecast.get("criticality_indices", {}),
-                activity_count=activity_count,
-                data_hash=data_hash
-            )
-            db.add(cache)
-        
-        db.commit()
-    except Exception as e:
+        _save_cache_section(db, project_id, "forecast", {
+            "p50": forecast.get("p50"),
+            "p80": forecast.get("p80"),
+            "p90": forecast.get("p90"),
+            "p95": forecast.get("p95"),
+            "current": forecast.get("current", 0),
+            "criticality_indices": forecast.get("criticality_indices", {})
+        }, activity_count, data_hash)
+    except Exception:
         db.rollback()
-        print(f"[CACHE] Failed to save forecast cache: {e}")
+        logger.exception("Failed to save forecast cache for %s", project_id)
+
+
+# Per-project locks used to coalesce concurrent forecast recomputation. Bounded by the
+# TTL cache; an entry evicted while held only means a later request may compute in parallel
+_compute_locks = TTLCache(maxsize=1024, ttl=600)
+_compute_locks_guard = threading.Lock()
+
+
+def _project_lock(project_id: str) -> threading.Lock:
+    """Get (or create) the recomputation lock for a project"""
+    with _compute_locks_guard:
+        lock = _compute_locks.get(project_id)
+        if lock is None:
+            lock = threading.Lock()
+            _compute_locks.set(project_id, lock)
+        return lock
+
+
+def get_or_compute_forecast(
+    db: Session,
+    project_id: str,
+    activity_count: int,
+    compute_fn: Callable[[], Dict]
+) -> Tuple[Dict, bool]:
+    """
+    Get the cached forecast, or compute and cache it.
+    
+    OPTIMIZATION: Concurrent misses for the same project are coalesced - the first
+    request computes while the others wait on a per-project lock, then re-read the
+    cache instead of running the same simulation again.
+    
+    Args:
+        db: Database session
+        project_id: Project ID
+        activity_count: Current number of activities (for cache validation)
+        compute_fn: Computes the forecast on a miss
+    
+    Returns:
+        Tuple of (forecast, from_cache)
+    """
+    cached = get_forecast_cache(db, project_id, activity_count)
+    if cached:
+        return cached, True
+    
+    with _project_lock(project_id):
+        # Another request may have saved it while we waited - re-read past this session's memo
+        db.info.get(_SESSION_ROWS_KEY, {}).pop(project_id, None)
+        cached = get_forecast_cache(db, project_id, activity_count)
+        if cached:
+            return cached, True
+        
+        forecast = compute_fn()
+        save_forecast_cache(db, project_id, forecast, activity_count)
+        return forecast, False
+
 
+def _prediction_method(top_risks: List[Dict]) -> Optional[str]:
+    """Prediction method recorded on cached risks (all risks share the first one's method)"""
+    if top_risks and isinstance(top_risks, list) and isinstance(top_risks[0], dict):
+        risk_factors = top_risks[0].get("risk_factors", {})
+        if isinstance(risk_factors, dict):
+            return risk_factors.get("prediction_method", "rule")
+    return None
 
-def get_risks_cache(db: Session, project_id: str, current_activity_count: int, current_data_hash: Optional[str] = None) -> Optional[Dict]:
+
+def get_risks_cache(db: Session, project_id: str, current_activity_count: Optional[int] = None, current_data_hash: Optional[str] = None) -> Optional[Dict]:
     """
     Get cached risks for a project if it exists and is still valid.
     Automatically invalidates cache if logic version, data hash, or USE_ML_MODEL setting has changed.
@@ -138,85 +302,69 @@ def get_risks_cache(db: Session, project_id: str, current_activity_count: int, c
     Args:
         db: Database session
         project_id: Project ID
-        current_activity_count: Current number of activities (for cache invalidation)
+        current_activity_count: Current number of activities (optional). If not provided,
+            the count is validated against the activities loaded for the data hash check,
+            so callers can check the cache before loading activities themselves.
         current_data_hash: Current data hash (optional, computed if not provided)
     
     Returns:
         Risks dict with total_risks and top_risks if cache exists and is valid, None otherwise
     """
     try:
-        cache = db.query(RisksCacheModel).filter(
-            RisksCacheModel.project_id == project_id
-        ).first()
+        cache = _load_cache_row(db, project_id)
         
-        if not cache:
+        if not cache or cache.risks is None:
             return None
         
         # Check activity count
-        if cache.activity_count != current_activity_count:
+        if current_activity_count is not None and cache.activity_count != current_activity_count:
             return None
         
         # Check data hash (automatic invalidation on CSV data changes)
-        if current_data_hash is None:
-            from .db_service import get_activities
-            from .logic_version import compute_data_hash
-            activities = get_activities(db, project_id)
-            if activities:
-                current_data_hash = compute_data_hash(activities)
+        # Rows without a stored hash are validated by activity count alone
+        if current_data_hash is None and (cache.data_hash or current_activity_count is None):
+            from .db_service import get_activities, get_project_data_hash
+            activities = None
+            if current_activity_count is None:
+                # Count not supplied by caller - validate it against the loaded activities
+                activities = get_activities(db, project_id)
+                if cache.activity_count != len(activities):
+                    return None
+            if cache.data_hash:
+                current_data_hash = get_project_data_hash(db, project_id, activities)
         
+        # A stale row is left in place - the caller recomputes and its save overwrites it
         if current_data_hash and cache.data_hash and cache.data_hash != current_data_hash:
-            print(f"[CACHE] Invalidating risks cache for {project_id}: Data hash changed (data content modified)")
-            db.query(RisksCacheModel).filter(
-                RisksCacheModel.project_id == project_id
-            ).delete()
-            db.commit()
+            logger.info("Cache for %s is stale: data hash changed (data content modified)", project_id)
             return None
         
         # Check if model type matches current USE_ML_MODEL setting
-        from .config import USE_ML_MODEL
-        
-        # Extract prediction_method from cached risks to check model type
-        cached_top_risks = cache.top_risks or []
-        if cached_top_risks and isinstance(cached_top_risks, list) and len(cached_top_risks) > 0:
-            # Get prediction_method from first risk (all should be same)
-            first_risk = cached_top_risks[0]
-            if isinstance(first_risk, dict):
-                risk_factors = first_risk.get("risk_factors", {})
-                if isinstance(risk_factors, dict):
-                    cached_method = risk_factors.get("prediction_method", "rule")
-                    
-                    # Determine expected method based on current config
-                    # If USE_ML_MODEL=false, should be "rule"
-                    # If USE_ML_MODEL=true, should be "ml", "ensemble", or "ml_fallback"
-                    if USE_ML_MODEL:
-                        # ML enabled - cache should have ML-based method
-                        if cached_method == "rule":
-                            # Cache was computed with rule-based but now ML is enabled - invalidate
-                            print(f"[CACHE] Invalidating risks cache for {project_id}: ML model enabled but cache has rule-based results")
-                            db.query(RisksCacheModel).filter(
-                                RisksCacheModel.project_id == project_id
-                            ).delete()
-                            db.commit()
-                            return None
-                    else:
-                        # Rule-based enabled - cache should have rule-based method
-                        if cached_method in ["ml", "ensemble", "ml_fallback"]:
-                            # Cache was computed with ML but now rule-based is enabled - invalidate
-                            print(f"[CACHE] Invalidating risks cache for {project_id}: Rule-based model enabled but cache has ML results")
-                            db.query(RisksCacheModel).filter(
-                                RisksCacheModel.project_id == project_id
-                            ).delete()
-                            db.commit()
-                            return None
+        # If USE_ML_MODEL=false, should be "rule"
+        # If USE_ML_MODEL=true, should be "ml", "ensemble", or "ml_fallback"
+        cached_method = cache.prediction_method
+        if cached_method is not None:
+            if settings.use_ml_model and cached_method == "rule":
+                reason = "ML model enabled but cache has rule-based results"
+            elif not settings.use_ml_model and cached_method in _ML_PREDICTION_METHODS:
+                reason = "Rule-based model enabled but cache has ML results"
+            else:
+                reason = None
+            
+            if reason:
+                # Only the risks section depends on the model - saving recomputed risks
+                # overwrites it and its prediction_method, keeping forecast and anomalies
+                logger.info("Risks cache for %s is stale: %s", project_id, reason)
+                return None
         
-        # Cache is valid - return it
+        # Cache is valid - return it (copied, since callers annotate the risk dicts and
+        # the row is shared by every getter in the session)
         return {
-            "total_risks": cache.total_risks,
-            "top_risks": cached_top_risks
+            "total_risks": cache.risks.get("total_risks", 0),
+            "top_risks": copy.deepcopy(cache.risks.get("top_risks") or [])
         }
     except Exception as e:
         # If table doesn't exist yet, return None (graceful degradation)
-        print(f"[CACHE] Risks cache table may not exist yet: {e}")
+        logger.warning("Analysis cache table may not exist yet: %s", e)
     
     return None
 
@@ -232,47 +380,25 @@ def save_risks_cache(db: Session, project_id: str, risks_data: Dict, activity_co
         activity_count: Number of activities when computed (for invalidation)
         data_hash: Hash of activity data when computed (optional, computed if not provided)
     """
-    try:
-        # Check if table exists
-        db.execute(text("SELECT 1 FROM risks_cache LIMIT 1"))
-    except Exception:
+    if not cache_table_ready(db, "analysis_cache"):
         # Table doesn't exist - skip caching (graceful degradation)
-        print("[CACHE] Risks cache table doesn't exist - skipping cache save")
+        logger.warning("Analysis cache table doesn't exist - skipping risks cache save")
         return
     
     # Get data hash if not provided
     if data_hash is None:
-        from .logic_version import compute_data_hash
-        from .db_service import get_activities
-        activities = get_activities(db, project_id)
-        if activities:
-            data_hash = compute_data_hash(activities)
+        from .db_service import get_project_data_hash
+        data_hash = get_project_data_hash(db, project_id)
     
     try:
-        # Use upsert pattern
-        existing = db.query(RisksCacheModel).filter(
-            RisksCacheModel.project_id == project_id
-        ).first()
-        
-        if existing:
-            existing.total_risks = risks_data.get("total_risks", 0)
-            existing.top_risks = risks_data.get("top_risks", [])
-            existing.activity_count = activity_count
-            existing.data_hash = data_hash
-        else:
-            cache = RisksCacheModel(
-                project_id=project_id,
-                total_risks=risks_data.get("total_risks", 0),
-                top_risks=risks_data.get("top_risks", []),
-                activity_count=activity_count,
-                data_hash=data_hash
-            )
-            db.add(cache)
-        
-        db.commit()
-    except Exception as e:
+        top_risks = risks_data.get("top_risks", [])
+        _save_cache_section(db, project_id, "risks", {
+            "total_risks": risks_data.get("total_risks", 0),
+            "top_risks": top_risks
+        }, activity_count, data_hash, prediction_method=_prediction_method(top_risks))
+    except Exception:
         db.rollback()
-        print(f"[CACHE] Failed to save risks cache: {e}")
+        logger.exception("Failed to save risks cache for %s", project_id)
 
 
 def get_anomalies_cache(db: Session, project_id: str, current_activity_count: int, current_data_hash: Optional[str] = None) -> Optional[Dict]:
@@ -290,11 +416,9 @@ def get_anomalies_cache(db: Session, project_id: str, current_activity_count: in
         Anomalies dict if cache exists and is valid, None otherwise
     """
     try:
-        cache = db.query(AnomaliesCacheModel).filter(
-            AnomaliesCacheModel.project_id == project_id
-        ).first()
+        cache = _load_cache_row(db, project_id)
         
-        if not cache:
+        if not cache or cache.anomalies is None:
             return None
         
         # Check activity count
@@ -302,30 +426,26 @@ def get_anomalies_cache(db: Session, project_id: str, current_activity_count: in
             return None
         
         # Check data hash (automatic invalidation on CSV data changes)
-        if current_data_hash is None:
-            from .db_service import get_activities
-            from .logic_version import compute_data_hash
-            activities = get_activities(db, project_id)
-            if activities:
-                current_data_hash = compute_data_hash(activities)
+        # Rows without a stored hash are validated by activity count alone
+        if current_data_hash is None and cache.data_hash:
+            from .db_service import get_project_data_hash
+            current_data_hash = get_project_data_hash(db, project_id)
         
+        # A stale row is left in place - the caller recomputes and its save overwrites it
         if current_data_hash and cache.data_hash and cache.data_hash != current_data_hash:
-            print(f"[CACHE] Invalidating anomalies cache for {project_id}: Data hash changed (data content modified)")
-            db.query(AnomaliesCacheModel).filter(
-                AnomaliesCacheModel.project_id == project_id
-            ).delete()
-            db.commit()
+            logger.info("Cache for %s is stale: data hash changed (data content modified)", project_id)
             return None
         
         # Cache is valid
+        anomalies = cache.anomalies
         return {
-            "zombie_tasks": cache.zombie_tasks or [],
-            "black_holes": cache.black_holes or [],
-            "total_anomalies": cache.total_anomalies
+            "zombie_tasks": anomalies.get("zombie_tasks") or [],
+            "black_holes": anomalies.get("black_holes") or [],
+            "total_anomalies": anomalies.get("total_anomalies", 0)
         }
     except Exception as e:
         # If table doesn't exist yet, return None (graceful degradation)
-        print(f"[CACHE] Anomalies cache table may not exist yet: {e}")
+        logger.warning("Analysis cache table may not exist yet: %s", e)
     
     return None
 
@@ -341,49 +461,25 @@ def save_anomalies_cache(db: Session, project_id: str, anomalies: Dict, activity
         activity_count: Number of activities when computed (for invalidation)
         data_hash: Hash of activity data when computed (optional, computed if not provided)
     """
-    try:
-        # Check if table exists
-        db.execute(text("SELECT 1 FROM anomalies_cache LIMIT 1"))
-    except Exception:
+    if not cache_table_ready(db, "analysis_cache"):
         # Table doesn't exist - skip caching (graceful degradation)
-        print("[CACHE] Anomalies cache table doesn't exist - skipping cache save")
+        logger.warning("Analysis cache table doesn't exist - skipping anomalies cache save")
         return
     
     # Get data hash if not provided
     if data_hash is None:
-        from .logic_version import compute_data_hash
-        from .db_service import get_activities
-        activities = get_activities(db, project_id)
-        if activities:
-            data_hash = compute_data_hash(activities)
+        from .db_service import get_project_data_hash
+        data_hash = get_project_data_hash(db, project_id)
     
     try:
-        # Use upsert pattern
-        existing = db.query(AnomaliesCacheModel).filter(
-            AnomaliesCacheModel.project_id == project_id
-        ).first()
-        
-        if existing:
-            existing.zombie_tasks = anomalies.get("zombie_tasks", [])
-            existing.black_holes = anomalies.get("black_holes", [])
-            existing.total_anomalies = anomalies.get("total_anomalies", 0)
-            existing.activity_count = activity_count
-            existing.data_hash = data_hash
-        else:
-            cache = AnomaliesCacheModel(
-                project_id=project_id,
-                zombie_tasks=anomalies.get("zombie_tasks", []),
-                black_holes=anomalies.get("black_holes", []),
-                total_anomalies=anomalies.get("total_anomalies", 0),
-                activity_count=activity_count,
-                data_hash=data_hash
-            )
-            db.add(cache)
-        
-        db.commit()
-    except Exception as e:
+        _save_cache_section(db, project_id, "anomalies", {
+            "zombie_tasks": anomalies.get("zombie_tasks", []),
+            "black_holes": anomalies.get("black_holes", []),
+            "total_anomalies": anomalies.get("total_anomalies", 0)
+        }, activity_count, data_hash)
+    except Exception:
         db.rollback()
-        print(f"[CACHE] Failed to save anomalies cache: {e}")
+        logger.exception("Failed to save anomalies cache for %s", project_id)
 
 
 def invalidate_project_cache(db: Session, project_id: str):
@@ -395,23 +491,7 @@ def invalidate_project_cache(db: Session, project_id: str):
         project_id: Project ID
     """
     try:
-        # Delete forecast cache
-        db.query(ForecastCacheModel).filter(
-            ForecastCacheModel.project_id == project_id
-        ).delete()
-        
-        # Delete risks cache
-        db.query(RisksCacheModel).filter(
-            RisksCacheModel.project_id == project_id
-        ).delete()
-        
-        # Delete anomalies cache
-        db.query(AnomaliesCacheModel).filter(
-            AnomaliesCacheModel.project_id == project_id
-        ).delete()
-        
-        db.commit()
+        _delete_cache_row(db, project_id)
     except Exception as e:
         db.rollback()
-        print(f"[CACHE] Failed to invalidate cache (tables may not exist): {e}")
-
+        logger.warning("Failed to invalidate cache for %s (table may not exist): %s", project_id, e)
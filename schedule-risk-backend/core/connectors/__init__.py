@@ -7,21 +7,23 @@ maintaining a consistent interface and data model.
 """
 
 from .base import BaseConnector, ConnectorConfig, ConnectorResult
-from .registry import ConnectorRegistry, get_connector
+from .registry import ConnectorKind, ConnectorRegistry, get_connector
 from .validators import ActivityValidator, ValidationError
 
 # Import and register built-in connectors
 from .csv_connector import CSVConnector
 from .rest_api_connector import RESTAPIConnector
 
-# Register built-in connectors
-ConnectorRegistry.register("csv", CSVConnector)
-ConnectorRegistry.register("rest_api", RESTAPIConnector)
+# Register built-in connectors, then make the registry read-only
+ConnectorRegistry.register(ConnectorKind.CSV, CSVConnector)
+ConnectorRegistry.register(ConnectorKind.REST_API, RESTAPIConnector)
+ConnectorRegistry.freeze()
 
 __all__ = [
     "BaseConnector",
     "ConnectorConfig",
     "ConnectorResult",
+    "ConnectorKind",
     "ConnectorRegistry",
     "get_connector",
     "ActivityValidator",
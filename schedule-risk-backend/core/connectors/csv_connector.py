@@ -4,10 +4,382 @@ Refactored to use the BaseConnector interface.
 """
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 from .base import BaseConnector, ConnectorConfig, ConnectorResult
+from core.config import CSV_PARSE_CACHE_MAX_ACTIVITIES, CSV_PARSE_CACHE_TTL
 from core.models import Activity
+from core.ttl_cache import TTLCache
+
+
+# Accepted column names per Activity field, in priority order (first present column wins)
+FIELD_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "percent_complete": ("Percent_Complete", "Percent Complete", "percent_complete", "PercentComplete", "% Complete", "%_Complete"),
+    "early_start": ("ES", "Early_Start", "Early Start", "early_start"),
+    "early_finish": ("EF", "Early_Finish", "Early Finish", "early_finish"),
+    "late_start": ("LS", "Late_Start", "Late Start", "late_start"),
+    "late_finish": ("LF", "Late_Finish", "Late Finish", "late_finish"),
+    "activity_id": ("Activity_ID", "Activity ID", "activity_id", "ActivityID", "ID", "Id", "id"),
+    "name": ("Activity_Name", "Activity Name", "activity_name", "ActivityName", "Name", "name", "Task_Name", "Task Name"),
+    "planned_start": ("Planned_Start", "Planned Start", "planned_start", "PlannedStart"),
+    "planned_finish": ("Planned_Finish", "Planned Finish", "planned_finish", "PlannedFinish"),
+    "planned_duration": ("Planned_Duration", "Planned Duration", "planned_duration", "PlannedDuration"),
+    # Baseline fields - try Baseline 1 first, then fallback to Baseline
+    "baseline_start": (
+        "Baseline 1 Start", "Baseline_1_Start", "Baseline_Start", "Baseline Start",
+        "baseline_start", "BaselineStart", "Baseline1Start"
+    ),
+    "baseline_finish": (
+        "Baseline 1 Finish", "Baseline_1_Finish", "Baseline_Finish", "Baseline Finish",
+        "baseline_finish", "BaselineFinish", "Baseline1Finish"
+    ),
+    "baseline_duration": (
+        "Baseline 1 Duration", "Baseline_1_Duration", "Baseline_Duration", "Baseline Duration",
+        "baseline_duration", "BaselineDuration", "Baseline1Duration"
+    ),
+    "actual_start": ("Actual_Start", "Actual Start", "actual_start", "ActualStart"),
+    "actual_finish": ("Actual_Finish", "Actual Finish", "actual_finish", "ActualFinish"),
+    "remaining_duration": ("Remaining_Duration", "Remaining Duration", "remaining_duration", "RemainingDuration"),
+    "total_float": ("Total_Float", "Total Float", "total_float", "TotalFloat", "Float", "float"),
+    "risk_probability": (
+        "Risk Impact Probability", "Risk_Impact_Probability", "Probability_%", "Probability %",
+        "probability", "Probability", "Risk_Probability", "Risk Probability"
+    ),
+    "risk_delay_impact_days": (
+        "Risk Impact Delay", "Risk_Impact_Delay", "Delay_Impact_days", "Delay Impact days",
+        "Delay_Impact", "Delay Impact", "delay_impact_days"
+    ),
+    "cost_impact_of_risk": (
+        "Risk Cost Impact", "Risk_Cost_Impact", "Cost_Impact_of_Risk", "Cost Impact of Risk",
+        "cost_impact_of_risk", "CostImpact"
+    ),
+    # Cost fields for Forensic Intelligence (CPI Engine)
+    "planned_cost": ("Planned_Cost", "Planned Cost", "planned_cost", "PlannedCost", "Budget"),
+    "actual_cost_to_date": (
+        "Actual_Cost_To_Date", "Actual Cost To Date", "actual_cost_to_date",
+        "ActualCostToDate", "Actual Cost", "Actual_Cost"
+    ),
+    # Dependency fields - handle both "Predecessors" and "Predecessor_ID" formats
+    "predecessors": ("Predecessors", "Predecessor_ID", "Predecessor ID", "predecessors", "Predecessor", "predecessor_id"),
+    "successors": ("Successors", "Successor_ID", "Successor ID", "successors", "Successor", "successor_id"),
+    "on_critical_path": (
+        "On Critical Path", "On_Critical_Path", "on_critical_path", "OnCriticalPath",
+        "Critical Path", "critical_path", "Is_Critical", "Is Critical"
+    ),
+    # Resource fields - handle "Resource 1" format
+    "resource_id": (
+        "Resource 1", "Resource_1", "Resource_ID", "Resource ID", "resource_id",
+        "Resource", "resource", "ResourceID"
+    ),
+    "role": (
+        "Resource 1 Role", "Resource_1_Role", "Role", "role", "ResourceRole",
+        "Resource Role", "Resource_Role"
+    ),
+    "fte_allocation": (
+        "Resource 1 FTE Allocation", "Resource_1_FTE_Allocation", "FTE_Allocation",
+        "FTE Allocation", "fte_allocation", "FTEAllocation", "FTE"
+    ),
+    "resource_max_fte": (
+        "Resource_Max_FTE", "Resource Max FTE", "resource_max_fte", "MaxFTE",
+        "Resource 1 Max FTE", "Resource_1_Max_FTE"
+    ),
+    "skill_tags": (
+        "Resource_Skill_Tags", "Resource Skill Tags", "Skill_Tags", "Skill Tags",
+        "skill_tags", "Skills", "skills"
+    ),
+}
+
+# Fields every row must have, with their description for error messages
+REQUIRED_FIELDS = (("activity_id", "activity ID"), ("name", "activity name"))
+
+# Fields read as text: skips type sniffing, and keeps IDs like "001" or "7" (which
+# numeric inference turned into 1 or, in a column with blanks, "7.0") as written
+TEXT_FIELDS = (
+    "activity_id", "name", "early_start", "early_finish", "late_start", "late_finish",
+    "planned_start", "planned_finish", "baseline_start", "baseline_finish", "actual_start",
+    "actual_finish", "predecessors", "successors", "resource_id", "role", "skill_tags",
+)
+
+
+def _normalize_column(name) -> str:
+    return str(name).strip().lower().replace(" ", "_")
+
+
+def resolve_columns(columns: Iterable[str], field_columns: Dict[str, Tuple[str, ...]]) -> Dict[str, Optional[str]]:
+    """
+    Resolve each field to the first of its accepted column names present in the CSV.
+    
+    Names are matched case- and space-insensitively ("Activity ID" matches "activity_id")
+    through a lookup table built once per file, so callers resolve columns once up front
+    rather than testing every alias against every row.
+    
+    Args:
+        columns: CSV column names
+        field_columns: Accepted column names per field, in priority order
+        
+    Returns:
+        Dict of field -> actual column name (None if no accepted name is present)
+    """
+    lookup = {}
+    for column in columns:
+        # An exact spelling wins over another column that only normalizes the same
+        lookup.setdefault(column, column)
+        lookup.setdefault(_normalize_column(column), column)
+    
+    resolved = {}
+    for field, names in field_columns.items():
+        resolved[field] = None
+        for name in names:
+            column = lookup.get(name) or lookup.get(_normalize_column(name))
+            if column is not None:
+                resolved[field] = column
+                break
+    return resolved
+
+
+# Rows parsed per chunk: peak memory follows the chunk, not the file
+CHUNK_ROWS = 8192
+
+
+def _read_activity_header(file_path: str) -> Tuple[pd.Index, Dict[str, Optional[str]]]:
+    """
+    Read an activity CSV's header and resolve each field's column.
+    
+    Returns:
+        Tuple of (header columns, resolved column name per field)
+    """
+    header = pd.read_csv(file_path, nrows=0).columns
+    return header, resolve_columns(header, FIELD_COLUMNS)
+
+
+def _open_activity_csv(file_path: str, columns: Dict[str, Optional[str]], chunksize: int = CHUNK_ROWS):
+    """
+    Open an activity CSV as a chunked reader, with its text columns typed explicitly.
+    
+    (The pyarrow engine cannot read in chunks, so this uses the default C parser.)
+    
+    Args:
+        file_path: CSV file path
+        columns: Resolved column name per field (from _read_activity_header)
+        chunksize: Rows per chunk
+        
+    Returns:
+        TextFileReader yielding DataFrames of up to chunksize rows
+    """
+    dtype = {columns[field]: str for field in TEXT_FIELDS if columns[field] is not None}
+    return pd.read_csv(file_path, dtype=dtype, chunksize=chunksize)
+
+
+# Per-cell helpers below take a cell that is known not to be NaN: the column parsers
+# further down compute each column's NaN mask once (Series.isna) and only call them
+# for present cells, instead of a scalar pd.isna dispatch per cell.
+
+def _clean_string_value(value):
+    if isinstance(value, str):
+        value = value.strip()
+        if value == "":
+            return None
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    return str(value) if value else None
+
+
+def _parse_bool_value(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in ('true', '1', 'yes', 'y', 'on'):
+            return True
+        if value in ('false', '0', 'no', 'n', 'off', ''):
+            return False
+    return False
+
+
+def _parse_percent_value(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if value.endswith('%'):
+            value = value[:-1].strip()
+        try:
+            parsed = float(value)
+            if parsed > 1.0:
+                return parsed
+            else:
+                return parsed * 100.0
+        except (ValueError, TypeError):
+            return 0.0
+    return 0.0
+
+
+def scale_probability(value):
+    """
+    Normalize a parsed risk probability to the 0-1 range (shared with core.csv_connector).
+    
+    Values above 1 are taken as percentages and divided by 100; values of 1 or less
+    are already fractions and returned unchanged.
+    """
+    if value > 1:
+        return value / 100
+    return value
+
+
+def _map_present(values: pd.Series, parse, missing) -> List:
+    """
+    parse() each present cell of a column; NaN cells become missing.
+    
+    OPTIMIZATION: One vectorized isna() per column instead of pd.isna() per cell.
+    """
+    if not values.hasnans:
+        return [parse(value) for value in values.tolist()]
+    return [
+        missing if is_missing else parse(value)
+        for value, is_missing in zip(values.tolist(), values.isna().tolist())
+    ]
+
+
+def _clean_column(values: pd.Series) -> List:
+    """Cell values with NaN as None (optional numeric fields)"""
+    if not values.hasnans:
+        return values.tolist()
+    return [
+        None if is_missing else value
+        for value, is_missing in zip(values.tolist(), values.isna().tolist())
+    ]
+
+
+def _default_column(default):
+    """Column parser giving cell values with NaN as default"""
+    def parse(values: pd.Series) -> List:
+        if not values.hasnans:
+            return values.tolist()
+        return [
+            default if is_missing else value
+            for value, is_missing in zip(values.tolist(), values.isna().tolist())
+        ]
+    return parse
+
+
+def _clean_string_column(values: pd.Series) -> List[Optional[str]]:
+    """_clean_string_value over a whole column (blank and NaN cells -> None)"""
+    return _map_present(values, _clean_string_value, None)
+
+
+def _parse_percent_column(values: pd.Series) -> List[float]:
+    """_parse_percent_value over a whole column"""
+    if is_numeric_dtype(values):
+        return values.astype(float).fillna(0.0).tolist()
+    # Text ("75%", "0.5") - pandas .str methods loop in Python anyway, so plain calls are faster
+    return _map_present(values, _parse_percent_value, 0.0)
+
+
+def _parse_bool_column(values: pd.Series) -> List[bool]:
+    """_parse_bool_value over a whole column"""
+    if is_numeric_dtype(values):
+        return (values.fillna(0) != 0).tolist()
+    return _map_present(values, _parse_bool_value, False)
+
+
+def _scale_probability_column(values: pd.Series) -> List:
+    """
+    scale_probability over a whole column. Text cells are left as-is for the row to
+    scale, so they still fail (as a row error) the way they always have.
+    """
+    if is_numeric_dtype(values):
+        numbers = values.fillna(0)
+        return numbers.where(~(numbers > 1), numbers / 100).tolist()
+    return _map_present(
+        values, lambda value: value if isinstance(value, str) else scale_probability(value), 0
+    )
+
+
+def _split_ids_column(values: pd.Series) -> List[List[str]]:
+    """
+    Dependency IDs per row: split on ';', stripped, blanks dropped.
+    
+    (The old comma fallback only ran when the ';' split found nothing, i.e. for cells of
+    just ';' and whitespace, where a ',' split finds nothing either - so it is gone.)
+    """
+    return [
+        [part for part in map(str.strip, text.split(";")) if part] if text else []
+        for text in _clean_string_column(values)
+    ]
+
+
+# Column parser per field, with a factory for the value that fills a missing column.
+# Every field is cleaned by column_lists, so rows need no NaN checks.
+_COLUMN_PARSERS = {
+    "percent_complete": (_parse_percent_column, float),
+    "on_critical_path": (_parse_bool_column, bool),
+    "risk_probability": (_scale_probability_column, int),
+    "predecessors": (_split_ids_column, list),
+    "successors": (_split_ids_column, list),
+    "total_float": (_default_column(0.0), float),
+    "risk_delay_impact_days": (_default_column(0), int),
+    "fte_allocation": (_default_column(0.0), float),
+    "resource_max_fte": (_default_column(1.0), lambda: 1.0),
+}
+# Other text fields are stripped strings or None; the rest (optional numbers) NaN -> None
+for _field in TEXT_FIELDS:
+    _COLUMN_PARSERS.setdefault(_field, (_clean_string_column, lambda: None))
+
+
+def column_lists(df: pd.DataFrame, columns: Dict[str, Optional[str]]) -> Dict[str, list]:
+    """
+    Extract every field of an activity CSV as a list with one cleaned value per row.
+    
+    OPTIMIZATION: Whole columns are pulled out with tolist() (native scalars) so callers
+    walk rows positionally - no per-row Series - and every field is cleaned here for the
+    whole column, with one NaN mask per column (NumPy arithmetic when the column is
+    numeric). Text fields come out stripped with blanks as None, optional numbers with
+    NaN as None, and missing columns as the field's empty value.
+    
+    Args:
+        df: CSV data
+        columns: Resolved column name per field (from resolve_columns)
+        
+    Returns:
+        Dict of field -> list of per-row values
+    """
+    length = len(df)
+    lists = {}
+    for field, column in columns.items():
+        parse, empty = _COLUMN_PARSERS.get(field, (_clean_column, lambda: None))
+        if column is None:
+            lists[field] = [empty() for _ in range(length)]
+        else:
+            lists[field] = parse(df[column])
+    return lists
+
+
+# Successful loads per (file, mtime, size, load settings) - see CSVConnector.load_activities
+_parse_cache = TTLCache(maxsize=16, ttl=CSV_PARSE_CACHE_TTL)
+
+
+def _copy_result(result: ConnectorResult) -> ConnectorResult:
+    """Fresh result lists/dicts around the (shared) cached Activity objects"""
+    return ConnectorResult(
+        success=result.success,
+        activities=list(result.activities),
+        metadata=dict(result.metadata),
+        errors=list(result.errors) or None,
+        warnings=list(result.warnings) or None
+    )
+
+
+def _has_more_rows(reader) -> bool:
+    """Whether a chunked reader has rows left (reads at most one more)"""
+    try:
+        return not reader.get_chunk(1).empty
+    except StopIteration:
+        return False
 
 
 class CSVConnector(BaseConnector):
@@ -18,13 +390,40 @@ class CSVConnector(BaseConnector):
     now implementing the BaseConnector interface for consistency.
     """
     
+    def __init__(self, config: ConnectorConfig):
+        super().__init__(config)
+        # ((path, mtime, size), header, resolved columns) of the last file read
+        self._header_cache: Optional[Tuple[tuple, pd.Index, Dict[str, Optional[str]]]] = None
+        # os.stat of the file from the last connect()
+        self._file_stat: Optional[os.stat_result] = None
+    
+    def _resolve_header(self, file_path: str, stat: os.stat_result) -> Tuple[pd.Index, Dict[str, Optional[str]]]:
+        """
+        Header and resolved columns of the CSV file.
+        
+        OPTIMIZATION: Cached per instance while the file's mtime and size are unchanged,
+        so repeated loads of the same file through one connector skip re-resolution.
+        """
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        cached = self._header_cache
+        if cached is None or cached[0] != key:
+            cached = self._header_cache = (key, *_read_activity_header(file_path))
+        return cached[1], cached[2]
+    
     def connect(self) -> bool:
-        """CSV files don't require active connection"""
+        """
+        CSV files don't require active connection - just check the file exists.
+        
+        OPTIMIZATION: One os.stat, kept in self._file_stat for load_activities (cache
+        keys), instead of os.path.exists here and another stat afterwards.
+        """
         file_path = self.config.connection_params.get("file_path")
         if not file_path:
             raise ValueError("file_path is required in connection_params")
         
-        if not os.path.exists(file_path):
+        try:
+            self._file_stat = os.stat(file_path)
+        except OSError:
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         
         return True
@@ -53,9 +452,22 @@ class CSVConnector(BaseConnector):
             
             file_path = self.config.connection_params["file_path"]
             
-            # Load CSV
+            # OPTIMIZATION: An unchanged file (same mtime and size) loaded with the same
+            # settings returns the previous result instead of being parsed again
+            stat = self._file_stat
+            config = self.config
+            cache_key = (
+                file_path, stat.st_mtime_ns, stat.st_size, config.validate_data,
+                config.sanitize_input, config.max_activities, tuple(config.allowed_fields or ())
+            )
+            cached = _parse_cache.get(cache_key)
+            if cached is not None:
+                return _copy_result(cached)
+            
+            # Open CSV (header only - rows are parsed chunk by chunk below)
             try:
-                df = pd.read_csv(file_path)
+                header, columns = self._resolve_header(file_path, stat)
+                reader = _open_activity_csv(file_path, columns)
             except Exception as e:
                 return ConnectorResult(
                     success=False,
@@ -63,39 +475,77 @@ class CSVConnector(BaseConnector):
                     errors=[f"Failed to read CSV file: {str(e)}"]
                 )
             
-            # Convert to activities
+            # Every field's column was resolved once from the header, instead of per cell
+            for field, description in REQUIRED_FIELDS:
+                if columns[field] is None:
+                    reader.close()
+                    return ConnectorResult(
+                        success=False,
+                        activities=[],
+                        errors=[
+                            f"Required {description} column not found. "
+                            f"Expected one of: {', '.join(FIELD_COLUMNS[field])}. "
+                            f"Available columns: {', '.join(map(str, header))}"
+                        ]
+                    )
+            
+            # OPTIMIZATION: Parse, convert and validate CHUNK_ROWS rows at a time and stop
+            # once max_activities valid activities are in hand - peak memory is one chunk
+            # plus the result, and rows past the limit are never parsed
+            max_activities = self.config.max_activities
             activities = []
-            for idx, row in df.iterrows():
-                try:
-                    activity = self._row_to_activity(row, project_id)
-                    # Sanitize
-                    activity = self.sanitize_activity(activity)
-                    activities.append(activity)
-                except Exception as e:
-                    errors.append(f"Row {idx + 1}: {str(e)}")
-                    continue
+            validation_errors = []
+            chunks_read = []
+            row_offset = 0
+            truncated = False
+            try:
+                with reader:
+                    for df in reader:
+                        chunks_read.append(len(df))
+                        activities.extend(self._chunk_to_activities(
+                            df, columns, project_id, row_offset, errors, validation_errors
+                        ))
+                        row_offset += len(df)
+                        if len(activities) >= max_activities:
+                            truncated = len(activities) > max_activities or _has_more_rows(reader)
+                            break
+            except Exception as e:
+                return ConnectorResult(
+                    success=False,
+                    activities=[],
+                    errors=[f"Failed to read CSV file: {str(e)}"]
+                )
+            
+            # Row errors first, then validation errors (as when the file was read whole)
+            errors.extend(validation_errors)
             
-            # Validate activities
-            if self.config.validate_data:
-                valid_activities, validation_errors = self.validate_activities(activities)
-                errors.extend(validation_errors)
-                activities = valid_activities
+            if truncated:
+                del activities[max_activities:]
+                warnings.append(
+                    f"Stopped at max_activities ({max_activities}); "
+                    "remaining rows were not loaded"
+                )
             
             metadata = {
                 "source": "csv",
                 "file_path": file_path,
-                "total_rows": len(df),
+                "total_rows": row_offset,
                 "valid_activities": len(activities),
-                "invalid_rows": len(errors)
+                "invalid_rows": len(errors),
+                "chunks_read": chunks_read
             }
             
-            return ConnectorResult(
+            result = ConnectorResult(
                 success=len(errors) == 0 or len(activities) > 0,
                 activities=activities,
                 metadata=metadata,
                 errors=errors if errors else None,
                 warnings=warnings if warnings else None
             )
+            if result.success and len(activities) <= CSV_PARSE_CACHE_MAX_ACTIVITIES:
+                _parse_cache.set(cache_key, result)
+                return _copy_result(result)
+            return result
             
         except Exception as e:
             return ConnectorResult(
@@ -104,6 +554,35 @@ class CSVConnector(BaseConnector):
                 errors=[f"Unexpected error: {str(e)}"]
             )
     
+    @classmethod
+    def load_many(cls, configs: List[ConnectorConfig], project_ids: List[str]) -> List[ConnectorResult]:
+        """
+        Load several CSV files (one project each) concurrently.
+        
+        OPTIMIZATION: The C parser releases the GIL while tokenizing, and so do the
+        NumPy column passes, so loads on a thread pool overlap file I/O and parsing.
+        A single file is loaded on the calling thread.
+        
+        Args:
+            configs: One ConnectorConfig per file
+            project_ids: Project ID per config
+            
+        Returns:
+            ConnectorResult per config, in the same order
+            
+        Raises:
+            ValueError: If configs and project_ids differ in length
+        """
+        if len(configs) != len(project_ids):
+            raise ValueError("configs and project_ids must have the same length")
+        if len(configs) <= 1:
+            return [cls(config).load_activities(pid) for config, pid in zip(configs, project_ids)]
+        
+        with ThreadPoolExecutor(max_workers=min(len(configs), os.cpu_count() or 1)) as executor:
+            return list(executor.map(
+                lambda config, pid: cls(config).load_activities(pid), configs, project_ids
+            ))
+    
     def test_connection(self) -> dict:
         """Test CSV file accessibility"""
         try:
@@ -114,7 +593,9 @@ class CSVConnector(BaseConnector):
                     "error": "file_path not provided"
                 }
             
-            if not os.path.exists(file_path):
+            try:
+                self._file_stat = os.stat(file_path)
+            except OSError:
                 return {
                     "success": False,
                     "error": f"File not found: {file_path}"
@@ -135,275 +616,98 @@ class CSVConnector(BaseConnector):
                 "error": str(e)
             }
     
-    def _row_to_activity(self, row: pd.Series, project_id: str) -> Activity:
-        """Convert CSV row to Activity model (reusing original logic)"""
-        # Helper functions (same as original csv_connector)
-        def _clean_value(value):
-            if pd.isna(value):
-                return None
-            return value
-        
-        def _clean_string_value(value):
-            if pd.isna(value) or value is None:
-                return None
-            if isinstance(value, (int, float)):
-                return str(value)
-            if isinstance(value, str):
-                value = value.strip()
-                if value == "":
-                    return None
-                return value
-            return str(value) if value else None
-        
-        def _get_column_value(row, possible_names, default=0):
-            for name in possible_names:
-                if name in row.index:
-                    value = row[name]
-                    if pd.isna(value):
-                        return default
-                    return value
-            return default
-        
-        def _get_string_column_value(row, possible_names):
-            for name in possible_names:
-                if name in row.index:
-                    return _clean_string_value(row[name])
-            return None
+    def _chunk_to_activities(
+        self,
+        df: pd.DataFrame,
+        columns: Dict[str, Optional[str]],
+        project_id: str,
+        row_offset: int,
+        errors: List[str],
+        validation_errors: List[str]
+    ) -> List[Activity]:
+        """
+        Convert (and, if configured, validate) one chunk of CSV rows.
         
-        def _get_required_string_column_value(row, possible_names, column_description="column"):
-            """Get required string value from row using multiple possible column names, raises error if not found"""
-            for name in possible_names:
-                if name in row.index:
-                    value = _clean_string_value(row[name])
-                    if value is None or value == "":
-                        raise ValueError(f"Required {column_description} column found ('{name}') but value is empty")
-                    return value
+        Args:
+            df: Chunk of CSV data
+            columns: Resolved column name per field
+            project_id: Project ID
+            row_offset: Rows read before this chunk (row numbers in errors count from the file start)
+            errors: Row conversion errors are appended here
+            validation_errors: Validation errors are appended here
             
-            # If not found, provide helpful error message with available columns
-            available_columns = list(row.index)
-            raise ValueError(
-                f"Required {column_description} column not found. "
-                f"Expected one of: {', '.join(possible_names)}. "
-                f"Available columns: {', '.join(available_columns)}"
-            )
-        
-        def _parse_bool_value(value):
-            if pd.isna(value) or value is None:
-                return False
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, (int, float)):
-                return bool(value)
-            if isinstance(value, str):
-                value = value.strip().lower()
-                if value in ('true', '1', 'yes', 'y', 'on'):
-                    return True
-                if value in ('false', '0', 'no', 'n', 'off', ''):
-                    return False
-            return False
-        
-        def _parse_percent_value(value):
-            if pd.isna(value) or value is None:
-                return 0.0
-            if isinstance(value, (int, float)):
-                return float(value)
-            if isinstance(value, str):
-                value = value.strip()
-                if value.endswith('%'):
-                    value = value[:-1].strip()
-                try:
-                    parsed = float(value)
-                    if parsed > 1.0:
-                        return parsed
-                    else:
-                        return parsed * 100.0
-                except (ValueError, TypeError):
-                    return 0.0
-            return 0.0
-        
-        # Parse percent complete
-        percent_complete_raw = _get_column_value(
-            row,
-            ["Percent_Complete", "Percent Complete", "percent_complete", "PercentComplete", "% Complete", "%_Complete"],
-            0
-        )
-        percent_complete = _parse_percent_value(percent_complete_raw)
-        
-        # Get schedule analysis fields
-        early_start = _get_string_column_value(row, ["ES", "Early_Start", "Early Start", "early_start"])
-        early_finish = _get_string_column_value(row, ["EF", "Early_Finish", "Early Finish", "early_finish"])
-        late_start = _get_string_column_value(row, ["LS", "Late_Start", "Late Start", "late_start"])
-        late_finish = _get_string_column_value(row, ["LF", "Late_Finish", "Late Finish", "late_finish"])
-        
-        # Get required fields with flexible column name matching
-        activity_id = _get_required_string_column_value(
-            row,
-            ["Activity_ID", "Activity ID", "activity_id", "ActivityID", "ID", "Id", "id"],
-            "activity ID"
-        )
-        name = _get_required_string_column_value(
-            row,
-            ["Activity_Name", "Activity Name", "activity_name", "ActivityName", "Name", "name", "Task_Name", "Task Name"],
-            "activity name"
-        )
-        
-        # Get date/duration fields with flexible column name matching
-        planned_start = _get_string_column_value(row, ["Planned_Start", "Planned Start", "planned_start", "PlannedStart"])
-        planned_finish = _get_string_column_value(row, ["Planned_Finish", "Planned Finish", "planned_finish", "PlannedFinish"])
-        planned_duration = _get_column_value(row, ["Planned_Duration", "Planned Duration", "planned_duration", "PlannedDuration"], None)
-        if planned_duration is not None:
-            planned_duration = _clean_value(planned_duration)
-        
-        # Baseline fields - try Baseline 1 first, then fallback to Baseline
-        baseline_start = _get_string_column_value(row, [
-            "Baseline 1 Start", "Baseline_1_Start", "Baseline_Start", "Baseline Start", 
-            "baseline_start", "BaselineStart", "Baseline1Start"
-        ])
-        baseline_finish = _get_string_column_value(row, [
-            "Baseline 1 Finish", "Baseline_1_Finish", "Baseline_Finish", "Baseline Finish",
-            "baseline_finish", "BaselineFinish", "Baseline1Finish"
-        ])
-        baseline_duration = _get_column_value(row, [
-            "Baseline 1 Duration", "Baseline_1_Duration", "Baseline_Duration", "Baseline Duration",
-            "baseline_duration", "BaselineDuration", "Baseline1Duration"
-        ], None)
-        if baseline_duration is not None:
-            baseline_duration = _clean_value(baseline_duration)
-        
-        actual_start = _get_string_column_value(row, ["Actual_Start", "Actual Start", "actual_start", "ActualStart"])
-        actual_finish = _get_string_column_value(row, ["Actual_Finish", "Actual Finish", "actual_finish", "ActualFinish"])
-        remaining_duration = _get_column_value(row, ["Remaining_Duration", "Remaining Duration", "remaining_duration", "RemainingDuration"], None)
-        if remaining_duration is not None:
-            remaining_duration = _clean_value(remaining_duration)
-        
-        # Total Float with flexible naming
-        total_float_raw = _get_column_value(row, ["Total_Float", "Total Float", "total_float", "TotalFloat", "Float", "float"], 0.0)
-        total_float = float(total_float_raw) if not pd.isna(total_float_raw) else 0.0
-        
-        # Risk fields with flexible naming
-        risk_probability_raw = _get_column_value(row, [
-            "Risk Impact Probability", "Risk_Impact_Probability", "Probability_%", "Probability %", 
-            "probability", "Probability", "Risk_Probability", "Risk Probability"
-        ], 0)
-        # If value is > 1, assume it's already a percentage; if <= 1, assume it's 0-1 and convert
-        if not pd.isna(risk_probability_raw):
-            if risk_probability_raw > 1:
-                risk_probability = risk_probability_raw / 100
-            else:
-                risk_probability = risk_probability_raw
-        else:
-            risk_probability = 0
-        
-        risk_delay_impact_days = _get_column_value(row, [
-            "Risk Impact Delay", "Risk_Impact_Delay", "Delay_Impact_days", "Delay Impact days",
-            "Delay_Impact", "Delay Impact", "delay_impact_days"
-        ], 0)
-        if pd.isna(risk_delay_impact_days):
-            risk_delay_impact_days = 0
-        
-        cost_impact_of_risk = _get_column_value(row, [
-            "Risk Cost Impact", "Risk_Cost_Impact", "Cost_Impact_of_Risk", "Cost Impact of Risk",
-            "cost_impact_of_risk", "CostImpact"
-        ], None)
-        if cost_impact_of_risk is not None:
-            cost_impact_of_risk = _clean_value(cost_impact_of_risk)
-        
-        # Cost fields for Forensic Intelligence (CPI Engine)
-        planned_cost = _get_column_value(row, [
-            "Planned_Cost", "Planned Cost", "planned_cost", "PlannedCost", "Budget"
-        ], None)
-        if planned_cost is not None:
-            planned_cost = _clean_value(planned_cost)
-        
-        actual_cost_to_date = _get_column_value(row, [
-            "Actual_Cost_To_Date", "Actual Cost To Date", "actual_cost_to_date", 
-            "ActualCostToDate", "Actual Cost", "Actual_Cost"
-        ], None)
-        if actual_cost_to_date is not None:
-            actual_cost_to_date = _clean_value(actual_cost_to_date)
+        Returns:
+            Activities from this chunk that converted (and validated)
+        """
+        # Sanitize text columns in one pass (replaces a per-activity sanitize + re-validation)
+        df = self.sanitize_dataframe(df)
         
-        # Dependency fields - handle both "Predecessors" and "Predecessor_ID" formats
-        predecessors_str = _get_string_column_value(row, [
-            "Predecessors", "Predecessor_ID", "Predecessor ID", "predecessors", 
-            "Predecessor", "predecessor_id"
-        ]) or ""
-        predecessors = [p.strip() for p in str(predecessors_str).split(";") if p.strip()]
-        # Also try comma-separated
-        if not predecessors:
-            predecessors = [p.strip() for p in str(predecessors_str).split(",") if p.strip()]
+        # Whole columns as lists, walked positionally
+        values_by_field = column_lists(df, columns)
+        fields = list(values_by_field)
         
-        successors_str = _get_string_column_value(row, [
-            "Successors", "Successor_ID", "Successor ID", "successors",
-            "Successor", "successor_id"
-        ]) or ""
-        successors = [s.strip() for s in str(successors_str).split(";") if s.strip()]
-        # Also try comma-separated
-        if not successors:
-            successors = [s.strip() for s in str(successors_str).split(",") if s.strip()]
+        activities = []
+        for idx, values in enumerate(zip(*values_by_field.values()), start=row_offset + 1):
+            try:
+                activities.append(self._row_to_activity(dict(zip(fields, values)), columns, project_id))
+            except Exception as e:
+                errors.append(f"Row {idx}: {str(e)}")
         
-        on_critical_path = _parse_bool_value(_get_column_value(row, [
-            "On Critical Path", "On_Critical_Path", "on_critical_path", "OnCriticalPath",
-            "Critical Path", "critical_path", "Is_Critical", "Is Critical"
-        ], False))
+        if self.config.validate_data:
+            activities, chunk_errors = self.validate_activities(activities)
+            validation_errors.extend(chunk_errors)
         
-        # Resource fields - handle "Resource 1" format
-        resource_id = _get_string_column_value(row, [
-            "Resource 1", "Resource_1", "Resource_ID", "Resource ID", "resource_id",
-            "Resource", "resource", "ResourceID"
-        ])
-        role = _get_string_column_value(row, [
-            "Resource 1 Role", "Resource_1_Role", "Role", "role", "ResourceRole",
-            "Resource Role", "Resource_Role"
-        ])
-        fte_allocation = _get_column_value(row, [
-            "Resource 1 FTE Allocation", "Resource_1_FTE_Allocation", "FTE_Allocation", 
-            "FTE Allocation", "fte_allocation", "FTEAllocation", "FTE"
-        ], 0.0)
-        if pd.isna(fte_allocation):
-            fte_allocation = 0.0
+        return activities
+    
+    def _row_to_activity(self, row: Dict, columns: Dict[str, Optional[str]], project_id: str) -> Activity:
+        """
+        Convert one CSV row to an Activity model (reusing original logic).
         
-        resource_max_fte = _get_column_value(row, [
-            "Resource_Max_FTE", "Resource Max FTE", "resource_max_fte", "MaxFTE",
-            "Resource 1 Max FTE", "Resource_1_Max_FTE"
-        ], 1.0)
-        if pd.isna(resource_max_fte):
-            resource_max_fte = 1.0
+        Args:
+            row: Cell value per field (None for fields without a column)
+            columns: Resolved column name per field (for error messages)
+            project_id: Project ID
+        """
+        # Get required fields
+        for field, description in REQUIRED_FIELDS:
+            if row[field] is None:
+                raise ValueError(f"Required {description} column found ('{columns[field]}') but value is empty")
         
-        skill_tags = _get_string_column_value(row, [
-            "Resource_Skill_Tags", "Resource Skill Tags", "Skill_Tags", "Skill Tags",
-            "skill_tags", "Skills", "skills"
-        ])
+        # Every field arrives cleaned by column_lists
+        # (text risk probabilities are scaled here, where they raise a row error)
+        risk_probability = row["risk_probability"]
+        if isinstance(risk_probability, str):
+            risk_probability = scale_probability(risk_probability)
         
         return Activity(
-            activity_id=str(activity_id),
-            name=str(name),
-            planned_start=planned_start,
-            planned_finish=planned_finish,
-            baseline_start=baseline_start,
-            baseline_finish=baseline_finish,
-            planned_duration=planned_duration,
-            baseline_duration=baseline_duration,
-            actual_start=actual_start,
-            actual_finish=actual_finish,
-            remaining_duration=remaining_duration,
-            percent_complete=percent_complete,
-            early_start=early_start,
-            early_finish=early_finish,
-            late_start=late_start,
-            late_finish=late_finish,
-            total_float=total_float,
+            activity_id=row["activity_id"],
+            name=row["name"],
+            planned_start=row["planned_start"],
+            planned_finish=row["planned_finish"],
+            baseline_start=row["baseline_start"],
+            baseline_finish=row["baseline_finish"],
+            planned_duration=row["planned_duration"],
+            baseline_duration=row["baseline_duration"],
+            actual_start=row["actual_start"],
+            actual_finish=row["actual_finish"],
+            remaining_duration=row["remaining_duration"],
+            percent_complete=row["percent_complete"],
+            early_start=row["early_start"],
+            early_finish=row["early_finish"],
+            late_start=row["late_start"],
+            late_finish=row["late_finish"],
+            total_float=float(row["total_float"]),
             risk_probability=risk_probability,
-            risk_delay_impact_days=risk_delay_impact_days,
-            cost_impact_of_risk=cost_impact_of_risk,
-            planned_cost=planned_cost,
-            actual_cost_to_date=actual_cost_to_date,
-            predecessors=predecessors,
-            successors=successors,
-            on_critical_path=on_critical_path,
-            resource_id=resource_id,
-            role=role,
-            fte_allocation=fte_allocation,
-            resource_max_fte=resource_max_fte,
-            skill_tags=skill_tags
+            risk_delay_impact_days=row["risk_delay_impact_days"],
+            cost_impact_of_risk=row["cost_impact_of_risk"],
+            planned_cost=row["planned_cost"],
+            actual_cost_to_date=row["actual_cost_to_date"],
+            predecessors=row["predecessors"],
+            successors=row["successors"],
+            on_critical_path=row["on_critical_path"],
+            resource_id=row["resource_id"],
+            role=row["role"],
+            fte_allocation=row["fte_allocation"],
+            resource_max_fte=row["resource_max_fte"],
+            skill_tags=row["skill_tags"]
         )
-
@@ -2,10 +2,18 @@
 Connector registry for managing and discovering available connectors.
 """
 
-from typing import Dict, Optional, Type
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Type, Union
 from .base import BaseConnector, ConnectorConfig
 
 
+class ConnectorKind(str, Enum):
+    """Built-in connector types (compare equal to their plain string values)"""
+    CSV = "csv"
+    REST_API = "rest_api"
+
+
 class ConnectorRegistry:
     """
     Registry for managing connector types and instances.
@@ -16,22 +24,36 @@ class ConnectorRegistry:
     3. Discover available connectors
     """
     
-    _connector_classes: Dict[str, Type[BaseConnector]] = {}
+    # Becomes a read-only MappingProxyType once freeze() is called after registration
+    _connector_classes: Mapping[str, Type[BaseConnector]] = {}
     _connector_instances: Dict[str, BaseConnector] = {}
     
     @classmethod
-    def register(cls, connector_type: str, connector_class: Type[BaseConnector]):
+    def register(cls, connector_type: Union[str, ConnectorKind], connector_class: Type[BaseConnector]):
         """
         Register a connector class.
         
         Args:
-            connector_type: Unique identifier (e.g., "csv", "jira")
+            connector_type: Unique identifier (e.g., "csv", "jira") or ConnectorKind
             connector_class: Connector class that extends BaseConnector
+            
+        Raises:
+            ValueError: If the class does not extend BaseConnector
+            RuntimeError: If the registry has been frozen
         """
         if not issubclass(connector_class, BaseConnector):
             raise ValueError(f"{connector_class.__name__} must extend BaseConnector")
+        if isinstance(cls._connector_classes, MappingProxyType):
+            raise RuntimeError("Connector registry is frozen - register connectors before freeze()")
         
-        cls._connector_classes[connector_type] = connector_class
+        key = connector_type.value if isinstance(connector_type, ConnectorKind) else connector_type
+        cls._connector_classes[key] = connector_class
+    
+    @classmethod
+    def freeze(cls):
+        """Make the registry read-only (called once the built-in connectors are registered)"""
+        if not isinstance(cls._connector_classes, MappingProxyType):
+            cls._connector_classes = MappingProxyType(dict(cls._connector_classes))
     
     @classmethod
     def create(cls, config: ConnectorConfig) -> BaseConnector:
@@ -65,7 +87,7 @@ class ConnectorRegistry:
         return list(cls._connector_classes.keys())
     
     @classmethod
-    def get_connector_info(cls, connector_type: str) -> Optional[Dict]:
+    def get_connector_info(cls, connector_type: Union[str, ConnectorKind]) -> Optional[Dict]:
         """Get information about a connector type"""
         if connector_type not in cls._connector_classes:
             return None
@@ -73,7 +95,7 @@ class ConnectorRegistry:
         connector_class = cls._connector_classes[connector_type]
         # Try to get docstring or class attributes
         return {
-            "type": connector_type,
+            "type": connector_type.value if isinstance(connector_type, ConnectorKind) else connector_type,
             "class_name": connector_class.__name__,
             "docstring": connector_class.__doc__ or "",
         }
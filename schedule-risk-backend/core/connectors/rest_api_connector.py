@@ -7,10 +7,18 @@ for different APIs (Jira, Asana, Monday.com, etc.).
 """
 
 import httpx
+import orjson
 from typing import List, Dict, Any, Optional
 from .base import BaseConnector, ConnectorConfig, ConnectorResult
 from core.models import Activity
 
+# HTTP/2 support for httpx is optional (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class RESTAPIConnector(BaseConnector):
     """
@@ -30,6 +38,30 @@ class RESTAPIConnector(BaseConnector):
     }
     """
     
+    def __init__(self, config: ConnectorConfig):
+        super().__init__(config)
+        # Shared HTTP client (created on first request) - reuses pooled connections/TLS
+        # sessions across loads instead of a new handshake per call, and multiplexes
+        # requests over one connection where the API speaks HTTP/2
+        self._client: Optional[httpx.Client] = None
+        self._headers: Optional[Dict[str, str]] = None
+    
+    def _get_client(self) -> httpx.Client:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                timeout=30.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+    
+    def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
     def connect(self) -> bool:
         """Test connection to REST API"""
         try:
@@ -69,21 +101,22 @@ class RESTAPIConnector(BaseConnector):
             params = self.config.connection_params.get("params", {})
             
             # Make API request
-            with httpx.Client(timeout=30.0) as client:
-                if method == "GET":
-                    response = client.get(endpoint_url, headers=headers, params=params)
-                elif method == "POST":
-                    body = self.config.connection_params.get("body", {})
-                    response = client.post(endpoint_url, headers=headers, json=body, params=params)
-                else:
-                    return ConnectorResult(
-                        success=False,
-                        activities=[],
-                        errors=[f"Unsupported HTTP method: {method}"]
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
+            client = self._get_client()
+            if method == "GET":
+                response = client.get(endpoint_url, headers=headers, params=params)
+            elif method == "POST":
+                body = self.config.connection_params.get("body", {})
+                response = client.post(endpoint_url, headers=headers, json=body, params=params)
+            else:
+                return ConnectorResult(
+                    success=False,
+                    activities=[],
+                    errors=[f"Unsupported HTTP method: {method}"]
+                )
+            
+            response.raise_for_status()
+            # orjson parses large activity payloads several times faster than stdlib json
+            data = orjson.loads(response.content)
             
             # Extract activities from response
             # Support different response structures
@@ -155,9 +188,8 @@ class RESTAPIConnector(BaseConnector):
             
             headers = self._prepare_headers()
             
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(test_url, headers=headers)
-                response.raise_for_status()
+            response = self._get_client().get(test_url, headers=headers, timeout=10.0)
+            response.raise_for_status()
             
             return {
                 "success": True,
@@ -171,7 +203,10 @@ class RESTAPIConnector(BaseConnector):
             }
     
     def _prepare_headers(self) -> Dict[str, str]:
-        """Prepare HTTP headers with authentication"""
+        """Prepare HTTP headers with authentication (built once per connector)"""
+        if self._headers is not None:
+            return self._headers
+        
         headers = self.config.connection_params.get("headers", {}).copy()
         
         # Add authentication if configured
@@ -189,6 +224,7 @@ class RESTAPIConnector(BaseConnector):
                 encoded = base64.b64encode(creds.encode()).decode()
                 headers["Authorization"] = f"Basic {encoded}"
         
+        self._headers = headers
         return headers
     
     def _extract_activities_data(self, response_data: Any) -> List[Dict]:
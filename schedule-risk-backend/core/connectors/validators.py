@@ -3,12 +3,103 @@ Data validation for connector activities.
 Ensures data safety and integrity.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from core.models import Activity
 from datetime import datetime
 import re
 
 
+# OPTIMIZATION: Field tables and patterns are built once at import instead of on every
+# validate() call, and the patterns are precompiled
+ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+DATE_FIELDS = (
+    'planned_start', 'planned_finish',
+    'baseline_start', 'baseline_finish',
+    'actual_start', 'actual_finish',
+    'early_start', 'early_finish',
+    'late_start', 'late_finish'
+)
+
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+)
+
+# Exact shapes of the common YYYY-MM-DD and MM/DD/YYYY | DD/MM/YYYY formats
+ISO_DATE_PATTERN = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+SLASH_DATE_PATTERN = re.compile(r'^([0-9]{2})/([0-9]{2})/([0-9]{4})$')
+
+NUMERIC_BOUNDS = {
+    'planned_duration': (0, 10000),
+    'baseline_duration': (0, 10000),
+    'remaining_duration': (0, 10000),
+    'percent_complete': (0, 100),
+    'risk_probability': (0, 1),
+    'risk_delay_impact_days': (0, 10000),
+    'fte_allocation': (0, 100),
+    'resource_max_fte': (0, 100),
+    'total_float': (None, None),  # No bounds
+}
+
+STRING_MAX_LENGTHS = {
+    'name': 500,
+    'resource_id': 200,
+    'role': 200,
+    'skill_tags': 500,
+}
+
+SUSPICIOUS_PATTERNS = (
+    re.compile(r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|EXECUTE)\b)", re.IGNORECASE),
+    re.compile(r"(--|/\*|\*/|;|')", re.IGNORECASE),
+)
+
+
+def _is_calendar_date(year: int, month: int, day: int) -> bool:
+    try:
+        datetime(year, month, day)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _matches_date_format(date_str: str) -> bool:
+    """
+    Whether date_str parses with one of DATE_FORMATS.
+    
+    OPTIMIZATION: Cached - a schedule repeats the same few hundred dates across its
+    date fields. Misses in the common plain-date shapes are settled by one regex match
+    and a datetime() range check; only other strings go through the strptime attempts.
+    """
+    date_str = date_str.strip()
+    
+    match = ISO_DATE_PATTERN.match(date_str)
+    if match:
+        year, month, day = map(int, match.groups())
+        if _is_calendar_date(year, month, day):
+            return True
+    else:
+        match = SLASH_DATE_PATTERN.match(date_str)
+        if match:
+            first, second, year = map(int, match.groups())
+            if _is_calendar_date(year, first, second) or _is_calendar_date(year, second, first):
+                return True
+    
+    for fmt in DATE_FORMATS:
+        try:
+            datetime.strptime(date_str, fmt)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
 class ValidationError(Exception):
     """Raised when activity validation fails"""
     pass
@@ -51,37 +142,17 @@ class ActivityValidator:
         
         # Validate activity_id format (alphanumeric, dash, underscore)
         if activity.activity_id:
-            if not re.match(r'^[A-Za-z0-9_-]+$', activity.activity_id):
+            if not ID_PATTERN.match(activity.activity_id):
                 errors.append(f"activity_id '{activity.activity_id}' contains invalid characters")
         
         # Validate dates (if provided)
-        date_fields = [
-            'planned_start', 'planned_finish',
-            'baseline_start', 'baseline_finish',
-            'actual_start', 'actual_finish',
-            'early_start', 'early_finish',
-            'late_start', 'late_finish'
-        ]
-        
-        for field in date_fields:
+        for field in DATE_FIELDS:
             value = getattr(activity, field, None)
             if value and not self._is_valid_date_format(value):
                 errors.append(f"{field} has invalid date format: {value}")
         
         # Validate numeric fields
-        numeric_fields = {
-            'planned_duration': (0, 10000),
-            'baseline_duration': (0, 10000),
-            'remaining_duration': (0, 10000),
-            'percent_complete': (0, 100),
-            'risk_probability': (0, 1),
-            'risk_delay_impact_days': (0, 10000),
-            'fte_allocation': (0, 100),
-            'resource_max_fte': (0, 100),
-            'total_float': (None, None),  # No bounds
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
+        for field, (min_val, max_val) in NUMERIC_BOUNDS.items():
             value = getattr(activity, field, None)
             if value is not None:
                 try:
@@ -98,40 +169,28 @@ class ActivityValidator:
             for pred in activity.predecessors:
                 if not isinstance(pred, str):
                     errors.append(f"predecessor must be a string: {pred}")
-                elif not re.match(r'^[A-Za-z0-9_-]+$', pred):
+                elif not ID_PATTERN.match(pred):
                     errors.append(f"predecessor '{pred}' contains invalid characters")
         
         if activity.successors:
             for succ in activity.successors:
                 if not isinstance(succ, str):
                     errors.append(f"successor must be a string: {succ}")
-                elif not re.match(r'^[A-Za-z0-9_-]+$', succ):
+                elif not ID_PATTERN.match(succ):
                     errors.append(f"successor '{succ}' contains invalid characters")
         
         # Validate string lengths (prevent DoS)
-        string_fields = {
-            'name': 500,
-            'resource_id': 200,
-            'role': 200,
-            'skill_tags': 500,
-        }
-        
-        for field, max_length in string_fields.items():
+        for field, max_length in STRING_MAX_LENGTHS.items():
             value = getattr(activity, field, None)
             if value and len(str(value)) > max_length:
                 errors.append(f"{field} exceeds maximum length of {max_length}")
         
         # Check for SQL injection patterns (basic)
-        suspicious_patterns = [
-            r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|EXECUTE)\b)",
-            r"(--|/\*|\*/|;|')",
-        ]
-        
         for field in ['activity_id', 'name', 'resource_id']:
             value = getattr(activity, field, None)
             if value:
-                for pattern in suspicious_patterns:
-                    if re.search(pattern, str(value), re.IGNORECASE):
+                for pattern in SUSPICIOUS_PATTERNS:
+                    if pattern.search(str(value)):
                         errors.append(f"{field} contains suspicious SQL-like patterns")
                         break
         
@@ -148,24 +207,7 @@ class ActivityValidator:
         if not date_str or not isinstance(date_str, str):
             return False
         
-        # Common date formats
-        formats = [
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-        ]
-        
-        for fmt in formats:
-            try:
-                datetime.strptime(date_str.strip(), fmt)
-                return True
-            except ValueError:
-                continue
-        
-        return False
+        return _matches_date_format(date_str)
     
     def validate_batch(self, activities: List[Activity], max_count: Optional[int] = None) -> tuple[List[Activity], List[str]]:
         """
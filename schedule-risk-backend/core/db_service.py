@@ -7,6 +7,7 @@ from typing import List, Optional, Dict
 from datetime import date
 from .db_models import Project, Activity, AuditLog
 from .models import Activity as ActivityModel
+from .logic_version import compute_data_hash
 import json
 
 
@@ -372,6 +373,10 @@ def save_activities(db: Session, project_id: str, activities: List[ActivityModel
         # Update existing project metadata
         update_project_metadata(db, project_id, filename=filename, activity_count=len(activities), file_hash=file_hash)
     
+    # Store the data hash with the activities so cache checks can read it instead of
+    # loading and re-hashing every activity
+    _store_project_data_hash(db, project_id, compute_data_hash(activities) if activities else None)
+    
     # Delete existing activities for this project
     db.query(Activity).filter(Activity.project_id == project_id).delete()
     
@@ -412,6 +417,56 @@ def save_activities(db: Session, project_id: str, activities: List[ActivityModel
     db.commit()
 
 
+# Per-session memo of project_id -> data hash (Session.info lives for one request), so
+# the forecast/risks/anomalies cache checks in a request share a single lookup
+_SESSION_HASHES_KEY = "project_data_hashes"
+
+
+def _store_project_data_hash(db: Session, project_id: str, data_hash: Optional[str]):
+    """Set projects.data_hash (requires migrations/add_project_data_hash_column.sql)"""
+    from sqlalchemy import text
+    db.info.setdefault(_SESSION_HASHES_KEY, {})[project_id] = data_hash
+    db.execute(
+        text("UPDATE projects SET data_hash = :data_hash WHERE project_id = :project_id"),
+        {"data_hash": data_hash, "project_id": project_id}
+    )
+
+
+def get_project_data_hash(db: Session, project_id: str, activities: Optional[List[ActivityModel]] = None) -> Optional[str]:
+    """
+    Get the hash of a project's current activity data.
+    
+    Reads the hash stored by save_activities; projects saved before it was stored
+    (or through the repository layer) fall back to hashing their activities.
+    The result is memoized on the session for the rest of the request.
+    
+    Args:
+        db: Database session
+        project_id: Project ID
+        activities: The project's activities as loaded by get_activities (optional, loaded if needed)
+    
+    Returns:
+        Data hash, or None if the project has no activities
+    """
+    from sqlalchemy import text
+    hashes = db.info.setdefault(_SESSION_HASHES_KEY, {})
+    if project_id in hashes:
+        return hashes[project_id]
+    
+    data_hash = db.execute(
+        text("SELECT data_hash FROM projects WHERE project_id = :project_id"),
+        {"project_id": project_id}
+    ).scalar()
+    
+    if data_hash is None:
+        if activities is None:
+            activities = get_activities(db, project_id)
+        data_hash = compute_data_hash(activities) if activities else None
+    
+    hashes[project_id] = data_hash
+    return data_hash
+
+
 def get_activities(db: Session, project_id: str) -> List[ActivityModel]:
     """Get all activities for a project"""
     db_activities = db.query(Activity).filter(Activity.project_id == project_id).all()
@@ -471,6 +526,36 @@ def log_event_db(db: Session, project_id: str, event: str, details: Optional[Dic
     return audit_log
 
 
+def log_events_db_batch(db: Session, project_id: str, events: List[Dict]):
+    """
+    Log several events for one project to database in a single INSERT.
+    
+    Args:
+        db: Database session
+        project_id: Project ID
+        events: List of dicts with "event" and optional "details" keys
+    """
+    if not events:
+        return
+    
+    from sqlalchemy import insert
+    
+    # Ensure project exists (checked once for the whole batch)
+    if not project_exists(db, project_id):
+        create_project(db, project_id)
+    
+    rows = [
+        {
+            "project_id": project_id,
+            "event": event["event"],
+            "details": event.get("details") or {}
+        }
+        for event in events
+    ]
+    db.execute(insert(AuditLog), rows)
+    db.commit()
+
+
 def get_audit_logs(db: Session, project_id: str, limit: Optional[int] = None) -> List[Dict]:
     """Get audit logs for a project"""
     query = db.query(AuditLog).filter(AuditLog.project_id == project_id).order_by(AuditLog.timestamp.desc())
@@ -492,13 +577,34 @@ def get_audit_logs(db: Session, project_id: str, limit: Optional[int] = None) ->
 
 # ========== Delete Operations ==========
 
+# Per-project cache tables cleared before a project is deleted
+_PROJECT_CACHE_TABLES = ("analysis_cache", "project_metrics")
+
+
+def _delete_cache_entries(db: Session, condition: str, params: Dict):
+    """
+    Best-effort delete of cache rows matching condition (a WHERE clause on project_id).
+    
+    Each table is cleared in its own savepoint: a cache table that has not been migrated
+    yet only rolls back its own DELETE instead of aborting the caller's transaction.
+    """
+    from sqlalchemy import text
+    for table in _PROJECT_CACHE_TABLES:
+        try:
+            with db.begin_nested():
+                db.execute(text(f"DELETE FROM {table} WHERE {condition}"), params)
+        except Exception as e:
+            # Cache table might not exist, continue anyway
+            print(f"Warning: Could not delete {table} entries: {e}")
+
+
 def delete_project(db: Session, project_id: str, user_id: int) -> Dict:
     """
     Delete a single project and all related data.
     
     This function:
     1. Verifies project ownership
-    2. Deletes all related cache entries (forecast, risks, anomalies, metrics)
+    2. Deletes all related cache entries (analysis cache, metrics)
     3. Deletes activities (cascade will handle this, but we do it explicitly for clarity)
     4. Deletes audit logs
     5. Deletes the project itself
@@ -523,15 +629,8 @@ def delete_project(db: Session, project_id: str, user_id: int) -> Dict:
     """), {"project_id": project_id})
     activity_count = activity_count_result.scalar() or 0
     
-    # Delete cache entries (forecast, risks, anomalies, project_metrics)
-    try:
-        db.execute(text("DELETE FROM forecast_cache WHERE project_id = :project_id"), {"project_id": project_id})
-        db.execute(text("DELETE FROM risks_cache WHERE project_id = :project_id"), {"project_id": project_id})
-        db.execute(text("DELETE FROM anomalies_cache WHERE project_id = :project_id"), {"project_id": project_id})
-        db.execute(text("DELETE FROM project_metrics WHERE project_id = :project_id"), {"project_id": project_id})
-    except Exception as e:
-        # Cache tables might not exist, continue anyway
-        print(f"Warning: Could not delete cache entries: {e}")
+    # Delete cache entries (analysis cache, project_metrics)
+    _delete_cache_entries(db, "project_id = :project_id", {"project_id": project_id})
     
     # Delete activities (cascade should handle this, but explicit is clearer)
     db.execute(text("DELETE FROM activities WHERE project_id = :project_id"), {"project_id": project_id})
@@ -610,13 +709,7 @@ def delete_projects(db: Session, project_ids: List[str], user_id: int) -> Dict:
     project_count = project_count_result.scalar() or 0
     
     # Delete cache entries
-    try:
-        db.execute(text(f"DELETE FROM forecast_cache WHERE project_id IN ({placeholders})"), params)
-        db.execute(text(f"DELETE FROM risks_cache WHERE project_id IN ({placeholders})"), params)
-        db.execute(text(f"DELETE FROM anomalies_cache WHERE project_id IN ({placeholders})"), params)
-        db.execute(text(f"DELETE FROM project_metrics WHERE project_id IN ({placeholders})"), params)
-    except Exception as e:
-        print(f"Warning: Could not delete cache entries: {e}")
+    _delete_cache_entries(db, f"project_id IN ({placeholders})", params)
     
     # Delete activities
     db.execute(text(f"DELETE FROM activities WHERE project_id IN ({placeholders})"), params)
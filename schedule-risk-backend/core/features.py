@@ -3,9 +3,9 @@ Feature engineering and extraction
 """
 
 from datetime import datetime, date
-from typing import Dict, List, Optional
-import pandas as pd
+from typing import Callable, Dict, List, Optional, Union
 from .models import Activity
+from .anomalies import to_timestamp
 from .digital_twin import get_or_build_twin
 from .forensic_extractor import extract_forensic_features
 
@@ -18,12 +18,123 @@ def parse_date(date_str):
         if isinstance(date_str, str) and date_str.strip() == "":
             return None
         # Try parsing with dayfirst=True to handle DD-MM-YYYY format, fallback to default
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+        return to_timestamp(date_str)
     except:
         return None
 
 
-def compute_features(activity: Activity, project_id: str, activities: Optional[List[Activity]] = None, twin=None, reference_date: Optional[date] = None, skill_analysis: Optional[Dict] = None) -> Dict:
+def compute_float_map(activities: List[Activity], graph) -> Dict[str, float]:
+    """
+    Compute total float for every activity using the critical path method.
+    Runs one forward (ES/EF) and one backward (LS/LF) pass over the project graph,
+    so callers scoring many activities can compute it once and pass it to compute_features.
+    
+    Args:
+        activities: List of all activities in the project
+        graph: Project dependency graph (DigitalTwin.graph)
+    
+    Returns:
+        Dict mapping activity_id -> total float in days (LS - ES, clamped at 0)
+    """
+    import networkx as nx
+    # Calculate ES, EF, LS, LF for all activities
+    activity_map = {a.activity_id: a for a in activities}
+    
+    # Forward pass: calculate ES and EF
+    try:
+        topo_order = list(nx.topological_sort(graph))
+    except nx.NetworkXError:
+        # Graph has cycles, use simple heuristic
+        topo_order = list(graph.nodes())
+    
+    earliest_start = {}
+    earliest_finish = {}
+    
+    for node_id in topo_order:
+        if node_id not in activity_map:
+            continue
+        node_activity = activity_map[node_id]
+        node_duration = node_activity.planned_duration or node_activity.baseline_duration or 1.0
+        
+        # ES = max of all predecessor finishes
+        pred_finishes = []
+        for pred_id in graph.predecessors(node_id):
+            if pred_id in earliest_finish:
+                pred_finishes.append(earliest_finish[pred_id])
+        
+        if pred_finishes:
+            earliest_start[node_id] = max(pred_finishes)
+        else:
+            # No predecessors, start at 0
+            earliest_start[node_id] = 0.0
+        
+        earliest_finish[node_id] = earliest_start[node_id] + node_duration
+    
+    # Backward pass: calculate LS and LF
+    if earliest_finish:
+        project_finish = max(earliest_finish.values())
+    else:
+        project_finish = 0.0
+    
+    latest_start = {}
+    latest_finish = {}
+    
+    for node_id in reversed(topo_order):
+        if node_id not in activity_map:
+            continue
+        node_activity = activity_map[node_id]
+        node_duration = node_activity.planned_duration or node_activity.baseline_duration or 1.0
+        
+        # LF = min of all successor starts
+        succ_starts = []
+        for succ_id in graph.successors(node_id):
+            if succ_id in latest_start:
+                succ_starts.append(latest_start[succ_id])
+        
+        if succ_starts:
+            latest_finish[node_id] = min(succ_starts)
+        else:
+            # No successors, finish at project finish
+            latest_finish[node_id] = project_finish
+        
+        latest_start[node_id] = latest_finish[node_id] - node_duration
+    
+    # Float = LS - ES (or LF - EF)
+    return {
+        node_id: max(0.0, latest_start[node_id] - earliest_start[node_id])
+        for node_id in earliest_start
+        if node_id in latest_start
+    }
+
+
+def lazy_float_map(activities: List[Activity], graph) -> Callable[[], Dict[str, float]]:
+    """
+    Defer compute_float_map for a project until an activity first needs it.
+    
+    OPTIMIZATION: Callers scoring many activities pass the returned function as
+    compute_features(float_map=...): the critical path pass runs at most once, and not
+    at all when every activity has Total_Float. It runs inside compute_features' own
+    fallback handling, so a failure falls back per activity (and is retried, not cached).
+    
+    Args:
+        activities: List of all activities in the project
+        graph: Project dependency graph (DigitalTwin.graph)
+    
+    Returns:
+        Zero-argument function returning the (memoized) float map
+    """
+    float_map = None
+    
+    def get_float_map() -> Dict[str, float]:
+        nonlocal float_map
+        if float_map is None:
+            float_map = compute_float_map(activities, graph)
+        return float_map
+    
+    return get_float_map
+
+
+def compute_features(activity: Activity, project_id: str, activities: Optional[List[Activity]] = None, twin=None, reference_date: Optional[date] = None, skill_analysis: Optional[Dict] = None, float_map: Optional[Union[Dict[str, float], Callable[[], Dict[str, float]]]] = None) -> Dict:
     """
     Compute all features for an activity
     OPTIMIZED: Accepts optional twin parameter to avoid repeated lookups
@@ -35,6 +146,8 @@ def compute_features(activity: Activity, project_id: str, activities: Optional[L
         twin: Digital twin instance (optional, will be built if not provided)
         reference_date: Reference date for date-dependent calculations (defaults to today if None)
                        This allows using CSV date or custom date instead of current date.
+        float_map: Precomputed compute_float_map() result, or a lazy_float_map() function
+                   (optional, computed if needed and not provided)
     
     Returns:
         Dictionary of computed features
@@ -73,72 +186,13 @@ def compute_features(activity: Activity, project_id: str, activities: Optional[L
     elif planned_start and planned_finish and activities:
         # Compute float from graph using critical path method
         try:
-            import networkx as nx
-            # Calculate ES, EF, LS, LF for all activities
-            activity_map = {a.activity_id: a for a in activities}
-            
-            # Forward pass: calculate ES and EF
-            try:
-                topo_order = list(nx.topological_sort(graph))
-            except nx.NetworkXError:
-                # Graph has cycles, use simple heuristic
-                topo_order = list(graph.nodes())
-            
-            earliest_start = {}
-            earliest_finish = {}
-            
-            for node_id in topo_order:
-                if node_id not in activity_map:
-                    continue
-                node_activity = activity_map[node_id]
-                node_duration = node_activity.planned_duration or node_activity.baseline_duration or 1.0
-                
-                # ES = max of all predecessor finishes
-                pred_finishes = []
-                for pred_id in graph.predecessors(node_id):
-                    if pred_id in earliest_finish:
-                        pred_finishes.append(earliest_finish[pred_id])
-                
-                if pred_finishes:
-                    earliest_start[node_id] = max(pred_finishes)
-                else:
-                    # No predecessors, start at 0
-                    earliest_start[node_id] = 0.0
-                
-                earliest_finish[node_id] = earliest_start[node_id] + node_duration
-            
-            # Backward pass: calculate LS and LF
-            if earliest_finish:
-                project_finish = max(earliest_finish.values())
-            else:
-                project_finish = 0.0
-            
-            latest_start = {}
-            latest_finish = {}
-            
-            for node_id in reversed(topo_order):
-                if node_id not in activity_map:
-                    continue
-                node_activity = activity_map[node_id]
-                node_duration = node_activity.planned_duration or node_activity.baseline_duration or 1.0
-                
-                # LF = min of all successor starts
-                succ_starts = []
-                for succ_id in graph.successors(node_id):
-                    if succ_id in latest_start:
-                        succ_starts.append(latest_start[succ_id])
-                
-                if succ_starts:
-                    latest_finish[node_id] = min(succ_starts)
-                else:
-                    # No successors, finish at project finish
-                    latest_finish[node_id] = project_finish
-                
-                latest_start[node_id] = latest_finish[node_id] - node_duration
-            
-            # Calculate float for this activity: Float = LS - ES (or LF - EF)
-            if activity.activity_id in earliest_start and activity.activity_id in latest_start:
-                float_days = max(0.0, latest_start[activity.activity_id] - earliest_start[activity.activity_id])
+            # OPTIMIZATION: Reuse a project-wide float map if the caller shares one
+            if float_map is None:
+                float_map = compute_float_map(activities, graph)
+            elif callable(float_map):
+                float_map = float_map()
+            if activity.activity_id in float_map:
+                float_days = float_map[activity.activity_id]
         except Exception:
             # Fallback to simple heuristic if calculation fails
             if activity.on_critical_path:
@@ -6,7 +6,7 @@ Extracts forensic intelligence features that will shape future predictions (Mont
 from typing import Dict, List, Optional
 from datetime import date
 from .models import Activity
-import pandas as pd
+from .anomalies import to_timestamp
 
 
 def parse_date(date_str):
@@ -16,7 +16,7 @@ def parse_date(date_str):
     try:
         if isinstance(date_str, str) and date_str.strip() == "":
             return None
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+        return to_timestamp(date_str)
     except:
         return None
 
@@ -0,0 +1,30 @@
+"""
+Identifier generation
+Time-ordered UUIDs (UUIDv7, RFC 9562) for primary keys.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7: 48-bit Unix millisecond timestamp followed by random bits.
+
+    Unlike uuid4, consecutive values sort by creation time, so new keys are appended
+    to the right edge of B-tree indexes instead of landing on random pages.
+
+    Returns:
+        uuid.UUID with version 7 and RFC 4122 variant
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def new_project_id() -> str:
+    """Generate a new project ID (canonical 36-char UUIDv7 string)"""
+    return str(uuid7())
@@ -69,7 +69,7 @@ def compute_data_hash(activities: list) -> str:
         activities: List of Activity objects or dicts with activity data
         
     Returns:
-        SHA256 hash of data content (first 16 chars for compact storage)
+        16-char hex BLAKE2b digest of data content (compact storage)
     """
     import json
     from core.models import Activity as ActivityModel
@@ -133,6 +133,6 @@ def compute_data_hash(activities: list) -> str:
     # Sort all activities by ID for consistent hashing
     data_string = "|".join(sorted(data_fields))
     
-    # Compute hash
-    return hashlib.sha256(data_string.encode()).hexdigest()[:16]  # 16 chars is enough
+    # Compute hash - an 8-byte BLAKE2b digest is 16 hex chars and faster than SHA256
+    return hashlib.blake2b(data_string.encode(), digest_size=8).hexdigest()
 
@@ -6,8 +6,8 @@ import numpy as np
 import networkx as nx
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import pandas as pd
 from .models import Activity
+from .anomalies import to_timestamp
 from .digital_twin import DigitalTwin
 
 
@@ -19,7 +19,7 @@ def parse_date(date_str):
         if isinstance(date_str, str) and date_str.strip() == "":
             return None
         # Try parsing with dayfirst=True to handle DD-MM-YYYY format, fallback to default
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce')
+        return to_timestamp(date_str)
     except:
         return None
 
@@ -9,6 +9,8 @@ from starlette.responses import JSONResponse
 import time
 import logging
 from typing import Callable
+from .config import is_public_path
+from .auth import token_preview
 
 logger = logging.getLogger(__name__)
 
@@ -19,20 +21,6 @@ class AuthLoggingMiddleware(BaseHTTPMiddleware):
     Tracks API usage, response times, and authentication status.
     """
     
-    # Public endpoints that don't require authentication
-    PUBLIC_ENDPOINTS = {
-        "/api/auth/register",
-        "/api/auth/login",
-        "/api/auth/login-json",
-        "/api/llm/status",
-        "/docs",
-        "/openapi.json",
-        "/redoc",
-    }
-    
-    # Health check endpoint
-    HEALTH_ENDPOINT = "/health"
-    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
         Process request through middleware.
@@ -46,23 +34,21 @@ class AuthLoggingMiddleware(BaseHTTPMiddleware):
         
         # Check if endpoint is public
         path = request.url.path
-        is_public = any(path.startswith(public) for public in self.PUBLIC_ENDPOINTS) or path == self.HEALTH_ENDPOINT
+        is_public = is_public_path(path)
         
         # Extract authentication info
         auth_header = request.headers.get("Authorization", "")
         is_authenticated = auth_header.startswith("Bearer ")
-        token_preview = ""
-        if is_authenticated:
-            token = auth_header.replace("Bearer ", "")
-            token_preview = f"{token[:10]}..." if len(token) > 10 else token
         
-        # Log request
+        # Log request (token prefixes only at DEBUG, never built otherwise)
         logger.info(
-            f"Request: {request.method} {path} | "
-            f"Auth: {'Yes' if is_authenticated else 'No'} | "
-            f"Public: {'Yes' if is_public else 'No'} | "
-            f"Token: {token_preview}"
+            "Request: %s %s | Auth: %s | Public: %s",
+            request.method, path,
+            "Yes" if is_authenticated else "No",
+            "Yes" if is_public else "No"
         )
+        if is_authenticated and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Token: %s", token_preview(auth_header[7:]))
         
         # Process request
         try:
@@ -260,7 +260,7 @@ class HybridRiskModel:
         # Try to load ML model
         self.ml_available = self.ml_model.load()
     
-    def predict(self, features: Dict, use_ml: bool = True, fallback_to_rule: bool = True, project_features: Optional[List[Dict]] = None) -> Tuple[float, str]:
+    def predict(self, features: Dict, use_ml: bool = True, fallback_to_rule: bool = True, project_features: Optional[List[Dict]] = None, rule_score: Optional[float] = None) -> Tuple[float, str]:
         """
         Predict risk score using hybrid approach
         
@@ -269,13 +269,15 @@ class HybridRiskModel:
             use_ml: Whether to use ML model if available
             fallback_to_rule: Whether to fallback to rule-based if ML fails
             project_features: Optional list of all activity features for project-wide normalization (used by rule-based component)
+            rule_score: Optional precomputed rule-based score (e.g. from RuleBasedRiskModel.predict_batch)
         
         Returns:
             Tuple of (risk_score, method_used)
             method_used: "ml", "rule", "ensemble", or "ml_fallback"
         """
         ml_score = None
-        rule_score = self.rule_model.predict(features, project_features=project_features)
+        if rule_score is None:
+            rule_score = self.rule_model.predict(features, project_features=project_features)
         
         # Try ML prediction
         if use_ml and self.ml_available:
@@ -6,7 +6,8 @@ Collects historical project data for training ML models
 from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from .db_adapter import get_project_activities
-from .features import compute_features
+from .features import compute_features, lazy_float_map
+from .digital_twin import get_or_build_twin
 from .risk_model import RuleBasedRiskModel
 from .models import Activity as ActivityModel
 
@@ -104,11 +105,15 @@ def collect_training_data(
             if not activities:
                 continue
             
+            # Critical path float pass once per project, shared by all its activities
+            twin = get_or_build_twin(project_id, activities)
+            float_map = lazy_float_map(activities, twin.graph)
+            
             # Compute features and labels for each activity
             for activity in activities:
                 try:
                     # Compute features
-                    features = compute_features(activity, project_id, activities=activities)
+                    features = compute_features(activity, project_id, activities=activities, twin=twin, float_map=float_map)
                     
                     # Get label (risk score)
                     if use_rule_based_labels and rule_model:
@@ -2,6 +2,7 @@
 Data models and schemas
 """
 
+from collections import deque
 from pydantic import BaseModel
 from typing import List, Optional
 
@@ -48,5 +49,7 @@ PROJECTS = {}
 
 DIGITAL_TWINS = {}
 
-AUDIT_LOG = []
+# In-memory audit log is bounded - oldest entries are dropped once full
+AUDIT_LOG_MAX_ENTRIES = 100_000
+AUDIT_LOG = deque(maxlen=AUDIT_LOG_MAX_ENTRIES)
 
@@ -5,9 +5,29 @@ Optimizes portfolio screen loading by avoiding expensive recomputation
 
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, List
-from sqlalchemy import text
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from infrastructure.database.models import ProjectMetricsModel, PortfolioCacheModel
+from .cache_service import cache_table_ready
+
+# Columns read back by the getters - fetched as plain rows via Core select, skipping
+# ORM instance construction and identity-map bookkeeping for these read-only lookups
+_METRICS_COLUMNS = (
+    ProjectMetricsModel.project_id,
+    ProjectMetricsModel.risk_score,
+    ProjectMetricsModel.activity_count,
+    ProjectMetricsModel.resource_summary,
+    ProjectMetricsModel.high_risk_activities_count
+)
+_PORTFOLIO_COLUMNS = (
+    PortfolioCacheModel.total_projects,
+    PortfolioCacheModel.total_activities,
+    PortfolioCacheModel.portfolio_risk_score,
+    PortfolioCacheModel.projects_at_risk,
+    PortfolioCacheModel.high_risk_projects,
+    PortfolioCacheModel.resource_summary
+)
 
 
 def save_project_metrics(
@@ -32,36 +52,31 @@ def save_project_metrics(
         high_risk_activities_count: Count of activities with risk >= 70
     """
     
-    try:
-        # Check if table exists
-        db.execute(text("SELECT 1 FROM project_metrics LIMIT 1"))
-    except Exception:
+    if not cache_table_ready(db, "project_metrics"):
         # Table doesn't exist - skip caching (graceful degradation)
         print("[PORTFOLIO_CACHE] Project metrics table doesn't exist - skipping cache save")
         return
     
     try:
-        # Use upsert pattern
-        existing = db.query(ProjectMetricsModel).filter(
-            ProjectMetricsModel.project_id == project_id
-        ).first()
-        
-        if existing:
-            existing.risk_score = risk_score
-            existing.activity_count = activity_count
-            existing.resource_summary = resource_summary or {}
-            existing.high_risk_activities_count = high_risk_activities_count
-        else:
-            metrics = ProjectMetricsModel(
-                project_id=project_id,
-                user_id=user_id,
-                risk_score=risk_score,
-                activity_count=activity_count,
-                resource_summary=resource_summary or {},
-                high_risk_activities_count=high_risk_activities_count
-            )
-            db.add(metrics)
-        
+        # Single atomic upsert - no SELECT round-trip, no duplicate-key race between savers
+        statement = pg_insert(ProjectMetricsModel).values(
+            project_id=project_id,
+            user_id=user_id,
+            risk_score=risk_score,
+            activity_count=activity_count,
+            resource_summary=resource_summary or {},
+            high_risk_activities_count=high_risk_activities_count
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[ProjectMetricsModel.project_id],
+            set_={
+                "risk_score": statement.excluded.risk_score,
+                "activity_count": statement.excluded.activity_count,
+                "resource_summary": statement.excluded.resource_summary,
+                "high_risk_activities_count": statement.excluded.high_risk_activities_count,
+                "updated_at": func.now()
+            }
+        ))
         db.commit()
     except Exception as e:
         db.rollback()
@@ -81,8 +96,8 @@ def get_project_metrics(db: Session, project_id: str) -> Optional[Dict]:
     """
     
     try:
-        metrics = db.query(ProjectMetricsModel).filter(
-            ProjectMetricsModel.project_id == project_id
+        metrics = db.execute(
+            select(*_METRICS_COLUMNS).where(ProjectMetricsModel.project_id == project_id)
         ).first()
         
         if metrics:
@@ -113,14 +128,12 @@ def get_all_project_metrics(db: Session, user_id: int, project_ids: Optional[Lis
     """
     
     try:
-        query = db.query(ProjectMetricsModel).filter(
-            ProjectMetricsModel.user_id == user_id
-        )
+        query = select(*_METRICS_COLUMNS).where(ProjectMetricsModel.user_id == user_id)
         
         if project_ids:
-            query = query.filter(ProjectMetricsModel.project_id.in_(project_ids))
+            query = query.where(ProjectMetricsModel.project_id.in_(project_ids))
         
-        metrics_list = query.all()
+        metrics_list = db.execute(query).all()
         
         return {
             m.project_id: {
@@ -161,39 +174,34 @@ def save_portfolio_cache(
         resource_summary: Aggregated resource summary
     """
     
-    try:
-        # Check if table exists
-        db.execute(text("SELECT 1 FROM portfolio_cache LIMIT 1"))
-    except Exception:
+    if not cache_table_ready(db, "portfolio_cache"):
         # Table doesn't exist - skip caching (graceful degradation)
         print("[PORTFOLIO_CACHE] Portfolio cache table doesn't exist - skipping cache save")
         return
     
     try:
-        # Use upsert pattern
-        existing = db.query(PortfolioCacheModel).filter(
-            PortfolioCacheModel.user_id == user_id
-        ).first()
-        
-        if existing:
-            existing.total_projects = total_projects
-            existing.total_activities = total_activities
-            existing.portfolio_risk_score = portfolio_risk_score
-            existing.projects_at_risk = projects_at_risk
-            existing.high_risk_projects = high_risk_projects
-            existing.resource_summary = resource_summary
-        else:
-            cache = PortfolioCacheModel(
-                user_id=user_id,
-                total_projects=total_projects,
-                total_activities=total_activities,
-                portfolio_risk_score=portfolio_risk_score,
-                projects_at_risk=projects_at_risk,
-                high_risk_projects=high_risk_projects,
-                resource_summary=resource_summary
-            )
-            db.add(cache)
-        
+        # Single atomic upsert - no SELECT round-trip, no duplicate-key race between savers
+        statement = pg_insert(PortfolioCacheModel).values(
+            user_id=user_id,
+            total_projects=total_projects,
+            total_activities=total_activities,
+            portfolio_risk_score=portfolio_risk_score,
+            projects_at_risk=projects_at_risk,
+            high_risk_projects=high_risk_projects,
+            resource_summary=resource_summary
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[PortfolioCacheModel.user_id],
+            set_={
+                "total_projects": statement.excluded.total_projects,
+                "total_activities": statement.excluded.total_activities,
+                "portfolio_risk_score": statement.excluded.portfolio_risk_score,
+                "projects_at_risk": statement.excluded.projects_at_risk,
+                "high_risk_projects": statement.excluded.high_risk_projects,
+                "resource_summary": statement.excluded.resource_summary,
+                "updated_at": func.now()
+            }
+        ))
         db.commit()
     except Exception as e:
         db.rollback()
@@ -213,8 +221,8 @@ def get_portfolio_cache(db: Session, user_id: int) -> Optional[Dict]:
     """
     
     try:
-        cache = db.query(PortfolioCacheModel).filter(
-            PortfolioCacheModel.user_id == user_id
+        cache = db.execute(
+            select(*_PORTFOLIO_COLUMNS).where(PortfolioCacheModel.user_id == user_id)
         ).first()
         
         if cache:
@@ -5,6 +5,7 @@ Multi-dimensional risk scoring with weighted components as per specification
 
 from typing import Dict, List, Optional
 import math
+import numpy as np
 
 
 def normalize_to_0_100(value: float, min_val: float, max_val: float) -> float:
@@ -45,6 +46,17 @@ class RuleBasedRiskModel:
         "anomaly": 0.05              # Anomaly score (zombie/resource holes)
     }
     
+    # Component order used by _compute_component_scores / predict_batch
+    COMPONENTS = (
+        "schedule_delay",
+        "progress_slip",
+        "risk_register",
+        "float_criticality",
+        "dependency",
+        "resource_overload",
+        "anomaly",
+    )
+    
     def _compute_schedule_delay_score(self, f: Dict) -> float:
         """Compute schedule delay component (0-100)"""
         delay_days = f.get("delay_baseline_days", 0.0)
@@ -242,6 +254,53 @@ class RuleBasedRiskModel:
         # Ensure result is in 0-100 range
         return max(0.0, min(100.0, overall_score))
     
+    def _compute_component_scores(self, f: Dict) -> List[float]:
+        """Compute all raw component scores (0-100), ordered as in COMPONENTS"""
+        return [
+            self._compute_schedule_delay_score(f),
+            self._compute_progress_slip_score(f),
+            self._compute_risk_register_score(f),
+            self._compute_float_criticality_score(f),
+            self._compute_dependency_score(f),
+            self._compute_resource_overload_score(f),
+            self._compute_anomaly_score(f),
+        ]
+    
+    def predict_batch(self, project_features: List[Dict]) -> List[float]:
+        """
+        Predict risk scores for every activity of a project at once.
+        
+        Equivalent to calling predict(f, project_features=project_features) for each f,
+        but component scores are computed once per activity and normalized column-wise
+        with NumPy, making it O(N) instead of O(N^2).
+        
+        Args:
+            project_features: List of feature dicts for all activities in the project
+        
+        Returns:
+            List of overall risk scores (0-100), in the same order as project_features
+        """
+        if not project_features:
+            return []
+        
+        # (N, 7) matrix of raw component scores
+        scores = np.array([self._compute_component_scores(f) for f in project_features], dtype=float)
+        
+        # Min-max normalize each component across the project (same rule as predict)
+        if len(project_features) > 1:
+            mins = scores.min(axis=0)
+            ranges = scores.max(axis=0) - mins
+            safe_ranges = np.where(ranges == 0, 1.0, ranges)
+            scores = np.where(ranges == 0, 0.0, (scores - mins) / safe_ranges) * 100.0
+        
+        # Weighted sum per SPEC, accumulated in the same order as predict
+        overall = np.zeros(len(project_features))
+        for i, component in enumerate(self.COMPONENTS):
+            overall = overall + self.WEIGHTS[component] * (scores[:, i] / 100.0)
+        overall = overall * 100.0
+        
+        return np.clip(overall, 0.0, 100.0).tolist()
+    
     def get_risk_factors(self, f: Dict) -> Dict[str, str]:
         """
         Get human-readable risk factors for an activity
@@ -6,7 +6,7 @@ from typing import List, Dict, Optional
 from datetime import date
 from sqlalchemy.orm import Session
 from .models import Activity as ActivityModel
-from .features import compute_features
+from .features import compute_features, lazy_float_map
 from .risk_model import RuleBasedRiskModel
 from .db_adapter import get_project_activities
 from .config import USE_ML_MODEL, ML_MODEL_PATH, ML_ENSEMBLE_WEIGHT, ML_FALLBACK_TO_RULE_BASED
@@ -97,6 +97,9 @@ def compute_project_risks(
     should_use_ml = use_ml if use_ml is not None else USE_ML_MODEL
     model = _get_risk_model() if should_use_ml else RuleBasedRiskModel()
     
+    # OPTIMIZATION: Run the critical path float pass at most once for the whole project
+    float_map = lazy_float_map(activities, twin.graph)
+    
     # PER SPEC: Compute all features first for project-wide normalization
     # Include skill_analysis for forensic features
     all_features = []
@@ -107,7 +110,8 @@ def compute_project_risks(
             activities=activities, 
             twin=twin, 
             reference_date=reference_date,
-            skill_analysis=skill_analysis
+            skill_analysis=skill_analysis,
+            float_map=float_map
         )
         all_features.append(features)
     
@@ -123,9 +127,12 @@ def compute_project_risks(
     risks = []
     
     # OPTIMIZATION: Pre-compute rule model if needed (avoid creating multiple instances)
-    rule_model = None
-    if hasattr(model, 'is_ml_available') and callable(getattr(model, 'is_ml_available', None)):
-        rule_model = RuleBasedRiskModel()
+    is_hybrid = hasattr(model, 'is_ml_available') and callable(getattr(model, 'is_ml_available', None))
+    rule_model = RuleBasedRiskModel() if is_hybrid else model
+    
+    # OPTIMIZATION: Score all activities in one vectorized pass with project-wide
+    # normalization (per spec) instead of re-normalizing the whole project per activity
+    rule_scores = rule_model.predict_batch(all_features)
     
     # Compute risk scores with project-wide normalization (per spec)
     for i, activity in enumerate(activities):
@@ -133,23 +140,22 @@ def compute_project_risks(
         
         # Compute risk score
         # Check if model has predict method that returns tuple (hybrid model)
-        if hasattr(model, 'is_ml_available') and callable(getattr(model, 'is_ml_available', None)):
-            # Use hybrid model with project-wide normalization
+        if is_hybrid:
+            # Use hybrid model with precomputed project-wide rule score
             risk_score, method_used = model.predict(
                 features,
                 use_ml=should_use_ml,
                 fallback_to_rule=ML_FALLBACK_TO_RULE_BASED,
-                project_features=all_features
+                project_features=all_features,
+                rule_score=rule_scores[i]
             )
             # Get risk factors from rule-based component (reuse instance)
-            if rule_model is None:
-                rule_model = RuleBasedRiskModel()
             risk_factors = rule_model.get_risk_factors(features)
             # Add method info
             risk_factors["prediction_method"] = method_used
         else:
             # Use rule-based model with project-wide normalization (per spec)
-            risk_score = model.predict(features, project_features=all_features)
+            risk_score = rule_scores[i]
             risk_factors = model.get_risk_factors(features)
             risk_factors["prediction_method"] = "rule"
         
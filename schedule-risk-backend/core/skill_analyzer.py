@@ -6,7 +6,7 @@ Detects skill bottlenecks that generic FTE counts miss
 from typing import List, Dict, Optional
 from datetime import datetime, date
 from .models import Activity
-import pandas as pd
+from .anomalies import to_timestamp
 
 
 def parse_skill_tags(skill_tags_str: Optional[str]) -> List[str]:
@@ -165,6 +165,6 @@ def _parse_date(date_str):
     if not date_str:
         return None
     try:
-        return pd.to_datetime(date_str, dayfirst=True, errors='coerce').date()
+        return to_timestamp(date_str).date()
     except:
         return None
@@ -13,6 +13,13 @@ import hmac
 import hashlib
 import time
 
+# HTTP/2 support for httpx is optional (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class WebhookType(Enum):
     """Supported webhook types"""
@@ -202,6 +209,25 @@ class WebhookService:
             WebhookType.JIRA: JiraWebhookFormatter(),
             WebhookType.GENERIC: GenericWebhookFormatter()
         }
+        # Shared HTTP client (created on first send) - reuses connections/TLS sessions
+        # across webhook calls instead of a new handshake per dispatch
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def register_formatter(self, webhook_type: WebhookType, formatter: WebhookFormatter):
         """Register a new webhook formatter (SOLID: Open/Closed)"""
@@ -233,9 +259,8 @@ class WebhookService:
                 headers["X-Webhook-Signature"] = signature
             
             # Send webhook
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(webhook_url, json=payload, headers=headers)
-                response.raise_for_status()
+            response = await self._get_client().post(webhook_url, json=payload, headers=headers)
+            response.raise_for_status()
             
             return True
         except Exception as e:
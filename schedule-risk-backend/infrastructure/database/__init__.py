@@ -6,7 +6,9 @@ from .connection import (
     DatabaseManager,
     get_database_manager,
     get_db,
-    init_db
+    init_db,
+    unit_of_work,
+    commit_or_flush
 )
 from . import models
 
@@ -16,5 +18,7 @@ __all__ = [
     "get_database_manager",
     "get_db",
     "init_db",
+    "unit_of_work",
+    "commit_or_flush",
     "models"
 ]
@@ -2,7 +2,7 @@
 SQLAlchemy ORM models - Infrastructure layer
 Maps database tables to domain entities
 """
-from sqlalchemy import Column, String, Float, Integer, Boolean, Text, DateTime, Date, ForeignKey, JSON
+from sqlalchemy import Column, String, Float, Integer, Boolean, Text, DateTime, Date, ForeignKey, JSON, Computed, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -39,6 +39,7 @@ class ProjectModel(Base):
     filename = Column(String, nullable=True)
     activity_count = Column(Integer, default=0)
     file_hash = Column(String(64), nullable=True, index=True)  # SHA256 hash for duplicate detection
+    data_hash = Column(String(16), nullable=True)  # compute_data_hash of current activities (NULL = not stored)
     analysis_date_mode = Column(String(20), default='today')  # 'today' or 'csv_date'
     csv_reference_date = Column(Date, nullable=True)  # Auto-detected date from CSV
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -103,48 +104,18 @@ class AuditLogModel(Base):
 
 
 # Cache models
-class ForecastCacheModel(Base):
-    """Forecast cache model"""
-    __tablename__ = "forecast_cache"
+class AnalysisCacheModel(Base):
+    """Analysis cache model - one row per project with forecast, risks and anomalies"""
+    __tablename__ = "analysis_cache"
     
     project_id = Column(String, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True, index=True)
-    p50 = Column(Float, nullable=False)
-    p80 = Column(Float, nullable=False)
-    p90 = Column(Float, nullable=True)
-    p95 = Column(Float, nullable=True)
-    current = Column(Float, nullable=True)
-    criticality_indices = Column(JSON, nullable=True)
     activity_count = Column(Integer, nullable=False)
     data_hash = Column(String(16), nullable=True)
-    logic_version = Column(String(16), nullable=True)
-    computed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-
-
-class RisksCacheModel(Base):
-    """Risks cache model"""
-    __tablename__ = "risks_cache"
-    
-    project_id = Column(String, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True, index=True)
-    total_risks = Column(Integer, nullable=False)
-    top_risks = Column(JSON, nullable=False)
-    activity_count = Column(Integer, nullable=False)
-    data_hash = Column(String(16), nullable=True)
-    logic_version = Column(String(16), nullable=True)
-    computed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-
-
-class AnomaliesCacheModel(Base):
-    """Anomalies cache model"""
-    __tablename__ = "anomalies_cache"
-    
-    project_id = Column(String, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True, index=True)
-    zombie_tasks = Column(JSON, nullable=False)
-    black_holes = Column(JSON, nullable=False)
-    total_anomalies = Column(Integer, nullable=False)
-    activity_count = Column(Integer, nullable=False)
-    data_hash = Column(String(16), nullable=True)
-    logic_version = Column(String(16), nullable=True)
-    computed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    forecast = Column(JSON, nullable=True)
+    risks = Column(JSON, nullable=True)
+    anomalies = Column(JSON, nullable=True)
+    prediction_method = Column(String, nullable=True)  # Method of the cached risks ("rule", "ml", ...)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
 
 # Portfolio cache models
@@ -313,6 +284,8 @@ class WebhookConfigurationModel(Base):
     
     # Trigger configuration (JSON)
     triggers = Column(JSON, nullable=False)  # {risk_alert: bool, daily_digest: bool, anomaly: bool}
+    # Generated from triggers so risk-alert fan-out can use an index instead of JSON extraction
+    risk_alert_enabled = Column(Boolean, Computed("((triggers->>'risk_alert')::boolean)", persisted=True))
     risk_threshold = Column(Float, default=70.0)  # Trigger if risk >= this
     
     # Payload customization (JSON)
@@ -328,6 +301,15 @@ class WebhookConfigurationModel(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        Index(
+            "ix_webhook_user_alert_threshold",
+            "user_id", "risk_threshold",
+            postgresql_where=text("enabled AND risk_alert_enabled")
+        ),
+        Index("ix_webhook_user_enabled", "user_id", postgresql_where=text("enabled")),
+    )
 
 
 # UX Enhancement Models - Priority 8: User Feedback
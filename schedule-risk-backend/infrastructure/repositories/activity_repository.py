@@ -2,12 +2,14 @@
 Activity repository implementation
 Implements IActivityRepository interface
 """
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from typing import List
 import json
 from domain.interfaces import IActivityRepository
 from domain.entities import Activity
-from infrastructure.database.models import ActivityModel
+from infrastructure.database.models import ActivityModel, ProjectModel
+from infrastructure.database.connection import commit_or_flush
 
 
 class ActivityRepository(IActivityRepository):
@@ -23,34 +25,45 @@ class ActivityRepository(IActivityRepository):
             ActivityModel.project_id == project_id
         ).delete()
         
-        # Insert new activities
-        for activity in activities:
-            db_activity = ActivityModel(
-                project_id=project_id,
-                activity_id=activity.activity_id,
-                name=activity.name,
-                planned_start=activity.planned_start,
-                planned_finish=activity.planned_finish,
-                baseline_start=activity.baseline_start,
-                baseline_finish=activity.baseline_finish,
-                planned_duration=activity.planned_duration,
-                baseline_duration=activity.baseline_duration,
-                actual_start=activity.actual_start,
-                actual_finish=activity.actual_finish,
-                remaining_duration=activity.remaining_duration,
-                percent_complete=activity.percent_complete,
-                risk_probability=activity.risk_probability,
-                risk_delay_impact_days=activity.risk_delay_impact_days,
-                predecessors=json.dumps(activity.predecessors) if activity.predecessors else None,
-                successors=json.dumps(activity.successors) if activity.successors else None,
-                on_critical_path=activity.on_critical_path,
-                resource_id=activity.resource_id,
-                fte_allocation=activity.fte_allocation,
-                resource_max_fte=activity.resource_max_fte
-            )
-            self.db.add(db_activity)
+        # OPTIMIZATION: Insert new activities with one executemany INSERT
+        # instead of adding an ORM instance per row
+        rows = [
+            {
+                "project_id": project_id,
+                "activity_id": activity.activity_id,
+                "name": activity.name,
+                "planned_start": activity.planned_start,
+                "planned_finish": activity.planned_finish,
+                "baseline_start": activity.baseline_start,
+                "baseline_finish": activity.baseline_finish,
+                "planned_duration": activity.planned_duration,
+                "baseline_duration": activity.baseline_duration,
+                "actual_start": activity.actual_start,
+                "actual_finish": activity.actual_finish,
+                "remaining_duration": activity.remaining_duration,
+                "percent_complete": activity.percent_complete,
+                "risk_probability": activity.risk_probability,
+                "risk_delay_impact_days": activity.risk_delay_impact_days,
+                "predecessors": json.dumps(activity.predecessors) if activity.predecessors else None,
+                "successors": json.dumps(activity.successors) if activity.successors else None,
+                "on_critical_path": activity.on_critical_path,
+                "resource_id": activity.resource_id,
+                "fte_allocation": activity.fte_allocation,
+                "resource_max_fte": activity.resource_max_fte
+            }
+            for activity in activities
+        ]
+        if rows:
+            self.db.execute(insert(ActivityModel), rows)
         
-        self.db.commit()
+        # Activities changed - clear the stored data hash so cache checks re-hash them
+        self.db.execute(
+            update(ProjectModel).where(ProjectModel.project_id == project_id).values(data_hash=None)
+        )
+        # Also drop core.db_service's per-session hash memo for this project
+        self.db.info.get("project_data_hashes", {}).pop(project_id, None)
+        
+        commit_or_flush(self.db)
     
     def get_by_project_id(self, project_id: str) -> List[Activity]:
         """Get all activities for a project"""
@@ -7,6 +7,7 @@ from typing import List, Optional
 from domain.interfaces import IAuditLogRepository
 from domain.entities import AuditLog
 from infrastructure.database.models import AuditLogModel
+from infrastructure.database.connection import commit_or_flush
 
 
 class AuditLogRepository(IAuditLogRepository):
@@ -23,7 +24,7 @@ class AuditLogRepository(IAuditLogRepository):
             details=audit_log.details or {}
         )
         self.db.add(db_log)
-        self.db.commit()
+        commit_or_flush(self.db)
         self.db.refresh(db_log)
         return self._to_domain(db_log)
     
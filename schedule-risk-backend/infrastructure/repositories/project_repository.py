@@ -7,6 +7,7 @@ from typing import List, Optional
 from domain.interfaces import IProjectRepository
 from domain.entities import Project
 from infrastructure.database.models import ProjectModel
+from infrastructure.database.connection import commit_or_flush
 
 
 class ProjectRepository(IProjectRepository):
@@ -24,7 +25,7 @@ class ProjectRepository(IProjectRepository):
             activity_count=project.activity_count
         )
         self.db.add(db_project)
-        self.db.commit()
+        commit_or_flush(self.db)
         self.db.refresh(db_project)
         return self._to_domain(db_project)
     
@@ -56,7 +57,7 @@ class ProjectRepository(IProjectRepository):
         if db_project:
             db_project.filename = project.filename
             db_project.activity_count = project.activity_count
-            self.db.commit()
+            commit_or_flush(self.db)
             self.db.refresh(db_project)
             return self._to_domain(db_project)
         return project
@@ -7,6 +7,7 @@ from typing import Optional
 from domain.interfaces import IUserRepository
 from domain.entities import User
 from infrastructure.database.models import UserModel
+from infrastructure.database.connection import commit_or_flush
 
 
 class UserRepository(IUserRepository):
@@ -24,7 +25,7 @@ class UserRepository(IUserRepository):
             is_active=user.is_active
         )
         self.db.add(db_user)
-        self.db.commit()
+        commit_or_flush(self.db)
         self.db.refresh(db_user)
         return self._to_domain(db_user)
     
@@ -12,6 +12,7 @@ from framework.bootstrap import bootstrap_container
 from infrastructure.database.connection import init_db
 from core.middleware import AuthLoggingMiddleware
 from core.config import CORS_ORIGINS, ENABLE_REQUEST_LOGGING
+from core.webhook_service import get_webhook_service
 
 # Load environment variables from .env file
 load_dotenv()
@@ -55,6 +56,12 @@ async def startup_event():
         print(f"⚠ Database initialization warning: {e}")
         print("⚠ Make sure PostgreSQL is running and DATABASE_URL is set correctly")
 
+# Release shared outbound HTTP connections on shutdown
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared webhook HTTP client"""
+    await get_webhook_service().aclose()
+
 # Health check endpoint (public, no auth required)
 @app.get("/health")
 def health_check():
@@ -0,0 +1,32 @@
+-- Migration: Replace forecast_cache, risks_cache and anomalies_cache with one analysis_cache table
+-- One row per project holds all three results, so reads are a single primary-key lookup
+-- and invalidating a project is a single DELETE instead of three.
+--
+-- Cached results are recomputed on demand, so the old tables are dropped rather than copied.
+--
+-- Run this migration with:
+-- psql -U your_username -d your_database_name -f schedule-risk-backend/migrations/add_analysis_cache_table.sql
+
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    project_id VARCHAR PRIMARY KEY,
+    activity_count INTEGER NOT NULL,
+    data_hash VARCHAR(16),
+    forecast JSONB,
+    risks JSONB,
+    anomalies JSONB,
+    prediction_method VARCHAR,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (project_id) REFERENCES projects(project_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_updated_at ON analysis_cache(updated_at);
+
+DROP TABLE IF EXISTS forecast_cache;
+DROP TABLE IF EXISTS risks_cache;
+DROP TABLE IF EXISTS anomalies_cache;
+
+-- Comments for documentation
+COMMENT ON TABLE analysis_cache IS 'Caches forecast, risk and anomaly results per project to avoid expensive recomputation';
+COMMENT ON COLUMN analysis_cache.activity_count IS 'Number of activities when computed - used for cache invalidation';
+COMMENT ON COLUMN analysis_cache.data_hash IS 'Hash of activity data when computed - used for automatic cache invalidation on CSV data changes';
+COMMENT ON COLUMN analysis_cache.prediction_method IS 'Prediction method of the cached risks - invalidated when USE_ML_MODEL changes';
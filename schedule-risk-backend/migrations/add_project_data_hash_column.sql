@@ -0,0 +1,13 @@
+-- Migration: Add data_hash column to projects
+-- save_activities stores the hash of the project's activity data here, so cache
+-- validation reads one column instead of loading and re-hashing every activity.
+-- Required: ProjectModel maps this column, so project queries fail without it.
+-- Existing projects keep NULL and fall back to hashing until their next upload.
+--
+-- Run this migration with:
+-- psql -U your_username -d your_database_name -f schedule-risk-backend/migrations/add_project_data_hash_column.sql
+
+ALTER TABLE projects
+ADD COLUMN IF NOT EXISTS data_hash VARCHAR(16);
+
+COMMENT ON COLUMN projects.data_hash IS 'Hash of current activity data (compute_data_hash) - compared against analysis_cache.data_hash';
@@ -0,0 +1,13 @@
+-- Migration: Replace risk-alert webhook index with one matching the full lookup predicate
+-- trigger_webhooks_for_risk_alert filters on user_id, enabled, risk_alert_enabled and
+-- risk_threshold <= score in SQL; the partial index covers the boolean flags and the
+-- (user_id, risk_threshold) columns serve the equality + range part.
+--
+-- Run this migration after add_webhook_risk_alert_column.sql with:
+-- psql -U your_username -d your_database_name -f schedule-risk-backend/migrations/add_webhook_alert_threshold_index.sql
+
+DROP INDEX IF EXISTS ix_webhook_user_alert;
+
+CREATE INDEX IF NOT EXISTS ix_webhook_user_alert_threshold
+ON webhook_configurations(user_id, risk_threshold)
+WHERE enabled AND risk_alert_enabled;
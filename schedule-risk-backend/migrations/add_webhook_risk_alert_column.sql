@@ -0,0 +1,18 @@
+-- Migration: Add generated risk_alert_enabled column to webhook_configurations
+-- Risk-alert fan-out previously filtered on triggers->>'risk_alert' for every row;
+-- a stored generated column lets the lookup use a (partial) btree index instead.
+--
+-- Run this migration with:
+-- psql -U your_username -d your_database_name -f schedule-risk-backend/migrations/add_webhook_risk_alert_column.sql
+
+-- Add generated column (kept in sync with triggers automatically)
+ALTER TABLE webhook_configurations
+ADD COLUMN IF NOT EXISTS risk_alert_enabled BOOLEAN
+GENERATED ALWAYS AS ((triggers->>'risk_alert')::boolean) STORED;
+
+-- Index matching the trigger_webhooks_for_risk_alert lookup
+CREATE INDEX IF NOT EXISTS ix_webhook_user_alert
+ON webhook_configurations(user_id, enabled, risk_alert_enabled)
+WHERE enabled AND risk_alert_enabled;
+
+COMMENT ON COLUMN webhook_configurations.risk_alert_enabled IS 'Generated from triggers->>''risk_alert'' - used to index risk-alert webhook lookups';
@@ -0,0 +1,13 @@
+-- Migration: Index enabled webhooks per user; drop redundant user_preferences index
+-- Webhook endpoints filter on user_id (plus enabled for dispatch); the partial index
+-- keeps those lookups small. user_preferences.user_id is already covered by the
+-- unique index behind its UNIQUE constraint, so the extra plain index only costs writes.
+--
+-- CONCURRENTLY cannot run inside a transaction block - run this file without -1/--single-transaction:
+-- psql -U your_username -d your_database_name -f schedule-risk-backend/migrations/add_webhook_user_enabled_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_webhook_user_enabled
+ON webhook_configurations(user_id)
+WHERE enabled;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_preferences_user_id;
@@ -0,0 +1,79 @@
+"""
+Unit tests for anomaly detection
+Tests: Black hole (resource overload) sweep with non-finite FTE allocations
+"""
+
+import math
+from core.anomalies import detect_black_holes
+from core.models import Activity
+
+
+def _activity(activity_id, fte, start, finish, critical=True):
+    """Activity on resource R001 (max 1.0 FTE) with only the fields the sweep reads"""
+    return Activity(
+        activity_id=activity_id,
+        name=f"Task {activity_id}",
+        planned_start=start,
+        planned_finish=finish,
+        baseline_start=None,
+        baseline_finish=None,
+        planned_duration=None,
+        baseline_duration=None,
+        actual_start=None,
+        actual_finish=None,
+        remaining_duration=None,
+        percent_complete=0.0,
+        risk_probability=0.0,
+        risk_delay_impact_days=0.0,
+        resource_id="R001",
+        fte_allocation=fte,
+        resource_max_fte=1.0,
+        on_critical_path=critical
+    )
+
+
+def _later_overload(first_fte):
+    """A task with first_fte in early January, then two full-time critical tasks later"""
+    return [
+        _activity("A-001", first_fte, "01-01-2026", "05-01-2026"),
+        _activity("A-002", 1.0, "10-01-2026", "20-01-2026"),
+        _activity("A-003", 1.0, "10-01-2026", "20-01-2026")
+    ]
+
+
+class TestBlackHoleNonFiniteFTE:
+    """A non-finite FTE only affects the intervals its activity covers"""
+
+    def test_finite_overload(self):
+        """Test overlaps use inclusive bounds, so the shared 05-10 interval sums all three"""
+        result = detect_black_holes("test", activities=_later_overload(0.5))
+
+        assert len(result) == 1
+        assert result[0]["max_overlap_fte"] == 2.5
+        assert result[0]["max_overlap_period"] == ("05-01-2026", "10-01-2026")
+        assert len(result[0]["critical_overlaps"]) == 2
+
+    def test_nan_fte_does_not_hide_later_overload(self):
+        """Test a NaN allocation that has ended does not mask a later overload"""
+        result = detect_black_holes("test", activities=_later_overload(math.nan))
+
+        assert len(result) == 1
+        assert result[0]["max_overlap_fte"] == 2.0
+        assert result[0]["max_overlap_period"] == ("10-01-2026", "20-01-2026")
+        overlaps = result[0]["critical_overlaps"]
+        assert [o["period"] for o in overlaps] == [("10-01-2026", "20-01-2026")]
+        assert overlaps[0]["total_fte"] == 2.0
+
+    def test_inf_fte_keeps_later_critical_overlap(self):
+        """Test an infinite allocation that has ended leaves later totals finite"""
+        result = detect_black_holes("test", activities=_later_overload(math.inf))
+
+        assert len(result) == 1
+        assert result[0]["max_overlap_fte"] == math.inf
+        overlaps = result[0]["critical_overlaps"]
+        assert [o["period"] for o in overlaps] == [
+            ("01-01-2026", "05-01-2026"),
+            ("05-01-2026", "10-01-2026"),
+            ("10-01-2026", "20-01-2026")
+        ]
+        assert overlaps[-1]["total_fte"] == 2.0
@@ -0,0 +1,62 @@
+"""
+Unit tests for Rule-Based Risk Model
+Tests: Batch scoring equivalence with per-activity prediction
+"""
+
+import pytest
+from core.risk_model import RuleBasedRiskModel
+
+
+def _features(delay, slip, float_score, critical, fte_ratio, zombie=0.0):
+    return {
+        "delay_baseline_days": delay,
+        "progress_slip": slip,
+        "float_score": float_score,
+        "is_on_critical_path": critical,
+        "risk_probability": 0.3,
+        "risk_delay_impact_days": 5.0,
+        "expected_delay_days": 1.5,
+        "predecessor_count": 2,
+        "successor_count": 4,
+        "downstream_critical_depth": 1,
+        "fte_ratio": fte_ratio,
+        "zombie_task_flag": zombie,
+    }
+
+
+class TestPredictBatch:
+    """Tests for vectorized project-wide scoring"""
+
+    def test_matches_predict_with_project_normalization(self):
+        """Batch scores equal predict(f, project_features) for every activity"""
+        model = RuleBasedRiskModel()
+        project_features = [
+            _features(0.0, 0.0, 0.0, False, 0.5),
+            _features(12.0, 0.4, 1.0, True, 1.3, zombie=1.0),
+            _features(3.0, 0.1, 0.6, True, 0.95),
+            _features(40.0, 0.9, 0.2, False, 0.8),
+        ]
+
+        batch_scores = model.predict_batch(project_features)
+
+        assert len(batch_scores) == len(project_features)
+        for f, score in zip(project_features, batch_scores):
+            assert score == pytest.approx(model.predict(f, project_features=project_features))
+
+    def test_single_activity_not_normalized(self):
+        """A single activity is scored without project-wide normalization"""
+        model = RuleBasedRiskModel()
+        f = _features(10.0, 0.3, 0.8, True, 1.1)
+
+        assert model.predict_batch([f]) == [pytest.approx(model.predict(f))]
+
+    def test_identical_features_score_zero(self):
+        """Components with no spread across the project contribute nothing"""
+        model = RuleBasedRiskModel()
+        f = _features(10.0, 0.3, 0.8, True, 1.1)
+
+        assert model.predict_batch([f, dict(f)]) == [0.0, 0.0]
+
+    def test_empty(self):
+        """Empty project yields no scores"""
+        assert RuleBasedRiskModel().predict_batch([]) == []
@@ -0,0 +1,56 @@
+"""
+Unit tests for the in-process TTL cache
+Tests: Expiry, LRU eviction, invalidation
+"""
+
+import time
+from core.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache"""
+
+    def test_get_set(self):
+        """Values round-trip and missing keys return the default"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("b", 0) == 0
+        assert "a" in cache
+
+    def test_expiry(self):
+        """Entries expire after their TTL"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_delete_and_clear(self):
+        """Entries can be invalidated individually or all at once"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0